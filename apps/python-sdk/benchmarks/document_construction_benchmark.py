@@ -0,0 +1,80 @@
+"""
+Compare building crawl results with and without validation.
+
+Builds a CrawlStatusResponse from a crawl status payload with a validating
+client and with a client created with validate_responses=False, and reports the
+time each takes. Reading every document's nested models afterwards shows the
+cost of the lazy validation.
+
+    python benchmarks/document_construction_benchmark.py --documents 10000
+"""
+import argparse
+import copy
+import random
+import string
+import time
+
+from firecrawl import FirecrawlApp
+from firecrawl.firecrawl import CrawlStatusResponse
+
+
+def make_payload(documents: int, links: int, rng: random.Random) -> dict:
+    """A completed crawl status with documents shaped like the API's."""
+    def words(count: int) -> str:
+        return ' '.join(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(count))
+
+    data = []
+    for i in range(documents):
+        url = f'https://example.com/docs/{i}'
+        data.append({
+            'markdown': words(300),
+            'links': [f'https://example.com/docs/{rng.randint(0, 10000)}' for _ in range(links)],
+            'metadata': {
+                'title': words(6), 'description': words(20), 'language': 'en', 'sourceURL': url,
+                'url': url, 'statusCode': 200, 'contentType': 'text/html; charset=utf-8',
+                'ogTitle': words(6), 'ogImage': f'https://example.com/img/{i}.png', 'scrapeId': f'{i:032x}',
+            },
+            'actions': {'screenshots': [f'https://example.com/shots/{i}.png'], 'pdfs': []},
+            'changeTracking': {'previousScrapeAt': '2025-01-01T00:00:00Z', 'changeStatus': 'same', 'visibility': 'visible'},
+        })
+    return {
+        'success': True, 'status': 'completed', 'completed': documents, 'total': documents,
+        'creditsUsed': documents, 'expiresAt': '2025-01-01T00:00:00Z', 'data': data,
+    }
+
+
+def measure(app: FirecrawlApp, payload: dict, repeat: int) -> tuple:
+    build = access = float('inf')
+    for _ in range(repeat):
+        status_data = copy.copy(payload)
+        start = time.perf_counter()
+        response = app._build_status_response(CrawlStatusResponse, status_data)
+        built = time.perf_counter()
+        for document in response.data:
+            document.actions
+            document.changeTracking
+        build = min(build, built - start)
+        access = min(access, time.perf_counter() - built)
+    return build, access
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=10000)
+    parser.add_argument('--links', type=int, default=50, help='Links per document')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_payload(args.documents, args.links, random.Random(0))
+    print(f'{args.documents} documents, {args.links} links each')
+    print(f"{'mode':<12}{'build ms':>10}{'nested ms':>11}{'speedup':>9}")
+    baseline = None
+    for name, validate in (('validated', True), ('trusted', False)):
+        app = FirecrawlApp(api_key='benchmark', api_url='http://localhost:3002', validate_responses=validate)
+        build, access = measure(app, payload, args.repeat)
+        baseline = baseline or build
+        print(f'{name:<12}{build * 1000:>10.0f}{access * 1000:>11.0f}{baseline / build:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Compare the JSON codecs on crawl result pages.
+
+Decodes and encodes crawl status pages with every installed codec and reports the
+throughput of each. By default the pages are generated to look like real crawl
+results; pass --payload with saved `GET /v1/crawl/{id}` responses to use recorded
+pages instead.
+
+    pip install 'firecrawl-py[fast-json]' msgspec
+    python benchmarks/json_codec_benchmark.py --pages 20
+    python benchmarks/json_codec_benchmark.py --payload page-1.json page-2.json
+"""
+import argparse
+import json
+import random
+import string
+import time
+
+from firecrawl import JSONCodec, MsgspecCodec, OrjsonCodec
+
+
+def make_page(documents: int, rng: random.Random) -> bytes:
+    """A crawl status page shaped like the API's, with markdown, HTML and metadata."""
+    def words(count: int) -> str:
+        return ' '.join(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(count))
+
+    data = []
+    for i in range(documents):
+        url = f'https://example.com/docs/{i}'
+        paragraphs = [words(rng.randint(40, 120)) for _ in range(rng.randint(5, 15))]
+        data.append({
+            'markdown': '\n\n'.join(f'## {words(4)}\n\n{p}' for p in paragraphs),
+            'html': ''.join(f'<h2>{words(4)}</h2><p>{p}</p>' for p in paragraphs),
+            'links': [f'https://example.com/docs/{rng.randint(0, 10000)}' for _ in range(rng.randint(10, 60))],
+            'metadata': {
+                'title': words(6), 'description': words(20), 'language': 'en', 'sourceURL': url,
+                'url': url, 'statusCode': 200, 'contentType': 'text/html; charset=utf-8',
+                'ogTitle': words(6), 'ogImage': f'https://example.com/img/{i}.png', 'scrapeId': f'{i:032x}',
+            },
+        })
+    page = {
+        'success': True, 'status': 'completed', 'completed': documents, 'total': documents,
+        'creditsUsed': documents, 'expiresAt': '2025-01-01T00:00:00Z',
+        'next': 'https://api.firecrawl.dev/v1/crawl/abc?skip=100', 'data': data,
+    }
+    return json.dumps(page).encode()
+
+
+def codecs() -> list:
+    available = [JSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            available.append(codec_class())
+        except ImportError:
+            print(f'{codec_class.name} is not installed, skipping it')
+    return available
+
+
+def measure(function, pages: list, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            function(page)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--payload', nargs='*', help='Recorded crawl status responses')
+    parser.add_argument('--pages', type=int, default=20, help='Generated pages when no payload is given')
+    parser.add_argument('--documents', type=int, default=100, help='Documents per generated page')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.payload:
+        pages = []
+        for path in args.payload:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+    else:
+        rng = random.Random(0)
+        pages = [make_page(args.documents, rng) for _ in range(args.pages)]
+    size = sum(len(page) for page in pages) / 1e6
+    decoded = [json.loads(page) for page in pages]
+
+    print(f'{len(pages)} pages, {size:.1f} MB')
+    print(f"{'codec':<10}{'decode MB/s':>14}{'encode MB/s':>14}{'speedup':>10}")
+    baseline = None
+    for codec in codecs():
+        decode = measure(codec.loads, pages, args.repeat)
+        encode = measure(codec.dumps, decoded, args.repeat)
+        baseline = baseline or decode
+        print(f'{codec.name:<10}{size / decode:>14.0f}{size / encode:>14.0f}{baseline / decode:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Compare the default transports with HTTPXTransport over HTTP/2.
+
+Starts a local Hypercorn server that speaks HTTP/1.1 and HTTP/2 (prior knowledge
+on plain http), sends many concurrent crawl status checks through FirecrawlApp and
+AsyncFirecrawlApp, and reports requests per second and the number of connections
+the server accepted.
+
+    pip install 'firecrawl-py[http2]' hypercorn
+    python benchmarks/transport_benchmark.py --requests 2000 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from firecrawl import AsyncFirecrawlApp, FirecrawlApp, HTTPXTransport
+
+STATUS = json.dumps({'success': True, 'status': 'scraping', 'completed': 10, 'total': 100}).encode()
+
+
+class StatusServer:
+    """A local API answering every request with a crawl status, counting connections."""
+    def __init__(self) -> None:
+        self.connections = set()
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            self.port = sock.getsockname()[1]
+        self._loop = None
+        self._stop = None
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._serve(),), daemon=True)
+
+    async def app(self, scope, receive, send) -> None:
+        if scope['type'] != 'http':
+            return
+        self.connections.add(tuple(scope['client']))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': STATUS})
+
+    async def _serve(self) -> None:
+        config = Config()
+        config.bind = [f'127.0.0.1:{self.port}']
+        config.accesslog = None
+        config.errorlog = None
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._started.set()
+        await serve(self.app, config, shutdown_trigger=self._stop.wait)
+
+    def __enter__(self) -> 'StatusServer':
+        self._thread.start()
+        self._started.wait()
+        time.sleep(0.5)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join()
+
+
+def run_sync(api_url: str, total: int, concurrency: int, transport=None) -> float:
+    app = FirecrawlApp(api_key='benchmark', api_url=api_url, pool_maxsize=concurrency, transport=transport)
+    headers = app._prepare_headers()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(lambda i: app._get_request(f'{api_url}/v1/crawl/job-{i}', headers), range(total)))
+    elapsed = time.perf_counter() - start
+    app.close()
+    return total / elapsed
+
+
+def run_async(api_url: str, total: int, concurrency: int, transport=None) -> float:
+    async def run() -> float:
+        async with AsyncFirecrawlApp(api_key='benchmark', api_url=api_url, connector_limit=concurrency, transport=transport) as app:
+            headers = app._prepare_headers()
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def check(i: int) -> None:
+                async with semaphore:
+                    await app._async_get_request(f'{api_url}/v1/crawl/job-{i}', headers)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(check(i) for i in range(total)))
+            elapsed = time.perf_counter() - start
+        if transport is not None:
+            await transport.aclose()
+        return total / elapsed
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+
+    cases = [
+        ('requests (HTTP/1.1)', lambda url: run_sync(url, args.requests, args.concurrency)),
+        ('httpx sync (HTTP/2)', lambda url: run_sync(url, args.requests, args.concurrency, HTTPXTransport(http1=False, max_connections=2))),
+        ('aiohttp (HTTP/1.1)', lambda url: run_async(url, args.requests, args.concurrency)),
+        ('httpx async (HTTP/2)', lambda url: run_async(url, args.requests, args.concurrency, HTTPXTransport(http1=False, max_connections=2))),
+    ]
+    print(f"{args.requests} status checks, {args.concurrency} in flight")
+    print(f"{'transport':<24}{'requests/s':>12}{'connections':>13}")
+    for name, case in cases:
+        with StatusServer() as server:
+            rate = case(f'http://127.0.0.1:{server.port}')
+            print(f"{name:<24}{rate:>12.0f}{len(server.connections):>13}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,19 @@ import logging
 import os
 
 from .firecrawl import FirecrawlApp, AsyncFirecrawlApp, JsonConfig, ScrapeOptions, ChangeTrackingOptions # noqa
+from .firecrawl import PollingState, PollingStrategy, FixedPolling, ExponentialPolling, ProgressPolling # noqa
+from .firecrawl import JobMonitor, AsyncJobMonitor # noqa
+from .firecrawl import WebhookReceiver # noqa
+from .firecrawl import BatchScrapeProgress, ScrapeManyResult # noqa
+from .firecrawl import CrawlResultSet # noqa
+from .firecrawl import ResultSink, JSONLResultSink, SQLiteResultSink # noqa
+from .firecrawl import AdaptiveConcurrencyLimiter # noqa
+from .firecrawl import RetryPolicy, RetryBudget, IdempotencyConflictError # noqa
+from .firecrawl import CircuitBreaker, CircuitBreakers, CircuitBreakerOpenError # noqa
+from .firecrawl import HedgingPolicy # noqa
+from .firecrawl import DeadlineExceededError # noqa
+from .firecrawl import Transport, HTTPXTransport # noqa
+from .firecrawl import JSONCodec, OrjsonCodec, MsgspecCodec, get_json_codec, set_json_codec # noqa
 
 __version__ = "2.16.1"
 
@@ -11,10 +11,29 @@ Classes:
 """
 import logging
 import os
+import heapq
+import hmac
+import io
+import itertools
+import queue
+import random
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, Optional, List, Union, Callable, Literal, TypeVar, Generic
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from email.utils import parsedate_to_datetime
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, InvalidStateError, ThreadPoolExecutor, as_completed, wait)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from typing import (
+    Any, Dict, Optional, List, Union, Callable, Literal, TypeVar, Generic, Iterator, AsyncIterator,
+    AsyncContextManager, Awaitable, Tuple, Iterable, Container, Set)
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 import re
 import warnings
 import requests
@@ -22,6 +41,11 @@ import pydantic
 import websockets
 import aiohttp
 import asyncio
+import contextvars
+import copy
+import functools
+from array import array
+from contextlib import asynccontextmanager, contextmanager
 from pydantic import Field
 
 # Suppress Pydantic warnings about attribute shadowing
@@ -49,6 +73,131 @@ logger : logging.Logger = logging.getLogger("firecrawl")
 
 T = TypeVar('T')
 
+# Documents per results page when pages are prefetched at predictable offsets
+PREFETCH_PAGE_SIZE = 100
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes responses, websocket messages and webhook
+    payloads. This one uses the standard library; subclass it to use another JSON
+    library, and install it with set_json_codec().
+    """
+    name = 'json'
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Args:
+            data (Union[bytes, str]): A JSON document
+
+        Returns:
+            Any: The decoded value
+
+        Raises:
+            ValueError: If the document isn't valid JSON
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Args:
+            obj (Any): The value to encode
+
+        Returns:
+            bytes: The value as UTF-8 encoded JSON
+        """
+        return json.dumps(obj).encode()
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec using orjson."""
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec using msgspec."""
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+        self._error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+_JSON_CODECS = {'orjson': OrjsonCodec, 'msgspec': MsgspecCodec, 'json': JSONCodec}
+
+def _default_json_codec() -> JSONCodec:
+    """
+    Return the fastest installed codec: orjson, then msgspec, then the standard library.
+    """
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            pass
+    return JSONCodec()
+
+_json_codec: JSONCodec = _default_json_codec()
+
+def get_json_codec() -> JSONCodec:
+    """
+    Returns:
+        JSONCodec: The codec used by every client
+    """
+    return _json_codec
+
+def set_json_codec(codec: Union[JSONCodec, str]) -> None:
+    """
+    Set the codec used by every client.
+
+    Args:
+        codec (Union[JSONCodec, str]): A codec, or one of 'orjson', 'msgspec' and 'json'
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the codec's library isn't installed
+    """
+    global _json_codec
+    if isinstance(codec, str):
+        if codec not in _JSON_CODECS:
+            raise ValueError(f"Unknown JSON codec {codec!r}, expected one of {', '.join(_JSON_CODECS)}")
+        codec = _JSON_CODECS[codec]()
+    _json_codec = codec
+
+def _response_json(response: requests.Response) -> Any:
+    """
+    Decode the JSON body of a sync response with the JSON codec. Responses that don't
+    expose their raw body, such as those of some transports, decode themselves.
+    """
+    content = getattr(response, 'content', None)
+    if isinstance(content, (bytes, bytearray)):
+        return _json_codec.loads(content)
+    return response.json()
+
+class _CodecSession(requests.Session):
+    """A requests session encoding JSON request bodies with the JSON codec."""
+    def request(self, method: str, url: str, *args, json: Optional[Any] = None, **kwargs) -> requests.Response:
+        if json is not None and kwargs.get('data') is None:
+            kwargs['data'] = _json_codec.dumps(json)
+            kwargs['headers'] = {'Content-Type': 'application/json', **(kwargs.get('headers') or {})}
+        return super().request(method, url, *args, **kwargs)
+
 # class FirecrawlDocumentMetadata(pydantic.BaseModel):
 #     """Metadata for a Firecrawl document."""
 #     title: Optional[str] = None
@@ -124,6 +273,106 @@ class FirecrawlDocument(pydantic.BaseModel, Generic[T]):
     description: Optional[str] = None  # v1 search only
     changeTracking: Optional[ChangeTrackingData] = None
 
+@functools.lru_cache(maxsize=None)
+def _type_adapter(type_: Any) -> Any:
+    """
+    Return a pydantic TypeAdapter for the type, built once per type.
+    """
+    return pydantic.TypeAdapter(type_)
+
+class _LazyField:
+    """
+    A nested model field of a _TrustedDocument, validated the first time it is read.
+    """
+    def __init__(self, name: str, type_: Any) -> None:
+        self.name = name
+        self.type = type_
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.name)
+        if isinstance(value, dict):
+            value = _type_adapter(self.type).validate_python(value)
+            instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+class _TrustedDocument(FirecrawlDocument):
+    """
+    A FirecrawlDocument built from an API response without validation.
+
+    Fields hold the decoded JSON values as they are. The nested `actions` and
+    `changeTracking` models are validated on first access, or before the document
+    is serialized or compared.
+    """
+    def _validate_nested(self) -> None:
+        for name in _TRUSTED_LAZY_FIELDS:
+            getattr(self, name)
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        self._validate_nested()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        self._validate_nested()
+        return super().model_dump_json(**kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        # Compares equal to a validated FirecrawlDocument with the same fields. Python
+        # tries a subclass's __eq__ first, so this also handles `validated == trusted`.
+        if not isinstance(other, FirecrawlDocument):
+            return NotImplemented
+        self._validate_nested()
+        if isinstance(other, _TrustedDocument):
+            other._validate_nested()
+        return (
+            self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+            and self.__pydantic_private__ == other.__pydantic_private__)
+
+_TRUSTED_LAZY_FIELDS = {'actions': ActionsResult, 'changeTracking': ChangeTrackingData}
+for _name, _type in _TRUSTED_LAZY_FIELDS.items():
+    setattr(_TrustedDocument, _name, _LazyField(_name, _type))
+
+@functools.lru_cache(maxsize=None)
+def _document_fields() -> Tuple[frozenset, Dict[str, Any]]:
+    """
+    Return the field names of FirecrawlDocument and their defaults.
+    """
+    fields = FirecrawlDocument.model_fields
+    return frozenset(fields), {name: field.default for name, field in fields.items()}
+
+def _construct_document(document: Any) -> FirecrawlDocument:
+    """
+    Build a document from a trusted API response without validating it.
+
+    Like FirecrawlDocument.model_construct, but without its per-field overhead:
+    the decoded dict becomes the instance's field values directly. Unknown keys
+    are dropped, as validation would.
+
+    Args:
+        document (Any): A document as decoded from the API, or an already built document
+
+    Returns:
+        FirecrawlDocument: A _TrustedDocument
+    """
+    if not isinstance(document, dict):
+        return document
+    names, defaults = _document_fields()
+    if not document.keys() <= names:
+        document = {name: value for name, value in document.items() if name in names}
+    values = defaults.copy()
+    values.update(document)
+    instance = object.__new__(_TrustedDocument)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__pydantic_fields_set__', set(document))
+    object.__setattr__(instance, '__pydantic_extra__', None)
+    object.__setattr__(instance, '__pydantic_private__', None)
+    return instance
+
 class LocationConfig(pydantic.BaseModel):
     """Location configuration for scraping."""
     country: Optional[str] = None
@@ -237,6 +486,14 @@ class ScrapeResponse(FirecrawlDocument[T], Generic[T]):
     warning: Optional[str] = None
     error: Optional[str] = None
 
+class ScrapeManyResult(pydantic.BaseModel):
+    """Outcome of scraping one URL with scrape_many."""
+    index: int
+    url: str
+    success: bool = True
+    data: Optional[ScrapeResponse[Any]] = None
+    error: Optional[str] = None
+
 class BatchScrapeResponse(pydantic.BaseModel):
     """Response from batch scrape operations."""
     id: Optional[str] = None
@@ -256,6 +513,16 @@ class BatchScrapeStatusResponse(pydantic.BaseModel):
     next: Optional[str] = None
     data: List[FirecrawlDocument]
 
+class BatchScrapeProgress(pydantic.BaseModel):
+    """Combined progress of the chunk jobs of a sharded batch scrape."""
+    totalChunks: int
+    completedChunks: int = 0
+    retriedChunks: int = 0
+    total: int = 0
+    completed: int = 0
+    creditsUsed: int = 0
+    invalidURLs: List[str] = []
+
 class CrawlParams(pydantic.BaseModel):
     """Parameters for crawling operations."""
     includePaths: Optional[List[str]] = None
@@ -298,6 +565,551 @@ class CrawlErrorsResponse(pydantic.BaseModel):
     errors: List[Dict[str, str]]  # {id: str, timestamp: str, url: str, error: str}
     robotsBlocked: List[str]
 
+def _document_url(document: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the source URL of a document as decoded from the API.
+    """
+    metadata = document.get('metadata')
+    if not isinstance(metadata, dict):
+        metadata = {}
+    url = metadata.get('sourceURL') or metadata.get('url') or document.get('url')
+    return url if isinstance(url, str) else None
+
+class _TextColumn:
+    """
+    One string per row, stored as a single UTF-8 buffer with row offsets.
+    """
+    __slots__ = ('buffer', 'offsets', 'missing')
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.offsets = array('q', [0])
+        self.missing = bytearray()
+
+    def append(self, value: Optional[Union[str, bytes]]) -> None:
+        if value is None:
+            self.missing.append(1)
+        else:
+            self.missing.append(0)
+            self.buffer += value.encode('utf-8', 'surrogatepass') if isinstance(value, str) else value
+        self.offsets.append(len(self.buffer))
+
+    def get_bytes(self, row: int) -> Optional[bytes]:
+        if self.missing[row]:
+            return None
+        return bytes(self.buffer[self.offsets[row]:self.offsets[row + 1]])
+
+    def get(self, row: int) -> Optional[str]:
+        if self.missing[row]:
+            return None
+        return self.buffer[self.offsets[row]:self.offsets[row + 1]].decode('utf-8', 'surrogatepass')
+
+    def startswith(self, row: int, prefixes: Tuple[bytes, ...]) -> bool:
+        return not self.missing[row] and self.buffer.startswith(prefixes, self.offsets[row], self.offsets[row + 1])
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.itemsize * len(self.offsets) + len(self.missing)
+
+class CrawlResultSet:
+    """
+    Documents of a crawl or batch scrape, stored column-wise.
+
+    URLs, status codes and titles are kept in compact columns that can be read and
+    filtered without building documents. markdown, html and rawHtml are each kept in
+    one concatenated buffer, and the remaining fields as encoded JSON. A
+    FirecrawlDocument is only built when a row is read.
+
+    Indexing with an int returns that document in constant time. Slicing and
+    filter() return a read-only view sharing the columns of this set.
+    """
+    TEXT_FIELDS = ('markdown', 'html', 'rawHtml')
+
+    def __init__(self, documents: Optional[Iterable[Union[FirecrawlDocument, Dict[str, Any]]]] = None) -> None:
+        """
+        Args:
+            documents (Optional[Iterable[Union[FirecrawlDocument, Dict[str, Any]]]]): Documents to add, as models or as
+                decoded from the API
+        """
+        self._urls = _TextColumn()
+        self._titles = _TextColumn()
+        self._status_codes = array('i')
+        self._texts = {field: _TextColumn() for field in self.TEXT_FIELDS}
+        self._others = _TextColumn()
+        self._rows: Optional[array] = None
+        if documents is not None:
+            self.extend(documents)
+
+    def append(self, document: Union[FirecrawlDocument, Dict[str, Any]]) -> None:
+        """
+        Add a document at the end of the set.
+
+        Args:
+            document (Union[FirecrawlDocument, Dict[str, Any]]): The document, as a model or as decoded from the API
+
+        Raises:
+            TypeError: If this is a view of another set
+        """
+        if self._rows is not None:
+            raise TypeError('Views of a CrawlResultSet are read-only')
+        if isinstance(document, pydantic.BaseModel):
+            document = document.model_dump(exclude_none=True)
+        metadata = document.get('metadata')
+        if not isinstance(metadata, dict):
+            metadata = {}
+        title = metadata.get('title') or document.get('title')
+        status_code = metadata.get('statusCode')
+        self._urls.append(_document_url(document))
+        self._titles.append(title if isinstance(title, str) else None)
+        self._status_codes.append(status_code if isinstance(status_code, int) and 0 < status_code < 1000 else 0)
+        for field, column in self._texts.items():
+            column.append(document.get(field))
+        others = {key: value for key, value in document.items() if key not in self._texts and value is not None}
+        self._others.append(_json_codec.dumps(others))
+
+    def extend(self, documents: Iterable[Union[FirecrawlDocument, Dict[str, Any]]]) -> None:
+        """
+        Add documents at the end of the set.
+
+        Args:
+            documents (Iterable[Union[FirecrawlDocument, Dict[str, Any]]]): The documents, as models or as decoded from
+                the API
+        """
+        for document in documents:
+            self.append(document)
+
+    def _view(self, rows: array) -> 'CrawlResultSet':
+        view = object.__new__(CrawlResultSet)
+        view.__dict__.update(self.__dict__)
+        view._rows = rows
+        return view
+
+    def _physical_rows(self) -> Union[range, array]:
+        return range(len(self._status_codes)) if self._rows is None else self._rows
+
+    def _row(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('CrawlResultSet index out of range')
+        return index if self._rows is None else self._rows[index]
+
+    def __len__(self) -> int:
+        return len(self._status_codes) if self._rows is None else len(self._rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[FirecrawlDocument, 'CrawlResultSet']:
+        if isinstance(index, slice):
+            return self._view(array('q', self._physical_rows()[index]))
+        return self._document(self._row(index))
+
+    def __iter__(self) -> Iterator[FirecrawlDocument]:
+        for row in self._physical_rows():
+            yield self._document(row)
+
+    def __repr__(self) -> str:
+        return f'CrawlResultSet({len(self)} documents)'
+
+    def _document(self, row: int) -> FirecrawlDocument:
+        document = _json_codec.loads(self._others.get_bytes(row))
+        for field, column in self._texts.items():
+            value = column.get(row)
+            if value is not None:
+                document[field] = value
+        return FirecrawlDocument(**document)
+
+    def url(self, index: int) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: The source URL of a document, without building it
+        """
+        return self._urls.get(self._row(index))
+
+    def title(self, index: int) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: The page title of a document, without building it
+        """
+        return self._titles.get(self._row(index))
+
+    def status_code(self, index: int) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: The HTTP status code of a document, without building it
+        """
+        return self._status_codes[self._row(index)] or None
+
+    def text(self, field: str, index: int) -> Optional[str]:
+        """
+        Args:
+            field (str): 'markdown', 'html' or 'rawHtml'
+            index (int): The row
+
+        Returns:
+            Optional[str]: The field of a document, without building it
+        """
+        return self._texts[field].get(self._row(index))
+
+    @property
+    def urls(self) -> List[Optional[str]]:
+        """The source URL of every document."""
+        return [self._urls.get(row) for row in self._physical_rows()]
+
+    @property
+    def status_codes(self) -> array:
+        """The status code of every document, 0 where it is unknown."""
+        if self._rows is None:
+            return array('i', self._status_codes)
+        return array('i', (self._status_codes[row] for row in self._rows))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns, in bytes."""
+        columns = [self._urls, self._titles, self._others, *self._texts.values()]
+        return sum(column.nbytes for column in columns) + self._status_codes.itemsize * len(self._status_codes)
+
+    def filter(
+            self,
+            *,
+            status_code: Optional[Union[int, Container[int]]] = None,
+            url_prefix: Optional[Union[str, Tuple[str, ...]]] = None,
+            predicate: Optional[Callable[[FirecrawlDocument], bool]] = None) -> 'CrawlResultSet':
+        """
+        Select documents matching every given condition.
+
+        Status codes and URLs are matched on their columns without building
+        documents. A predicate builds each remaining document, so pass it last.
+
+        Args:
+            status_code (Optional[Union[int, Container[int]]]): A status code, or codes such as range(200, 300)
+            url_prefix (Optional[Union[str, Tuple[str, ...]]]): A prefix, or prefixes, of the source URL
+            predicate (Optional[Callable[[FirecrawlDocument], bool]]): Called with each document, which is kept when it
+                returns True
+
+        Returns:
+            CrawlResultSet: A read-only view of the matching documents, in order
+        """
+        rows = self._physical_rows()
+        if status_code is not None:
+            codes = self._status_codes
+            wanted = {status_code} if isinstance(status_code, int) else status_code
+            rows = [row for row in rows if codes[row] in wanted]
+        if url_prefix is not None:
+            url_prefixes = (url_prefix,) if isinstance(url_prefix, str) else url_prefix
+            prefixes = tuple(prefix.encode() for prefix in url_prefixes)
+            startswith = self._urls.startswith
+            rows = [row for row in rows if startswith(row, prefixes)]
+        if predicate is not None:
+            rows = [row for row in rows if predicate(self._document(row))]
+        return self._view(array('q', rows))
+
+class ResultSink(ABC):
+    """
+    Stores the documents of a crawl or batch scrape job on disk as they arrive.
+
+    Pass a sink, or a file path, as `result_sink` to crawl_url, batch_scrape_urls,
+    check_crawl_status or check_batch_scrape_status. Each page of documents is
+    written to the sink as soon as it is downloaded, and the sink is returned in
+    place of the results. It can count, iterate and look up the documents without
+    loading them all. `status` holds the last job status seen, without its documents.
+
+    Every page is stored together with a pagination cursor: the job ID, the `next`
+    URL, the number of the job's documents written and when its results expire.
+    The sinks persist it next to the documents, so a check_crawl_status or
+    check_batch_scrape_status that was interrupted resumes after the last page
+    stored when it is called again with the same sink, and no document is written
+    twice. `cursor` holds the last cursor stored.
+
+    Subclass ResultSink to store documents elsewhere. Close the sink when you are done.
+    """
+    status: Optional[Dict[str, Any]] = None
+    cursor: Optional[Dict[str, Any]] = None
+
+    @abstractmethod
+    def add(self, documents: List[Dict[str, Any]], cursor: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store a page of documents, and the cursor to resume from after it.
+
+        The documents and the cursor must be committed together: after a crash,
+        either both were stored or neither was.
+
+        Args:
+            documents (List[Dict[str, Any]]): The documents, as decoded from the API
+            cursor (Optional[Dict[str, Any]]): The pagination cursor after this page, to store as `cursor`
+        """
+        raise NotImplementedError
+
+    def set_status(self, status_data: Dict[str, Any]) -> None:
+        """
+        Record the job status of the last page stored.
+
+        Args:
+            status_data (Dict[str, Any]): A status response, as decoded from the API
+        """
+        self.status = {key: value for key, value in status_data.items() if key not in ['data', 'next']}
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[FirecrawlDocument]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[FirecrawlDocument]:
+        """
+        Look up a document by its source URL.
+
+        Args:
+            url (str): The source URL
+
+        Returns:
+            Optional[FirecrawlDocument]: The first document stored for the URL, or None
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the files held by the sink."""
+
+    def __enter__(self) -> 'ResultSink':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+class JSONLResultSink(ResultSink):
+    """
+    Stores documents in a JSON Lines file, one document per line.
+
+    With compression='zstd' every page is written as one Zstandard frame, which
+    requires the zstandard package (`pip install firecrawl-py[zstd]`). An existing
+    file is appended to. Lookups by URL read through the file; use SQLiteResultSink
+    when documents are looked up often.
+
+    The cursor is kept in `<path>.cursor` with the size of the file when it was
+    written. Documents written after it, by a write that was interrupted, are
+    removed when the file is opened again. Without a cursor, only the partial
+    line (or Zstandard frame) an interrupted write left at the end is removed.
+    """
+    def __init__(self, path: str, *, compression: Optional[Literal['zstd']] = None) -> None:
+        """
+        Args:
+            path (str): The file to write, created if it doesn't exist
+            compression (Optional[Literal['zstd']]): Compress the file with Zstandard (default: none)
+
+        Raises:
+            ValueError: If the compression is unknown
+            ImportError: If compression is 'zstd' and zstandard isn't installed
+        """
+        if compression not in [None, 'zstd']:
+            raise ValueError(f"Unknown compression {compression!r}, expected 'zstd' or None")
+        self._zstd = None
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstd compression requires the zstandard package: pip install firecrawl-py[zstd]")
+            self._zstd = zstandard
+        self.path = path
+        self.cursor_path = f'{path}.cursor'
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._committed = os.path.exists(self.cursor_path)
+        if self._committed:
+            with open(self.cursor_path, 'rb') as f:
+                state = _json_codec.loads(f.read())
+            self.cursor = state['cursor']
+            self._count = state['count']
+            if os.path.exists(path) and os.path.getsize(path) > state['offset']:
+                # Drop what an interrupted write left after the last commit
+                with open(path, 'ab') as f:
+                    f.truncate(state['offset'])
+        else:
+            self._count = 0
+            if os.path.exists(path):
+                self._count, offset = self._scan()
+                if os.path.getsize(path) > offset:
+                    # Drop what an interrupted write left after the last complete line
+                    with open(path, 'ab') as f:
+                        f.truncate(offset)
+        self._file = open(path, 'ab')
+
+    def add(self, documents: List[Dict[str, Any]], cursor: Optional[Dict[str, Any]] = None) -> None:
+        data = b''.join(_json_codec.dumps(document) + b'\n' for document in documents)
+        if data and self._zstd is not None:
+            data = self._zstd.ZstdCompressor().compress(data)
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            self._count += len(documents)
+            if cursor is not None:
+                self.cursor = cursor
+                self._committed = True
+            if self._committed:
+                self._commit()
+
+    def _commit(self) -> None:
+        """
+        Make the written documents durable, then replace the cursor file with one
+        pointing after them.
+        """
+        os.fsync(self._file.fileno())
+        state = {'cursor': self.cursor, 'count': self._count, 'offset': self._file.tell()}
+        temporary_path = f'{self.cursor_path}.tmp'
+        with open(temporary_path, 'wb') as f:
+            f.write(_json_codec.dumps(state))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self.cursor_path)
+
+    def _scan(self) -> Tuple[int, int]:
+        """
+        Count the complete lines of the file.
+
+        Returns:
+            Tuple[int, int]: The number of lines, and the size of the file up to the
+                end of the last one (or of the last complete frame with compression)
+        """
+        count = offset = position = 0
+        with open(self.path, 'rb') as f:
+            if self._zstd is None:
+                for line in f:
+                    position += len(line)
+                    if line.endswith(b'\n'):
+                        count += 1
+                        offset = position
+                return count, offset
+            decompressor = self._zstd.ZstdDecompressor()
+            frame = decompressor.decompressobj()
+            lines = 0
+            for chunk in iter(functools.partial(f.read, 1 << 20), b''):
+                while chunk:
+                    try:
+                        lines += frame.decompress(chunk).count(b'\n')
+                    except self._zstd.ZstdError:
+                        return count, offset
+                    if not frame.eof:
+                        position += len(chunk)
+                        break
+                    # The frame ended inside this chunk; the rest starts the next one
+                    position += len(chunk) - len(frame.unused_data)
+                    count, offset, lines = count + lines, position, 0
+                    chunk = frame.unused_data
+                    frame = decompressor.decompressobj()
+        return count, offset
+
+    def _iter_lines(self) -> Iterator[bytes]:
+        with open(self.path, 'rb') as f:
+            reader = f
+            if self._zstd is not None:
+                reader = io.BufferedReader(self._zstd.ZstdDecompressor().stream_reader(f, read_across_frames=True))
+            for line in reader:
+                # A line without a newline was cut short by an interrupted write
+                if line.endswith(b'\n'):
+                    yield line
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[FirecrawlDocument]:
+        for line in self._iter_lines():
+            yield FirecrawlDocument(**_json_codec.loads(line))
+
+    def get(self, url: str) -> Optional[FirecrawlDocument]:
+        # Only decode lines that can contain the URL
+        needle = url.encode() if url.isascii() and '"' not in url and '\\' not in url else b''
+        for line in self._iter_lines():
+            if needle in line:
+                document = _json_codec.loads(line)
+                if _document_url(document) == url:
+                    return FirecrawlDocument(**document)
+        return None
+
+    def close(self) -> None:
+        self._file.close()
+
+class SQLiteResultSink(ResultSink):
+    """
+    Stores documents in an SQLite database, indexed by source URL.
+
+    An existing database is appended to. The cursor is stored in the same
+    transaction as the documents of its page.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): The database file, created if it doesn't exist
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS documents (id INTEGER PRIMARY KEY, url TEXT, document BLOB NOT NULL)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS documents_url ON documents (url)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS cursor (key INTEGER PRIMARY KEY, value BLOB NOT NULL)')
+        row = self._connection.execute('SELECT value FROM cursor WHERE key = 0').fetchone()
+        self.cursor = _json_codec.loads(row[0]) if row is not None else None
+
+    def add(self, documents: List[Dict[str, Any]], cursor: Optional[Dict[str, Any]] = None) -> None:
+        rows = [(_document_url(document), _json_codec.dumps(document)) for document in documents]
+        with self._lock, self._connection:
+            self._connection.executemany('INSERT INTO documents (url, document) VALUES (?, ?)', rows)
+            if cursor is not None:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO cursor (key, value) VALUES (0, ?)', (_json_codec.dumps(cursor),))
+                self.cursor = cursor
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def __iter__(self) -> Iterator[FirecrawlDocument]:
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    'SELECT id, document FROM documents WHERE id > ? ORDER BY id LIMIT 500', (last_id,)).fetchall()
+            if not rows:
+                return
+            for last_id, document in rows:
+                yield FirecrawlDocument(**_json_codec.loads(document))
+
+    def get(self, url: str) -> Optional[FirecrawlDocument]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT document FROM documents WHERE url = ? ORDER BY id LIMIT 1', (url,)).fetchone()
+        return FirecrawlDocument(**_json_codec.loads(row[0])) if row is not None else None
+
+    def close(self) -> None:
+        self._connection.close()
+
+def _open_result_sink(sink: Union[ResultSink, str]) -> ResultSink:
+    """
+    Return the sink, or open one for a path: SQLite for .db, .sqlite and .sqlite3
+    files, Zstandard compressed JSON Lines for .zst files, and JSON Lines otherwise.
+    """
+    if isinstance(sink, ResultSink):
+        return sink
+    path = os.fspath(sink)
+    if path.endswith(('.db', '.sqlite', '.sqlite3')):
+        return SQLiteResultSink(path)
+    return JSONLResultSink(path, compression='zstd' if path.endswith('.zst') else None)
+
+def _page_cursor(sink: ResultSink, id: str, status_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the cursor to store in a sink with a page of a job's documents.
+    """
+    previous = sink.cursor if sink.cursor is not None and sink.cursor.get('id') == id else {}
+    return {
+        'id': id,
+        'status': status_data.get('status'),
+        'next': status_data.get('next'),
+        'written': previous.get('written', 0) + len(status_data.get('data') or []),
+        'expiresAt': status_data.get('expiresAt') or previous.get('expiresAt'),
+    }
+
 class MapParams(pydantic.BaseModel):
     """Parameters for mapping operations."""
     search: Optional[str] = None
@@ -440,87 +1252,1583 @@ class ExtractParams(pydantic.BaseModel):
     show_sources: Optional[bool] = False
     agent: Optional[Dict[str, Any]] = None
 
-class FirecrawlApp:
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None) -> None:
-        """
-        Initialize the FirecrawlApp instance with API key, API URL.
+class PollingState:
+    """
+    Progress of a job being waited on, as seen by a PollingStrategy.
 
+    Attributes:
+        attempt (int): Number of status checks recorded so far
+        completed (Optional[int]): Items completed at the last status check, if reported
+        total (Optional[int]): Total items at the last status check, if reported
+    """
+    def __init__(self, window: int = 5) -> None:
+        """
         Args:
-            api_key (Optional[str]): API key for authenticating with the Firecrawl API.
-            api_url (Optional[str]): Base URL for the Firecrawl API.
+            window (int): Number of recent status checks used to estimate the progress rate (default: 5)
         """
-        self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
-        self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
-        
-        # Only require API key when using cloud service
-        if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
-            logger.warning("No API key provided for cloud service")
-            raise ValueError('No API key provided')
-            
-        logger.debug(f"Initialized FirecrawlApp with API URL: {self.api_url}")
+        self.started = time.monotonic()
+        self.attempt = 0
+        self.completed: Optional[int] = None
+        self.total: Optional[int] = None
+        self._samples = deque(maxlen=max(window, 2))
 
-    def scrape_url(
-            self,
-            url: str,
-            *,
-            formats: Optional[List[Literal["markdown", "html", "rawHtml", "content", "links", "screenshot", "screenshot@fullPage", "extract", "json", "changeTracking"]]] = None,
-            headers: Optional[Dict[str, str]] = None,
-            include_tags: Optional[List[str]] = None,
-            exclude_tags: Optional[List[str]] = None,
-            only_main_content: Optional[bool] = None,
-            wait_for: Optional[int] = None,
-            timeout: Optional[int] = None,
-            location: Optional[LocationConfig] = None,
-            mobile: Optional[bool] = None,
-            skip_tls_verification: Optional[bool] = None,
-            remove_base64_images: Optional[bool] = None,
-            block_ads: Optional[bool] = None,
-            proxy: Optional[Literal["basic", "stealth", "auto"]] = None,
-            parse_pdf: Optional[bool] = None,
-            extract: Optional[JsonConfig] = None,
-            json_options: Optional[JsonConfig] = None,
-            actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
-            change_tracking_options: Optional[ChangeTrackingOptions] = None,
-            max_age: Optional[int] = None,
-            store_in_cache: Optional[bool] = None,
-            zero_data_retention: Optional[bool] = None,
-            **kwargs) -> ScrapeResponse[Any]:
+    @property
+    def elapsed(self) -> float:
+        """Seconds since waiting started."""
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Items completed per second over the recent status checks, or None if unknown."""
+        if len(self._samples) < 2:
+            return None
+        (first_time, first_completed), (last_time, last_completed) = self._samples[0], self._samples[-1]
+        if last_time <= first_time:
+            return None
+        return (last_completed - first_completed) / (last_time - first_time)
+
+    def record(self, status: Any) -> None:
         """
-        Scrape and extract content from a URL.
+        Record a status check.
 
         Args:
-          url (str): Target URL to scrape
-          formats (Optional[List[Literal["markdown", "html", "rawHtml", "content", "links", "screenshot", "screenshot@fullPage", "extract", "json"]]]): Content types to retrieve (markdown/html/etc)
-          headers (Optional[Dict[str, str]]): Custom HTTP headers
-          include_tags (Optional[List[str]]): HTML tags to include
-          exclude_tags (Optional[List[str]]): HTML tags to exclude
-          only_main_content (Optional[bool]): Extract main content only
-          wait_for (Optional[int]): Wait for a specific element to appear
-          timeout (Optional[int]): Request timeout (ms)
-          location (Optional[LocationConfig]): Location configuration
-          mobile (Optional[bool]): Use mobile user agent
-          skip_tls_verification (Optional[bool]): Skip TLS verification
-          remove_base64_images (Optional[bool]): Remove base64 images
-          block_ads (Optional[bool]): Block ads
-          proxy (Optional[Literal["basic", "stealth", "auto"]]): Proxy type (basic/stealth)
-          extract (Optional[JsonConfig]): Content extraction settings
-          json_options (Optional[JsonConfig]): JSON extraction settings
-          actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]]): Actions to perform
-          change_tracking_options (Optional[ChangeTrackingOptions]): Change tracking settings
-          zero_data_retention (Optional[bool]): Whether to delete data after scrape is done
+            status (Any): The status response, as a dict or a response model
+        """
+        self.attempt += 1
+        if isinstance(status, dict):
+            completed, total = status.get('completed'), status.get('total')
+        else:
+            completed, total = getattr(status, 'completed', None), getattr(status, 'total', None)
+        self.completed, self.total = completed, total
+        if isinstance(completed, (int, float)):
+            self._samples.append((time.monotonic(), completed))
 
+class PollingStrategy(ABC):
+    """
+    Decides how long to wait before the next status check of a running job.
 
-        Returns:
-          ScrapeResponse with:
-          * Requested content formats
-          * Page metadata
-          * Extraction results
-          * Success/error status
+    Subclasses implement next_interval. A strategy holds no per-job state, so one
+    instance can be shared by every waiter of a client.
+    """
+    @abstractmethod
+    def next_interval(self, state: PollingState) -> float:
+        """
+        Args:
+            state (PollingState): Progress of the job, with the latest status check recorded
 
-        Raises:
-          Exception: If scraping fails
+        Returns:
+            float: Seconds to wait before checking the status again
         """
-        _headers = self._prepare_headers()
+        raise NotImplementedError
+
+class FixedPolling(PollingStrategy):
+    """Check the status at a fixed interval."""
+    def __init__(self, interval: float = 2) -> None:
+        self.interval = interval
+
+    def next_interval(self, state: PollingState) -> float:
+        return self.interval
+
+class ExponentialPolling(PollingStrategy):
+    """Start with a short interval and grow it geometrically up to a cap."""
+    def __init__(self, initial_interval: float = 0.5, multiplier: float = 2, max_interval: float = 30) -> None:
+        self.initial_interval = initial_interval
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+
+    def next_interval(self, state: PollingState) -> float:
+        exponent = min(max(state.attempt - 1, 0), 64)
+        return min(self.initial_interval * self.multiplier ** exponent, self.max_interval)
+
+class ProgressPolling(PollingStrategy):
+    """
+    Space status checks by the job's estimated time to completion.
+
+    The completion rate is estimated from the `completed` deltas of recent
+    status checks, and the next check is scheduled a fraction of the remaining
+    time away. Until a rate is known, or when the job reports no progress,
+    the fallback strategy is used.
+    """
+    def __init__(
+            self,
+            min_interval: float = 0.5,
+            max_interval: float = 30,
+            eta_fraction: float = 0.25,
+            fallback: Optional[PollingStrategy] = None) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.eta_fraction = eta_fraction
+        self.fallback = fallback or ExponentialPolling(min_interval, 2, max_interval)
+
+    def next_interval(self, state: PollingState) -> float:
+        rate = state.rate
+        if not rate or rate <= 0 or state.total is None or state.completed is None or state.completed >= state.total:
+            return self.fallback.next_interval(state)
+        eta = (state.total - state.completed) / rate
+        return min(max(eta * self.eta_fraction, self.min_interval), self.max_interval)
+
+# Forgotten job IDs a WebhookReceiver remembers, to ignore their late events
+_MAX_FORGOTTEN_JOBS = 10000
+
+class WebhookReceiver:
+    """
+    An embeddable HTTP server receiving Firecrawl crawl and batch scrape webhook events.
+
+    Page events are parsed into FirecrawlDocument objects and put on a queue per
+    job, ending with None once the job completes or fails, and each job's
+    completion future resolves with the `completed` event (or raises on `failed`).
+    Events are buffered per job id, so events sent before the caller learns the
+    job id are not lost.
+
+    Clients waiting on a receiver fall back to polling the job when no event
+    arrives for `event_timeout` seconds, e.g. because Firecrawl cannot reach the
+    receiver's URL.
+
+    The server runs on a background thread. To receive events in an existing web
+    application instead, pass the parsed JSON body and request headers to
+    dispatch() from its handler.
+
+    Attributes:
+        host (str): Interface the server listens on
+        port (int): Port the server listens on (assigned by the OS when 0)
+        path (str): URL path webhook events are posted to
+        public_url (Optional[str]): URL Firecrawl should post events to, if the server is behind a proxy or tunnel
+        secret (Optional[str]): Shared secret Firecrawl sends in `secret_header`; events without it are rejected
+        secret_header (str): Name of the header carrying the secret
+        event_timeout (Optional[float]): Seconds a client waits for the next event before polling the job instead
+            (None waits until the deadline, and requires one)
+    """
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            *,
+            path: str = '/webhook',
+            public_url: Optional[str] = None,
+            secret: Optional[str] = None,
+            secret_header: str = 'X-Firecrawl-Webhook-Secret',
+            event_timeout: Optional[float] = 60.0) -> None:
+        self.host = host
+        self.port = port
+        self.path = path
+        self.public_url = public_url
+        self.secret = secret
+        self.secret_header = secret_header
+        self.event_timeout = event_timeout
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._forgotten: Dict[str, None] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'WebhookReceiver':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def url(self) -> str:
+        """The URL Firecrawl should post events to."""
+        return self.public_url or f'http://{self.host}:{self.port}{self.path}'
+
+    def start(self) -> None:
+        """
+        Start serving on a background thread. Does nothing if the server is already running.
+        """
+        if self._server is not None:
+            return
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                if urlparse(self.path).path != receiver.path:
+                    self.send_error(404)
+                    return
+                try:
+                    body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                    payload = _json_codec.loads(body)
+                except ValueError:
+                    self.send_error(400, 'Invalid JSON')
+                    return
+                try:
+                    accepted = receiver.dispatch(payload, dict(self.headers))
+                except PermissionError:
+                    self.send_error(401)
+                    return
+                self.send_response(200 if accepted else 400)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f"Webhook receiver: {format % args}")
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='firecrawl-webhook-receiver', daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """
+        Stop the server.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def webhook_config(
+            self,
+            events: Optional[List[Literal["completed", "failed", "page", "started"]]] = None) -> WebhookConfig:
+        """
+        Build the webhook configuration that makes a job post its events to this receiver.
+
+        Args:
+            events (Optional[List[str]]): Events to subscribe to (default: all)
+
+        Returns:
+            WebhookConfig: The configuration to pass as the `webhook` of a crawl or batch scrape
+        """
+        headers = {self.secret_header: self.secret} if self.secret else None
+        return WebhookConfig(url=self.url, headers=headers, events=events)
+
+    def completion(self, id: str) -> Future:
+        """
+        Args:
+            id (str): The ID of the job
+
+        Returns:
+            Future: Resolves with the `completed` event of the job, or raises once it fails
+        """
+        return self._get_job(id)['future']
+
+    def documents(self, id: str) -> 'queue.Queue[Optional[FirecrawlDocument]]':
+        """
+        Args:
+            id (str): The ID of the job
+
+        Returns:
+            queue.Queue: The documents of the job as they are received, followed by None when it ends
+        """
+        return self._get_job(id)['documents']
+
+    def iter_documents(self, id: str, timeout: Optional[float] = None) -> Iterator[FirecrawlDocument]:
+        """
+        Yield the documents of a job as they are received, until it completes or fails.
+
+        Args:
+            id (str): The ID of the job
+            timeout (Optional[float]): Seconds to wait for each event (default: no limit)
+
+        Yields:
+            FirecrawlDocument: Each received document
+
+        Raises:
+            queue.Empty: If no event arrives within the timeout
+        """
+        documents = self.documents(id)
+        while True:
+            document = documents.get(timeout=timeout)
+            if document is None:
+                return
+            yield document
+
+    def forget(self, id: str) -> None:
+        """
+        Drop the queued documents and the future of a job. Events the job sends
+        afterwards are ignored.
+
+        Args:
+            id (str): The ID of the job
+        """
+        with self._lock:
+            self._jobs.pop(id, None)
+            self._forgotten[id] = None
+            if len(self._forgotten) > _MAX_FORGOTTEN_JOBS:
+                del self._forgotten[next(iter(self._forgotten))]
+
+    def dispatch(self, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Verify and handle a webhook event.
+
+        Args:
+            payload (Dict[str, Any]): The JSON body of the webhook request
+            headers (Optional[Dict[str, str]]): The headers of the webhook request
+
+        Returns:
+            bool: Whether the event was a well-formed crawl or batch scrape event
+
+        Raises:
+            PermissionError: If a secret is configured and the request does not carry it
+        """
+        if self.secret is not None:
+            headers = {k.lower(): v for k, v in (headers or {}).items()}
+            if not hmac.compare_digest(headers.get(self.secret_header.lower(), ''), self.secret):
+                raise PermissionError('Invalid webhook secret')
+
+        if not isinstance(payload, dict) or not isinstance(payload.get('type'), str) or not payload.get('id'):
+            return False
+        kind, _, event = payload['type'].partition('.')
+        if kind not in ['crawl', 'batch_scrape']:
+            return False
+
+        job = self._get_job(payload['id'], recreate=False)
+        if job is None:
+            logger.debug(f"Ignoring webhook event {payload['type']} of forgotten job {payload['id']}")
+            return True
+        if event == 'page':
+            if payload.get('success', True):
+                for document in payload.get('data') or []:
+                    job['documents'].put(FirecrawlDocument(**document))
+            else:
+                logger.debug(f"Webhook page event of job {payload['id']} failed: {payload.get('error')}")
+        elif event in ['completed', 'failed']:
+            job['documents'].put(None)
+            if not job['future'].done():
+                if event == 'completed':
+                    job['future'].set_result(payload)
+                else:
+                    job['future'].set_exception(Exception(f"Job {payload['id']} failed. Error: {payload.get('error')}"))
+        for listener in list(job['listeners']):
+            listener()
+        return True
+
+    def _add_listener(self, id: str, listener: Callable[[], Any]) -> None:
+        """
+        Call listener from the server thread after each event of a job is handled.
+        """
+        self._get_job(id)['listeners'].append(listener)
+
+    def _get_job(self, id: str, recreate: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Return the state of a job, created if needed. With recreate=False, None is
+        returned instead of re-creating a job that was forgotten.
+        """
+        with self._lock:
+            if id not in self._jobs:
+                if id in self._forgotten:
+                    if not recreate:
+                        return None
+                    del self._forgotten[id]
+                self._jobs[id] = {'documents': queue.Queue(), 'future': Future(), 'listeners': []}
+            return self._jobs[id]
+
+def _next_event_wait(event_timeout: Optional[float]) -> Tuple[Optional[float], bool]:
+    """
+    Seconds to wait for the next webhook event, given the receiver's event timeout
+    and the current deadline.
+
+    Returns:
+        Tuple[Optional[float], bool]: The wait, and whether running out of it means the deadline has passed
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    left = _time_left()
+    if event_timeout is None or (left is not None and left <= event_timeout):
+        return left, True
+    return event_timeout, False
+
+def _check_event_timeout(receiver: WebhookReceiver) -> None:
+    """
+    Check that waiting on a webhook receiver will end.
+
+    Raises:
+        ValueError: If the receiver has no event_timeout and there is no deadline
+    """
+    if receiver.event_timeout is None and _deadline.get() is None:
+        raise ValueError('A WebhookReceiver without an event_timeout can only be waited on with a deadline')
+
+def _skip_received(
+        on_document: Optional[Callable[[FirecrawlDocument], Any]],
+        received: Set[str]) -> Optional[Callable[[FirecrawlDocument], Any]]:
+    """
+    Wrap on_document to skip the documents whose source URL is in received.
+    """
+    if on_document is None or not received:
+        return on_document
+
+    def deliver(document: FirecrawlDocument) -> Any:
+        if _document_url(document.__dict__) not in received:
+            return on_document(document)
+    return deliver
+
+def _parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header given either as seconds or as an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limit the requests a client has in flight, adapting the limit to the API's feedback.
+
+    The limit follows additive increase / multiplicative decrease: it grows by about
+    `increase` for every `limit` successful requests, and is multiplied by
+    `decrease_factor` when the API answers with an overload status, or when a
+    request takes longer than `latency_target`. Rejections of requests that were
+    in flight together only count once, as the limit is lowered at most once per
+    round trip. A Retry-After header pauses all new requests until it has passed,
+    for at most `max_pause` seconds.
+
+    One limiter is shared by all threads (and event loops) of the clients using it.
+
+    Attributes:
+        min_limit (int): Lowest concurrency limit
+        max_limit (int): Highest concurrency limit
+        increase (float): Additive increase per round trip of successful requests
+        decrease_factor (float): Multiplicative decrease on overload
+        latency_target (Optional[float]): Seconds above which a request counts as overload
+        overload_statuses (Tuple[int, ...]): HTTP statuses that count as overload
+        max_pause (float): Longest pause in seconds a Retry-After header can cause
+        on_change (Optional[Callable[[int], Any]]): Called with the new limit whenever it changes
+    """
+    def __init__(
+            self,
+            initial_limit: int = 8,
+            *,
+            min_limit: int = 1,
+            max_limit: int = 64,
+            increase: float = 1.0,
+            decrease_factor: float = 0.5,
+            latency_target: Optional[float] = None,
+            overload_statuses: Tuple[int, ...] = (429, 503),
+            max_pause: float = 60.0,
+            on_change: Optional[Callable[[int], Any]] = None) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.overload_statuses = overload_statuses
+        self.max_pause = max_pause
+        self.on_change = on_change
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._latency: Optional[float] = None
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._async_waiters: deque = deque()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed latency of recent requests in seconds."""
+        return self._latency
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot and take it.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait (default: no limit)
+
+        Returns:
+            bool: Whether a slot was taken before the timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while True:
+                delay = self._get_wait_time()
+                if delay == 0:
+                    self._take()
+                    return True
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    delay = min(delay, remaining) if delay is not None else remaining
+                self._condition.wait(delay)
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot and take it, without blocking the event loop.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait (default: no limit)
+
+        Returns:
+            bool: Whether a slot was taken before the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._condition:
+                delay = self._get_wait_time()
+                if delay == 0:
+                    self._take()
+                    return True
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    delay = min(delay, remaining) if delay is not None else remaining
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await asyncio.wait([waiter], timeout=delay)
+
+    def release(
+            self,
+            status_code: Optional[int] = None,
+            latency: Optional[float] = None,
+            retry_after: Optional[float] = None) -> None:
+        """
+        Give a slot back and adapt the limit to the outcome of its request.
+
+        Args:
+            status_code (Optional[int]): HTTP status of the response, None if the request failed without one
+            latency (Optional[float]): Seconds the request took
+            retry_after (Optional[float]): Seconds from the response's Retry-After header
+        """
+        with self._condition:
+            previous = self.limit
+            now = time.monotonic()
+            self._in_flight -= 1
+            if latency is not None:
+                self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + min(retry_after, self.max_pause))
+
+            slow = self.latency_target is not None and latency is not None and latency > self.latency_target
+            if status_code in self.overload_statuses or slow:
+                if now - self._last_decrease >= (self._latency or 0):
+                    self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                    self._last_decrease = now
+            elif status_code is not None and status_code < 500 and self._peak_in_flight >= self._limit / 2:
+                # Only grow while the limit is actually in use
+                self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+            if self._in_flight == 0:
+                self._peak_in_flight = 0
+
+            self._notify()
+            limit = self.limit
+        if limit != previous and self.on_change is not None:
+            try:
+                self.on_change(limit)
+            except Exception as e:
+                logger.error(f"Error in concurrency limit callback: {e}")
+
+    def _take(self) -> None:
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _get_wait_time(self) -> Optional[float]:
+        """
+        Seconds to wait before a slot may be taken: 0 if one is free now, None if
+        the caller must wait for a release.
+        """
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            return pause
+        return 0 if self._in_flight < self.limit else None
+
+    def _notify(self) -> None:
+        self._condition.notify_all()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(self._wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop is closed
+                pass
+
+    @staticmethod
+    def _wake(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
+
+class RetryBudget:
+    """
+    Cap retries at a fraction of the requests sent, so a degraded API doesn't
+    receive a multiple of the normal load.
+
+    Every first attempt deposits `ratio` of a token and every retry withdraws a
+    whole one. `min_per_second` tokens are added over time so that low-traffic
+    clients can still retry. One budget may be shared by many clients.
+
+    Attributes:
+        ratio (float): Retries allowed per request sent
+        min_per_second (float): Retries allowed per second regardless of traffic
+        max_tokens (float): Most retries that can be saved up for a burst
+    """
+    def __init__(self, ratio: float = 0.2, *, min_per_second: float = 1.0, max_tokens: float = 10.0) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def deposit(self) -> None:
+        """Record a request's first attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Take a token for a retry.
+
+        Returns:
+            bool: Whether the retry is allowed
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+class IdempotencyConflictError(requests.exceptions.HTTPError):
+    """
+    A job submission was rejected because its idempotency key was already used.
+
+    This happens when an earlier attempt with the same key reached the API but its
+    response was lost, so the job most likely exists but its ID is unknown.
+    Submitting again with a new key would start a second, separately billed job.
+
+    Attributes:
+        idempotency_key (str): The key sent with every attempt
+    """
+    def __init__(self, idempotency_key: str, **kwargs) -> None:
+        super().__init__(
+            f'The API reports the idempotency key {idempotency_key} of this job submission as already used: '
+            'the job was most likely created by an earlier attempt whose response was lost. '
+            'Check for the job before submitting it again with a new key.',
+            **kwargs)
+        self.idempotency_key = idempotency_key
+
+class _RetryState:
+    """
+    Progress of one request through its retries.
+    """
+    def __init__(self) -> None:
+        self.attempt = 1
+        self.start = time.monotonic()
+        self.delay = 0.0
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is sent again.
+
+    Responses with a status in `retry_statuses` are retried for every request.
+    Responses with a status in `idempotent_retry_statuses`, and exceptions in
+    `retry_exceptions`, are only retried for idempotent requests (GET and DELETE),
+    because the API may already have acted on the request.
+
+    Delays use decorrelated jitter: each is drawn between `base_delay` and three
+    times the previous one, capped at `max_delay`. A Retry-After header on the
+    response takes precedence; one asking for more than `max_retry_after`
+    seconds ends the retries, so the error is raised instead of sleeping for
+    it. No retry is made that would end after
+    `total_timeout` seconds from the first attempt, or that the `budget` doesn't allow.
+
+    Attributes:
+        max_attempts (int): Most attempts per request, including the first
+        total_timeout (Optional[float]): Seconds after the first attempt past which no retry starts
+        base_delay (float): Shortest delay between attempts in seconds
+        max_delay (float): Longest delay between attempts in seconds
+        retry_statuses (Tuple[int, ...]): Statuses retried for every request
+        idempotent_retry_statuses (Tuple[int, ...]): Statuses retried for idempotent requests
+        retry_exceptions (Tuple[type, ...]): Exceptions retried for idempotent requests
+        respect_retry_after (bool): Wait as long as the Retry-After header asks
+        max_retry_after (float): Longest Retry-After in seconds that is waited for
+        budget (Optional[RetryBudget]): Budget every retry must be allowed by
+    """
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            *,
+            total_timeout: Optional[float] = None,
+            base_delay: float = 0.5,
+            max_delay: float = 30.0,
+            retry_statuses: Tuple[int, ...] = (429, 502, 503),
+            idempotent_retry_statuses: Tuple[int, ...] = (500, 504),
+            retry_exceptions: Tuple[type, ...] = (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                aiohttp.ClientConnectionError,
+                asyncio.TimeoutError),
+            respect_retry_after: bool = True,
+            max_retry_after: float = 60.0,
+            budget: Optional[RetryBudget] = None) -> None:
+        self.max_attempts = max_attempts
+        self.total_timeout = total_timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+        self.idempotent_retry_statuses = idempotent_retry_statuses
+        self.retry_exceptions = retry_exceptions
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+
+    def start(self) -> _RetryState:
+        """
+        Begin tracking a request.
+
+        Returns:
+            _RetryState: State to pass to next_delay() after each failed attempt
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+        return _RetryState()
+
+    def next_delay(
+            self,
+            state: _RetryState,
+            idempotent: bool,
+            status_code: Optional[int] = None,
+            exception: Optional[BaseException] = None,
+            retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Decide whether to retry after an attempt.
+
+        Args:
+            state (_RetryState): The request's state from start()
+            idempotent (bool): Whether sending the request again is safe even if the API acted on it
+            status_code (Optional[int]): Status of the response, if one was received
+            exception (Optional[BaseException]): Exception raised by the attempt, if any
+            retry_after (Optional[float]): Seconds from the response's Retry-After header
+
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt, or None to stop
+        """
+        if exception is not None:
+            retryable = idempotent and isinstance(exception, self.retry_exceptions)
+        else:
+            retryable = status_code in self.retry_statuses or (
+                idempotent and status_code in self.idempotent_retry_statuses)
+        if not retryable or state.attempt >= self.max_attempts:
+            return None
+
+        state.delay = min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, state.delay * 3)))
+        delay = state.delay
+        if self.respect_retry_after and retry_after is not None:
+            if retry_after > self.max_retry_after:
+                logger.debug(f"Retry-After of {retry_after} seconds exceeds max_retry_after, not retrying")
+                return None
+            delay = retry_after
+        if self.total_timeout is not None and time.monotonic() + delay - state.start > self.total_timeout:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            logger.debug("Retry budget exhausted, not retrying")
+            return None
+
+        state.attempt += 1
+        return delay
+
+class CircuitBreakerOpenError(Exception):
+    """
+    A request was not sent because the circuit breaker of its endpoint family is open.
+
+    Attributes:
+        family (str): The endpoint family
+        retry_in (float): Seconds until the breaker lets a trial request through
+    """
+    def __init__(self, family: str, retry_in: float) -> None:
+        super().__init__(f"Circuit breaker for {family} requests is open, retry in {retry_in:.1f}s")
+        self.family = family
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """
+    Closed, open and half-open circuit breaker for one family of API endpoints.
+
+    While closed, the outcome of the last `window` calls is kept. Once at least
+    `minimum_calls` are known and the share of failed or slow calls reaches
+    `failure_rate_threshold`, the breaker opens and calls fail fast with
+    CircuitBreakerOpenError. After `open_duration` seconds it turns half-open and
+    lets `half_open_max_calls` trial calls through: if they all succeed it closes,
+    and if one fails it opens again.
+
+    Responses with a 5xx status and requests failing without a response count as
+    failures. Calls slower than `slow_call_threshold` count as failures too.
+
+    Attributes:
+        family (str): Name of the endpoint family
+        failure_rate_threshold (float): Share of failed calls that opens the breaker
+        slow_call_threshold (Optional[float]): Seconds after which a call counts as failed
+        window (int): Number of recent calls the failure rate is computed over
+        minimum_calls (int): Calls needed in the window before the breaker may open
+        open_duration (float): Seconds the breaker stays open before a trial call
+        half_open_max_calls (int): Trial calls that must succeed to close the breaker
+        on_state_change (Optional[Callable[[str, str, str], Any]]): Called with the family, the old state and the new
+            state
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+            self,
+            family: str,
+            *,
+            failure_rate_threshold: float = 0.5,
+            slow_call_threshold: Optional[float] = None,
+            window: int = 20,
+            minimum_calls: int = 10,
+            open_duration: float = 30.0,
+            half_open_max_calls: int = 1,
+            on_state_change: Optional[Callable[[str, str, str], Any]] = None) -> None:
+        self.family = family
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._state = self.CLOSED
+        self._outcomes: deque = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The current state: 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failed calls in the window."""
+        with self._lock:
+            return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may be made. Every allowed call must be followed by after_call().
+
+        Raises:
+            CircuitBreakerOpenError: If the breaker is open, or half-open with its trial calls in flight
+        """
+        with self._lock:
+            previous = self._state
+            if self._state == self.OPEN:
+                retry_in = self._opened_at + self.open_duration - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitBreakerOpenError(self.family, retry_in)
+                self._set_state(self.HALF_OPEN)
+            if self._state == self.HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    raise CircuitBreakerOpenError(self.family, 0)
+                self._trials += 1
+            state = self._state
+        self._notify(previous, state)
+
+    def after_call(self, failed: bool, latency: Optional[float] = None) -> None:
+        """
+        Record the outcome of a call allowed by before_call().
+
+        Args:
+            failed (bool): Whether the call failed
+            latency (Optional[float]): Seconds the call took
+        """
+        if self.slow_call_threshold is not None and latency is not None and latency > self.slow_call_threshold:
+            failed = True
+        with self._lock:
+            previous = self._state
+            if self._state == self.HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_max_calls:
+                        self._set_state(self.CLOSED)
+            elif self._state == self.CLOSED:
+                self._outcomes.append(1 if failed else 0)
+                failure_rate = sum(self._outcomes) / len(self._outcomes)
+                if len(self._outcomes) >= self.minimum_calls and failure_rate >= self.failure_rate_threshold:
+                    self._open()
+            state = self._state
+        self._notify(previous, state)
+
+    def cancel_call(self) -> None:
+        """
+        Record that a call allowed by before_call() was abandoned without an outcome.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._trials > self._trial_successes:
+                self._trials -= 1
+
+    def reset(self) -> None:
+        """Close the breaker and forget the recorded calls."""
+        with self._lock:
+            previous = self._state
+            self._set_state(self.CLOSED)
+        self._notify(previous, self.CLOSED)
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._set_state(self.OPEN)
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        self._outcomes.clear()
+        self._trials = 0
+        self._trial_successes = 0
+
+    def _notify(self, previous: str, state: str) -> None:
+        if previous == state:
+            return
+        logger.warning(f"Circuit breaker for {self.family} requests changed from {previous} to {state}")
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(self.family, previous, state)
+            except Exception as e:
+                logger.error(f"Error in circuit breaker callback: {e}")
+
+class CircuitBreakers:
+    """
+    One CircuitBreaker per API endpoint family, created on first use.
+
+    Requests to /v1/scrape, /v1/crawl, /v1/batch/scrape, /v1/map, /v1/extract and
+    /v1/search (including their status and cancel endpoints) are guarded by the
+    'scrape', 'crawl', 'batch', 'map', 'extract' and 'search' breakers. Other
+    requests are not guarded.
+
+    Args:
+        **settings: Settings passed to every CircuitBreaker, such as failure_rate_threshold or on_state_change
+    """
+    FAMILIES = {
+        'scrape': '/v1/scrape',
+        'crawl': '/v1/crawl',
+        'batch': '/v1/batch/scrape',
+        'map': '/v1/map',
+        'extract': '/v1/extract',
+        'search': '/v1/search',
+    }
+
+    def __init__(self, **settings) -> None:
+        self.settings = settings
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, family: str) -> CircuitBreaker:
+        if family not in self.FAMILIES:
+            raise KeyError(f"Unknown endpoint family: {family}. Expected one of {', '.join(self.FAMILIES)}")
+        with self._lock:
+            if family not in self._breakers:
+                self._breakers[family] = CircuitBreaker(family, **self.settings)
+            return self._breakers[family]
+
+    def states(self) -> Dict[str, str]:
+        """The state of every breaker created so far, by family."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {family: breaker.state for family, breaker in breakers.items()}
+
+    def for_url(self, url: str) -> Optional[CircuitBreaker]:
+        """
+        Return the breaker guarding a request URL.
+
+        Returns:
+            Optional[CircuitBreaker]: The breaker, or None if the URL isn't in any family
+        """
+        path = urlparse(url).path.rstrip('/')
+        for family, prefix in self.FAMILIES.items():
+            if path == prefix or path.startswith(prefix + '/'):
+                return self[family]
+        return None
+
+class HedgingPolicy:
+    """
+    When to send a duplicate of a slow request, to cut tail latency.
+
+    The hedge is sent once the request has been outstanding for the
+    `percentile` latency of recent requests (clamped between `min_delay` and
+    `max_delay`, and `initial_delay` until `min_samples` latencies are known).
+    Whichever copy succeeds first is used. Hedges are capped at `max_hedge_ratio`
+    of the requests, so a slow API doesn't receive much extra load. Note that
+    both copies of a hedged scrape may be billed. AsyncFirecrawlApp cancels the
+    slower copy; FirecrawlApp can't, so it runs to completion in the background,
+    holding its connection and concurrency limiter slot.
+
+    A policy keeps latency statistics, so reuse the same instance across calls.
+
+    Attributes:
+        percentile (float): Latency percentile after which the hedge is sent
+        min_delay (float): Shortest delay before hedging in seconds
+        max_delay (float): Longest delay before hedging in seconds
+        initial_delay (float): Delay used until enough latencies are known
+        min_samples (int): Latencies needed before the percentile is used
+        max_hedge_ratio (float): Hedges allowed per request
+        api_url (Optional[str]): API to send hedges to (default: the client's api_url)
+    """
+    def __init__(
+            self,
+            percentile: float = 95,
+            *,
+            min_delay: float = 0.5,
+            max_delay: float = 60.0,
+            initial_delay: float = 5.0,
+            min_samples: int = 20,
+            sample_size: int = 500,
+            max_hedge_ratio: float = 0.1,
+            api_url: Optional[str] = None) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.api_url = api_url
+        self.hedges = 0
+        self.requests = 0
+        self._latencies: deque = deque(maxlen=sample_size)
+        # A token bucket refilled by requests only, so hedges stay below max_hedge_ratio
+        self._budget = RetryBudget(max_hedge_ratio, min_per_second=0, max_tokens=1 if max_hedge_ratio > 0 else 0)
+        self._lock = threading.Lock()
+
+    def get_delay(self) -> float:
+        """
+        Seconds to wait for a response before hedging.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            delay = latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def start(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self.requests += 1
+        self._budget.deposit()
+
+    def try_hedge(self) -> bool:
+        """
+        Take a hedge from the budget.
+
+        Returns:
+            bool: Whether a hedge may be sent
+        """
+        if not self._budget.withdraw():
+            return False
+        with self._lock:
+            self.hedges += 1
+        return True
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a successful request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+class DeadlineExceededError(TimeoutError):
+    """
+    A call did not finish within its deadline.
+
+    Attributes:
+        job_id (Optional[str]): The job the call started, if it got that far
+    """
+    def __init__(self, message: str = 'Deadline exceeded', job_id: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.job_id = job_id
+
+# Monotonic time by which the current call must finish, set by _deadline_scope()
+_deadline: 'contextvars.ContextVar[Optional[float]]' = contextvars.ContextVar('firecrawl_deadline', default=None)
+
+@contextmanager
+def _deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Bound every request and wait made in the block to `seconds` from now, or to
+    the enclosing deadline if that is sooner. Nothing changes if `seconds` is None.
+    """
+    if seconds is None:
+        yield
+        return
+    stop_at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(stop_at if current is None else min(current, stop_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def _time_left() -> Optional[float]:
+    """
+    Seconds left before the current deadline, or None if there is no deadline.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    stop_at = _deadline.get()
+    if stop_at is None:
+        return None
+    remaining = stop_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError()
+    return remaining
+
+def _deadline_passed() -> bool:
+    stop_at = _deadline.get()
+    return stop_at is not None and time.monotonic() >= stop_at
+
+def _sleep(seconds: float) -> None:
+    """Sleep, waking early at the current deadline."""
+    remaining = _time_left()
+    time.sleep(seconds if remaining is None else min(seconds, remaining))
+
+async def _async_sleep(seconds: float) -> None:
+    """Sleep, waking early at the current deadline."""
+    remaining = _time_left()
+    await asyncio.sleep(seconds if remaining is None else min(seconds, remaining))
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of a client.
+
+    Without a transport, FirecrawlApp sends requests on a pooled requests.Session and
+    AsyncFirecrawlApp on an aiohttp session. Subclass Transport to use another HTTP library.
+
+    request() returns a response like requests.Response, with `status_code`, `headers`,
+    `text` and `json()`, and raises requests.exceptions.ConnectionError or Timeout when
+    no response arrives. async_request() returns an async context manager for a response
+    like aiohttp's, with `status`, `headers` and a coroutine `json()`, and raises
+    aiohttp.ClientConnectionError or asyncio.TimeoutError when no response arrives.
+
+    A transport may be shared by several clients, and clients don't close it.
+    """
+    @abstractmethod
+    def request(
+            self,
+            method: str,
+            url: str,
+            *,
+            headers: Dict[str, str],
+            json: Optional[Any] = None,
+            timeout: Optional[Tuple[float, Optional[float]]] = None) -> Any:
+        """
+        Send a request.
+
+        Args:
+            method (str): The HTTP method ('GET', 'POST' or 'DELETE')
+            url (str): The URL to send the request to
+            headers (Dict[str, str]): Headers to include in the request
+            json (Optional[Any]): Data to send as the JSON body
+            timeout (Optional[Tuple[float, Optional[float]]]): Connect and read timeouts in seconds
+
+        Returns:
+            Any: The response
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def async_request(
+            self,
+            method: str,
+            url: str,
+            *,
+            headers: Dict[str, str],
+            json: Optional[Any] = None,
+            timeout: Optional[aiohttp.ClientTimeout] = None) -> AsyncContextManager[Any]:
+        """
+        Send a request from an event loop.
+
+        Args:
+            method (str): The HTTP method ('GET', 'POST' or 'DELETE')
+            url (str): The URL to send the request to
+            headers (Dict[str, str]): Headers to include in the request
+            json (Optional[Any]): Data to send as the JSON body
+            timeout (Optional[aiohttp.ClientTimeout]): Connect, read and total timeouts
+
+        Returns:
+            AsyncContextManager: Yields the response
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the connections used by request()."""
+
+    async def aclose(self) -> None:
+        """Release the connections used by async_request()."""
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'Transport':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+class HTTPXTransport(Transport):
+    """
+    Transport using httpx, which can multiplex all requests to the API over a few
+    HTTP/2 connections instead of one connection per concurrent request.
+
+    Requires httpx with HTTP/2 support (`pip install firecrawl-py[http2]`). With
+    `http2`, HTTP/2 is negotiated on https URLs; pass `http1=False` to use HTTP/2
+    on plain http URLs too, as with a self-hosted API.
+
+    httpx's sync HTTP/2 connections can't be shared between threads, so requests
+    made with request() are sent from a background event loop, where the requests
+    of all threads share the same connections.
+
+    Attributes:
+        http2 (bool): Whether to use HTTP/2
+        max_connections (int): Maximum simultaneous connections
+        client_kwargs (Dict[str, Any]): Other arguments for httpx.Client and httpx.AsyncClient
+    """
+    def __init__(self, *, http2: bool = True, max_connections: int = 10, **client_kwargs) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("HTTPXTransport requires httpx: pip install 'firecrawl-py[http2]'") from None
+        self._httpx = httpx
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.client_kwargs = client_kwargs
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._async_client = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _create_client(self) -> Any:
+        return self._httpx.AsyncClient(
+            http2=self.http2,
+            limits=self._httpx.Limits(
+                max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            **self.client_kwargs
+        )
+
+    def _get_loop(self) -> Tuple[asyncio.AbstractEventLoop, Any]:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever, name='firecrawl-httpx', daemon=True)
+                self._loop_thread.start()
+                self._client = self._create_client()
+            return self._loop, self._client
+
+    def _get_async_client(self) -> Any:
+        # An async client is bound to the loop it was created on
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = self._create_client()
+            self._async_client_loop = loop
+        return self._async_client
+
+    @staticmethod
+    def _encode(body: Optional[Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Encode a JSON request body with the JSON codec, returning the body and headers
+        as httpx keyword arguments.
+        """
+        if body is None:
+            return {'headers': headers}
+        if not any(name.lower() == 'content-type' for name in headers):
+            headers = {**headers, 'Content-Type': 'application/json'}
+        return {'content': _json_codec.dumps(body), 'headers': headers}
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            *,
+            headers: Dict[str, str],
+            json: Optional[Any] = None,
+            timeout: Optional[Tuple[float, Optional[float]]] = None) -> Any:
+        # httpx's read timeout only bounds the gaps between reads, so the wait for
+        # the response as a whole is bounded by the deadline and both timeouts
+        wait = _time_left()
+        if timeout is not None and timeout[1] is not None:
+            wait = sum(timeout) if wait is None else min(wait, sum(timeout))
+        if timeout is not None:
+            timeout = self._httpx.Timeout(timeout[1], connect=timeout[0])
+        loop, client = self._get_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            client.request(method, url, timeout=timeout, **self._encode(json, headers)), loop)
+        try:
+            return future.result(timeout=wait)
+        except FutureTimeoutError as e:
+            future.cancel()
+            raise requests.exceptions.Timeout(f'No response to {method.upper()} {url} within {wait:.2f}s') from e
+        except self._httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    @asynccontextmanager
+    async def async_request(
+            self,
+            method: str,
+            url: str,
+            *,
+            headers: Dict[str, str],
+            json: Optional[Any] = None,
+            timeout: Optional[aiohttp.ClientTimeout] = None) -> AsyncIterator[Any]:
+        request = self._get_async_client().request(
+            method, url, **self._encode(json, headers),
+            timeout=(self._httpx.Timeout(timeout.sock_read, connect=timeout.sock_connect)
+                     if timeout is not None else None))
+        try:
+            if timeout is not None and timeout.total is not None:
+                response = await asyncio.wait_for(request, timeout.total)
+            else:
+                response = await request
+        except self._httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise aiohttp.ClientConnectionError(str(e)) from e
+        yield _HTTPXAsyncResponse(response)
+
+    def close(self) -> None:
+        with self._lock:
+            loop, client, thread = self._loop, self._client, self._loop_thread
+            self._loop = self._client = self._loop_thread = None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def aclose(self) -> None:
+        client, self._async_client = self._async_client, None
+        self._async_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+class _HTTPXAsyncResponse:
+    """An httpx response with the interface of an aiohttp response."""
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+
+    async def json(self, loads: Callable[[Union[bytes, str]], Any] = json.loads) -> Any:
+        return loads(self._response.content)
+
+    async def text(self) -> str:
+        return self._response.text
+
+class FirecrawlApp:
+    def __init__(
+            self,
+            api_key: Optional[str] = None,
+            api_url: Optional[str] = None,
+            *,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            polling_strategy: Optional[PollingStrategy] = None,
+            concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            auto_idempotency_keys: bool = True,
+            circuit_breakers: Optional[CircuitBreakers] = None,
+            hedging: Optional[HedgingPolicy] = None,
+            connect_timeout: float = 10,
+            read_timeout: Optional[float] = 120,
+            transport: Optional[Transport] = None,
+            validate_responses: bool = True) -> None:
+        """
+        Initialize the FirecrawlApp instance with API key, API URL.
+
+        The instance owns a pooled HTTP session that is created on first use and
+        shared by every request, so connections (and TLS sessions) are reused
+        across calls and pagination hops. A single instance may be shared by
+        several threads. Call close() or use the instance as a context manager
+        to release the pooled connections.
+
+        Args:
+            api_key (Optional[str]): API key for authenticating with the Firecrawl API.
+            api_url (Optional[str]): Base URL for the Firecrawl API.
+            pool_connections (int): Number of per-host connection pools to cache (default: 10)
+            pool_maxsize (int): Maximum connections kept open per host (default: 10)
+            pool_block (bool): Block when all connections to a host are busy instead of opening extra ones (default:
+                False)
+            keep_alive (bool): Keep connections open between requests (default: True)
+            polling_strategy (Optional[PollingStrategy]): How long waiters pause between job status checks (default:
+                ProgressPolling())
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Limiter every request waits on, which may be
+                shared with other clients (default: no limit)
+            retry_policy (Optional[RetryPolicy]): When failed requests are sent again (default: RetryPolicy())
+            auto_idempotency_keys (bool): Give crawl and batch scrape submissions an idempotency key when none is
+                passed, so they can be retried after network errors (default: True)
+            circuit_breakers (Optional[CircuitBreakers]): Breakers that fail requests fast while an endpoint family is
+                failing, which may be shared with other clients (default: none)
+            hedging (Optional[HedgingPolicy]): Hedge slow scrape_url requests with a duplicate request (default: no
+                hedging)
+            connect_timeout (float): Seconds to wait for a connection to the API (default: 10)
+            read_timeout (Optional[float]): Seconds to wait for the API to respond, None for no limit; scrapes wait for
+                their own `timeout` plus 5 seconds instead (default: 120)
+            transport (Optional[Transport]): Sends the requests instead of the pooled session, e.g. HTTPXTransport() for
+                HTTP/2; the pool settings then don't apply (default: none)
+            validate_responses (bool): Validate every crawl and batch scrape document; False trusts the API and builds
+                documents without validation, validating nested models on first access. Requires pydantic 2 (default:
+                True)
+        """
+        self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
+        self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
+        
+        # Only require API key when using cloud service
+        if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
+            logger.warning("No API key provided for cloud service")
+            raise ValueError('No API key provided')
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self.polling_strategy = polling_strategy or ProgressPolling()
+        self.concurrency_limiter = concurrency_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.auto_idempotency_keys = auto_idempotency_keys
+        self.circuit_breakers = circuit_breakers
+        self.hedging = hedging
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.transport = transport
+        if not validate_responses and not hasattr(pydantic, 'TypeAdapter'):
+            raise ValueError('validate_responses=False requires pydantic 2')
+        self.validate_responses = validate_responses
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+            
+        logger.debug(f"Initialized FirecrawlApp with API URL: {self.api_url}")
+
+    def __enter__(self) -> 'FirecrawlApp':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session and release its connections.
+
+        The session is recreated transparently if the instance is used again.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+            executor, self._hedge_executor = self._hedge_executor, None
+        if session is not None:
+            session.close()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def scrape_url(
+            self,
+            url: str,
+            *,
+            formats: Optional[List[Literal["markdown", "html", "rawHtml", "content", "links", "screenshot", "screenshot@fullPage", "extract", "json", "changeTracking"]]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            include_tags: Optional[List[str]] = None,
+            exclude_tags: Optional[List[str]] = None,
+            only_main_content: Optional[bool] = None,
+            wait_for: Optional[int] = None,
+            timeout: Optional[int] = None,
+            location: Optional[LocationConfig] = None,
+            mobile: Optional[bool] = None,
+            skip_tls_verification: Optional[bool] = None,
+            remove_base64_images: Optional[bool] = None,
+            block_ads: Optional[bool] = None,
+            proxy: Optional[Literal["basic", "stealth", "auto"]] = None,
+            parse_pdf: Optional[bool] = None,
+            extract: Optional[JsonConfig] = None,
+            json_options: Optional[JsonConfig] = None,
+            actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
+            change_tracking_options: Optional[ChangeTrackingOptions] = None,
+            max_age: Optional[int] = None,
+            store_in_cache: Optional[bool] = None,
+            zero_data_retention: Optional[bool] = None,
+            hedging: Optional[HedgingPolicy] = None,
+            **kwargs) -> ScrapeResponse[Any]:
+        """
+        Scrape and extract content from a URL.
+
+        Args:
+          url (str): Target URL to scrape
+          formats (Optional[List[Literal["markdown", "html", "rawHtml", "content", "links", "screenshot", "screenshot@fullPage", "extract", "json"]]]): Content types to retrieve (markdown/html/etc)
+          headers (Optional[Dict[str, str]]): Custom HTTP headers
+          include_tags (Optional[List[str]]): HTML tags to include
+          exclude_tags (Optional[List[str]]): HTML tags to exclude
+          only_main_content (Optional[bool]): Extract main content only
+          wait_for (Optional[int]): Wait for a specific element to appear
+          timeout (Optional[int]): Request timeout (ms)
+          location (Optional[LocationConfig]): Location configuration
+          mobile (Optional[bool]): Use mobile user agent
+          skip_tls_verification (Optional[bool]): Skip TLS verification
+          remove_base64_images (Optional[bool]): Remove base64 images
+          block_ads (Optional[bool]): Block ads
+          proxy (Optional[Literal["basic", "stealth", "auto"]]): Proxy type (basic/stealth)
+          extract (Optional[JsonConfig]): Content extraction settings
+          json_options (Optional[JsonConfig]): JSON extraction settings
+          actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]]): Actions to perform
+          change_tracking_options (Optional[ChangeTrackingOptions]): Change tracking settings
+          zero_data_retention (Optional[bool]): Whether to delete data after scrape is done
+          hedging (Optional[HedgingPolicy]): Send a duplicate request if this one is slow (default: the client's
+              hedging)
+
+
+        Returns:
+          ScrapeResponse with:
+          * Requested content formats
+          * Page metadata
+          * Extraction results
+          * Success/error status
+
+        Raises:
+          Exception: If scraping fails
+        """
+        _headers = self._prepare_headers()
 
         # Build scrape parameters
         scrape_params = {
@@ -586,16 +2894,18 @@ class FirecrawlApp:
             scrape_params['jsonOptions']['schema'] = self._ensure_schema_dict(scrape_params['jsonOptions']['schema'])
 
         # Make request
-        response = requests.post(
-            f'{self.api_url}/v1/scrape',
+        response = self._hedged_request(
+            hedging or self.hedging,
+            'post',
+            '/v1/scrape',
             headers=_headers,
             json=scrape_params,
-            timeout=(timeout + 5000 if timeout else None)
+            server_timeout=timeout
         )
 
         if response.status_code == 200:
             try:
-                response_json = response.json()
+                response_json = _response_json(response)
                 if response_json.get('success') and 'data' in response_json:
                     return ScrapeResponse(**response_json['data'])
                 elif "error" in response_json:
@@ -607,6 +2917,87 @@ class FirecrawlApp:
         else:
             self._handle_error(response, 'scrape URL')
 
+    def scrape_many(
+            self,
+            urls: List[str],
+            *,
+            max_workers: Optional[int] = None,
+            ordered: bool = False,
+            deadline: Optional[float] = None,
+            **scrape_options) -> Iterator[ScrapeManyResult]:
+        """
+        Scrape many URLs concurrently on a thread pool.
+
+        A URL that fails to scrape yields an unsuccessful result with its error
+        instead of stopping the others.
+
+        Args:
+            urls (List[str]): URLs to scrape
+            max_workers (Optional[int]): Number of concurrent scrapes (default: the client's pool_maxsize)
+            ordered (bool): Yield results in the order of `urls` instead of as they complete (default: False)
+            deadline (Optional[float]): Seconds after which the remaining URLs are given up on and yielded as failed;
+                the requests of scrapes in flight are bounded by it too
+            **scrape_options: Options passed to scrape_url for every URL
+
+        Returns:
+            Iterator[ScrapeManyResult]: One result per URL, with its index in `urls`
+        """
+        urls = list(urls)
+        stop_at = time.monotonic() + deadline if deadline is not None else None
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.pool_maxsize, thread_name_prefix='firecrawl-scrape')
+        # Every scrape runs in a copy of the caller's context, keeping any enclosing deadline
+        futures = [
+            executor.submit(contextvars.copy_context().run, self._scrape_one, index, url, stop_at, scrape_options)
+            for index, url in enumerate(urls)]
+
+        def remaining() -> Optional[float]:
+            return max(0, stop_at - time.monotonic()) if stop_at is not None else None
+
+        try:
+            if ordered:
+                for index, future in enumerate(futures):
+                    try:
+                        yield future.result(timeout=remaining())
+                    except FutureTimeoutError:
+                        yield self._scrape_expired(index, urls[index])
+            else:
+                pending = dict(zip(futures, range(len(futures))))
+                try:
+                    for future in as_completed(futures, timeout=remaining()):
+                        yield future.result()
+                        del pending[future]
+                except FutureTimeoutError:
+                    for future, index in pending.items():
+                        yield future.result() if future.done() else self._scrape_expired(index, urls[index])
+        finally:
+            # Scrapes in flight can't be interrupted, but end by the deadline
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _scrape_one(
+            self,
+            index: int,
+            url: str,
+            stop_at: Optional[float],
+            scrape_options: Dict[str, Any]) -> ScrapeManyResult:
+        """
+        Scrape one URL of scrape_many, capturing its error.
+        """
+        if stop_at is not None and time.monotonic() >= stop_at:
+            return self._scrape_expired(index, url)
+        try:
+            with _deadline_scope(stop_at - time.monotonic() if stop_at is not None else None):
+                return ScrapeManyResult(index=index, url=url, data=self.scrape_url(url, **scrape_options))
+        except Exception as e:
+            return ScrapeManyResult(index=index, url=url, success=False, error=str(e))
+
+    @staticmethod
+    def _scrape_expired(index: int, url: str) -> ScrapeManyResult:
+        return ScrapeManyResult(
+            index=index, url=url, success=False, error='Deadline exceeded before the URL was scraped')
+
     def search(
             self,
             query: str,
@@ -682,7 +3073,8 @@ class FirecrawlApp:
             params_dict['integration'] = _integration
 
         # Make request
-        response = requests.post(
+        response = self._request(
+            'post',
             f"{self.api_url}/v1/search",
             headers={"Authorization": f"Bearer {self.api_key}"},
             json=params_dict
@@ -690,7 +3082,7 @@ class FirecrawlApp:
 
         if response.status_code == 200:
             try:
-                response_json = response.json()
+                response_json = _response_json(response)
                 if response_json.get('success') and 'data' in response_json:
                     return SearchResponse(**response_json)
                 elif "error" in response_json:
@@ -724,10 +3116,14 @@ class FirecrawlApp:
         allow_subdomains: Optional[bool] = None,
         max_concurrency: Optional[int] = None,
         zero_data_retention: Optional[bool] = None,
-        poll_interval: Optional[int] = 2,
+        poll_interval: Optional[Union[float, PollingStrategy]] = None,
+        on_document: Optional[Callable[[FirecrawlDocument], Any]] = None,
+        result_sink: Optional[Union[ResultSink, str]] = None,
+        webhook_receiver: Optional[WebhookReceiver] = None,
         idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> CrawlStatusResponse:
+    ) -> Union[CrawlStatusResponse, ResultSink]:
         """
         Crawl a website starting from a URL.
 
@@ -751,8 +3147,17 @@ class FirecrawlApp:
             allow_subdomains (Optional[bool]): Follow subdomains
             max_concurrency (Optional[int]): Maximum number of concurrent scrapes
             zero_data_retention (Optional[bool]): Whether to delete data after 24 hours
-            poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            on_document (Optional[Callable]): Called with each document as soon as it is scraped, while the job is still
+                running
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents to this sink, or to a new sink for a
+                file path, as they arrive, and return the sink instead of the results
+            webhook_receiver (Optional[WebhookReceiver]): Wait for the job's webhook events on this receiver instead of
+                polling
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            deadline (Optional[float]): Seconds the whole call may take, including starting the job, waiting for it and
+                fetching its results; the job is cancelled when the deadline passes
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -763,6 +3168,7 @@ class FirecrawlApp:
 
         Raises:
             Exception: If crawl fails
+            DeadlineExceededError: If the deadline passes first
         """
         # Validate any additional kwargs
         self._validate_kwargs(kwargs, "crawl_url")
@@ -790,6 +3196,8 @@ class FirecrawlApp:
             crawl_params['ignoreSitemap'] = ignore_sitemap
         if scrape_options is not None:
             crawl_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+        if webhook is None and webhook_receiver is not None:
+            webhook = webhook_receiver.webhook_config()
         if webhook is not None:
             crawl_params['webhook'] = webhook
         if deduplicate_similar_urls is not None:
@@ -820,17 +3228,30 @@ class FirecrawlApp:
             params_dict['integration'] = _integration
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/crawl', params_dict, headers)
+        with _deadline_scope(deadline):
+            if webhook_receiver is not None:
+                _check_event_timeout(webhook_receiver)
+            headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
+            response = self._post_request(f'{self.api_url}/v1/crawl', params_dict, headers)
 
-        if response.status_code == 200:
-            try:
-                id = response.json().get('id')
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return self._monitor_job_status(id, headers, poll_interval)
-        else:
-            self._handle_error(response, 'start crawl job')
+            if response.status_code == 200:
+                try:
+                    id = _response_json(response).get('id')
+                except:
+                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                sink = _open_result_sink(result_sink) if result_sink is not None else None
+                if webhook_receiver is not None:
+                    return self._wait_within_deadline(
+                        id, lambda: self._wait_for_webhook(
+                            id, webhook_receiver, functools.partial(self.check_crawl_status, result_sink=sink),
+                            lambda on_document: self._monitor_job_status(id, headers, poll_interval, on_document, sink),
+                                on_document),
+                            self.cancel_crawl)
+                return self._wait_within_deadline(
+                    id, lambda: self._monitor_job_status(id, headers, poll_interval, on_document, sink),
+                    self.cancel_crawl)
+            else:
+                self._handle_error(response, 'start crawl job')
 
     def async_crawl_url(
         self,
@@ -945,23 +3366,33 @@ class FirecrawlApp:
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
+        headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
         response = self._post_request(f'{self.api_url}/v1/crawl', params_dict, headers)
 
         if response.status_code == 200:
             try:
-                return CrawlResponse(**response.json())
+                return CrawlResponse(**_response_json(response))
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
             self._handle_error(response, 'start crawl job')
 
-    def check_crawl_status(self, id: str) -> CrawlStatusResponse:
+    def check_crawl_status(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024,
+            result_sink: Optional[Union[ResultSink, str]] = None) -> Union[CrawlStatusResponse, ResultSink]:
         """
         Check the status and results of a crawl job.
 
         Args:
             id: Unique identifier for the crawl job
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents of every page to this sink, or to a new
+                sink for a file path, and return the sink instead
 
         Returns:
             CrawlStatusResponse containing:
@@ -983,38 +3414,26 @@ class FirecrawlApp:
             Exception: If status check fails
         """
         endpoint = f'/v1/crawl/{id}'
+        if result_sink is not None:
+            return self._fill_result_sink(
+                id, f'{self.api_url}{endpoint}', 'check crawl status', result_sink, prefetch, max_prefetch_bytes)
 
         headers = self._prepare_headers()
-        response = self._get_request(f'{self.api_url}{endpoint}', headers)
+        response = self._get_request(self._status_url(f'{self.api_url}{endpoint}', prefetch), headers)
         if response.status_code == 200:
             try:
-                status_data = response.json()
+                status_data = _response_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
                     data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        try:
-                            status_response = self._get_request(next_url, headers)
-                            if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
-                                break
-                            try:
-                                next_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                    try:
+                        for next_data in self._iter_next_pages(status_data, headers, prefetch, max_prefetch_bytes):
                             data.extend(next_data.get('data', []))
                             status_data = next_data
-                        except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
-                            break
+                    except Exception as e:
+                        logger.error(f"Error during pagination request: {e}")
                     status_data['data'] = data
 
             response = {
@@ -1032,13 +3451,78 @@ class FirecrawlApp:
             if 'next' in status_data:
                 response['next'] = status_data['next']
 
-            return CrawlStatusResponse(
-                success=False if 'error' in status_data else True,
+            return self._build_status_response(CrawlStatusResponse, {
+                'success': False if 'error' in status_data else True,
                 **response
-            )
+            })
         else:
             self._handle_error(response, 'check crawl status')
     
+    def iter_crawl_documents(
+            self,
+            id: str,
+            *,
+            wait: bool = False,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> Iterator[FirecrawlDocument]:
+        """
+        Iterate over the documents of a crawl job one results page at a time.
+
+        Unlike check_crawl_status, only the current page is held in memory, and
+        the remaining pages are not fetched if the caller stops iterating early.
+        Without `wait`, the documents available right now are yielded even if the
+        job is still running.
+
+        Args:
+            id (str): Unique identifier for the crawl job
+            wait (bool): Keep polling until the crawl finishes, yielding new documents as they are scraped
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks when waiting, or a
+                PollingStrategy (default: the client's polling_strategy)
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read, ignored when
+                waiting (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+
+        Returns:
+            Iterator[FirecrawlDocument]: The crawled documents, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails, or the crawl fails while waiting
+        """
+        return self._iter_job_documents(
+            f'{self.api_url}/v1/crawl/{id}', 'check crawl status', 'Crawl',
+            wait, poll_interval, prefetch, max_prefetch_bytes)
+
+    def get_crawl_result_set(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> CrawlResultSet:
+        """
+        Download the documents of a crawl job into a CrawlResultSet.
+
+        Each results page is added to the set as it arrives, without building a
+        FirecrawlDocument per document, so large jobs take much less memory than
+        with check_crawl_status.
+
+        Args:
+            id (str): Unique identifier for the crawl job
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+
+        Returns:
+            CrawlResultSet: The documents available now, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails
+        """
+        result_set = CrawlResultSet()
+        for status_data in self._iter_status_pages(
+                f'{self.api_url}/v1/crawl/{id}', self._prepare_headers(), 'check crawl status', prefetch, max_prefetch_bytes):
+            result_set.extend(status_data.get('data') or [])
+        return result_set
+
     def check_crawl_errors(self, id: str) -> CrawlErrorsResponse:
         """
         Returns information about crawl errors.
@@ -1062,7 +3546,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}/v1/crawl/{id}/errors', headers)
         if response.status_code == 200:
             try:
-                return CrawlErrorsResponse(**response.json())
+                return CrawlErrorsResponse(**_response_json(response))
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -1087,7 +3571,7 @@ class FirecrawlApp:
         response = self._delete_request(f'{self.api_url}/v1/crawl/{id}', headers)
         if response.status_code == 200:
             try:
-                return response.json()
+                return _response_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -1247,7 +3731,8 @@ class FirecrawlApp:
             params_dict['integration'] = _integration
 
         # Make request
-        response = requests.post(
+        response = self._request(
+            'post',
             f"{self.api_url}/v1/map",
             headers={"Authorization": f"Bearer {self.api_key}"},
             json=params_dict
@@ -1255,7 +3740,7 @@ class FirecrawlApp:
 
         if response.status_code == 200:
             try:
-                response_json = response.json()
+                response_json = _response_json(response)
                 if response_json.get('success') and 'links' in response_json:
                     return MapResponse(**response_json)
                 elif "error" in response_json:
@@ -1288,12 +3773,16 @@ class FirecrawlApp:
         json_options: Optional[JsonConfig] = None,
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
         agent: Optional[AgentOptions] = None,
-        poll_interval: Optional[int] = 2,
+        poll_interval: Optional[Union[float, PollingStrategy]] = None,
+        on_document: Optional[Callable[[FirecrawlDocument], Any]] = None,
+        result_sink: Optional[Union[ResultSink, str]] = None,
+        webhook_receiver: Optional[WebhookReceiver] = None,
         max_concurrency: Optional[int] = None,
         zero_data_retention: Optional[bool] = None,
         idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> BatchScrapeStatusResponse:
+    ) -> Union[BatchScrapeStatusResponse, ResultSink]:
         """
         Batch scrape multiple URLs and monitor until completion.
 
@@ -1317,8 +3806,17 @@ class FirecrawlApp:
             actions (Optional[List[Union]]): Actions to perform
             agent (Optional[AgentOptions]): Agent configuration
             max_concurrency (Optional[int]): Maximum number of concurrent scrapes
-            poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            on_document (Optional[Callable]): Called with each document as soon as it is scraped, while the job is still
+                running
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents to this sink, or to a new sink for a
+                file path, as they arrive, and return the sink instead of the results
+            webhook_receiver (Optional[WebhookReceiver]): Wait for the job's webhook events on this receiver instead of
+                polling
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            deadline (Optional[float]): Seconds the whole call may take, including starting the job, waiting for it and
+                fetching its results; the job is cancelled when the deadline passes
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -1329,6 +3827,7 @@ class FirecrawlApp:
 
         Raises:
             Exception: If batch scrape fails
+            DeadlineExceededError: If the deadline passes first
         """
         # Validate any additional kwargs
         self._validate_kwargs(kwargs, "batch_scrape_urls")
@@ -1388,6 +3887,8 @@ class FirecrawlApp:
         final_params = ScrapeParams(**scrape_params)
         params_dict = final_params.dict(exclude_none=True)
         params_dict['urls'] = urls
+        if webhook_receiver is not None and 'webhook' not in params_dict:
+            params_dict['webhook'] = webhook_receiver.webhook_config().dict(exclude_none=True)
         params_dict['origin'] = f"python-sdk@{version}"
 
         if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
@@ -1396,17 +3897,30 @@ class FirecrawlApp:
             params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
+        with _deadline_scope(deadline):
+            if webhook_receiver is not None:
+                _check_event_timeout(webhook_receiver)
+            headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
+            response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
 
-        if response.status_code == 200:
-            try:
-                id = response.json().get('id')
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return self._monitor_job_status(id, headers, poll_interval)
-        else:
-            self._handle_error(response, 'start batch scrape job')
+            if response.status_code == 200:
+                try:
+                    id = _response_json(response).get('id')
+                except:
+                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                sink = _open_result_sink(result_sink) if result_sink is not None else None
+                if webhook_receiver is not None:
+                    return self._wait_within_deadline(
+                        id, lambda: self._wait_for_webhook(
+                            id, webhook_receiver, functools.partial(self.check_batch_scrape_status, result_sink=sink),
+                            lambda on_document: self._monitor_job_status(id, headers, poll_interval, on_document, sink),
+                                on_document),
+                            self.cancel_batch_scrape)
+                return self._wait_within_deadline(
+                    id, lambda: self._monitor_job_status(id, headers, poll_interval, on_document, sink),
+                    self.cancel_batch_scrape)
+            else:
+                self._handle_error(response, 'start batch scrape job')
 
     def async_batch_scrape_urls(
         self,
@@ -1537,16 +4051,121 @@ class FirecrawlApp:
             params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
+        headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
         response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
 
         if response.status_code == 200:
             try:
-                return BatchScrapeResponse(**response.json())
+                return BatchScrapeResponse(**_response_json(response))
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
             self._handle_error(response, 'start batch scrape job')
+
+    def batch_scrape_urls_sharded(
+            self,
+            urls: List[str],
+            *,
+            chunk_size: int = 1000,
+            max_in_flight_chunks: int = 4,
+            ordered: bool = True,
+            chunk_retries: int = 2,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            on_progress: Optional[Callable[[BatchScrapeProgress], Any]] = None,
+            **scrape_options) -> Iterator[FirecrawlDocument]:
+        """
+        Batch scrape a very large list of URLs as several smaller batch scrape jobs.
+
+        The URLs are split into chunks of `chunk_size`, and up to `max_in_flight_chunks`
+        chunk jobs run at a time. Each job's documents are downloaded once it completes,
+        so memory use is bounded by the chunks in flight rather than by the whole list.
+
+        Args:
+            urls (List[str]): URLs to scrape
+            chunk_size (int): Number of URLs per batch scrape job (default: 1000)
+            max_in_flight_chunks (int): Maximum number of chunk jobs running at a time (default: 4)
+            ordered (bool): Yield documents in the order of `urls` instead of as chunks complete (default: True)
+            chunk_retries (int): Times a failed chunk job is submitted again before giving up (default: 2)
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            on_progress (Optional[Callable[[BatchScrapeProgress], Any]]): Called with the combined progress and credits
+                of all chunks, from a background thread
+            **scrape_options: Scrape options passed to async_batch_scrape_urls for every chunk
+
+        Returns:
+            Iterator[FirecrawlDocument]: The scraped documents. Ordering is best effort within
+            a chunk, as documents are matched to their URL by metadata.sourceURL
+
+        Raises:
+            ValueError: If chunk_size or max_in_flight_chunks is below 1, or an idempotency_key is given
+            IdempotencyConflictError: If a chunk job was most likely started by a submission whose response was lost
+            Exception: If a chunk job still fails after `chunk_retries` retries
+        """
+        if chunk_size < 1 or max_in_flight_chunks < 1:
+            raise ValueError('chunk_size and max_in_flight_chunks must be at least 1')
+        if scrape_options.get('idempotency_key') is not None:
+            raise ValueError('An idempotency_key cannot be shared by the chunk jobs of a sharded batch scrape')
+
+        shards = _BatchScrapeShards(urls, chunk_size, on_progress)
+        monitor = JobMonitor(
+            self, max_concurrency=max_in_flight_chunks, polling_strategy=self._get_polling_strategy(poll_interval))
+        pending: Dict[Future, int] = {}
+        finished: Dict[int, List[FirecrawlDocument]] = {}
+        next_chunk = 0
+        yielded = 0
+
+        def submit(index: int) -> None:
+            # Every attempt to start this chunk's job sends the same key, so a job
+            # created by an attempt whose response was lost is not started twice
+            idempotency_key = self._get_idempotency_key()
+            while True:
+                try:
+                    job = self.async_batch_scrape_urls(
+                        shards.chunks[index], idempotency_key=idempotency_key, **scrape_options)
+                    if not job.success or not job.id:
+                        raise Exception(f'Failed to start batch scrape job. Error: {job.error}')
+                    break
+                except IdempotencyConflictError:
+                    raise
+                except Exception as e:
+                    if not shards.retry(index, e, chunk_retries):
+                        raise
+            shards.started(index, job)
+            future = monitor.watch_batch_scrape(job.id, on_status=lambda status: shards.update(index, status))
+            pending[future] = index
+
+        try:
+            while yielded < len(shards.chunks):
+                # When ordered, completed chunks wait for the earlier ones, so only
+                # submit within a window of the next chunk to yield
+                window = yielded + max_in_flight_chunks if ordered else len(shards.chunks)
+                while len(pending) < max_in_flight_chunks and next_chunk < min(window, len(shards.chunks)):
+                    submit(next_chunk)
+                    next_chunk += 1
+
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        if not shards.retry(index, e, chunk_retries):
+                            raise
+                        submit(index)
+                        continue
+                    shards.completed(index)
+                    finished[index] = shards.sort_documents(index, status.data) if ordered else status.data
+
+                if ordered:
+                    while yielded in finished:
+                        yield from finished.pop(yielded)
+                        yielded += 1
+                else:
+                    for index in list(finished):
+                        yield from finished.pop(index)
+                        yielded += 1
+        finally:
+            monitor.close()
     
     def batch_scrape_urls_and_watch(
         self,
@@ -1673,12 +4292,12 @@ class FirecrawlApp:
             params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
+        headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
         response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
 
         if response.status_code == 200:
             try:
-                crawl_response = BatchScrapeResponse(**response.json())
+                crawl_response = BatchScrapeResponse(**_response_json(response))
                 if crawl_response.success and crawl_response.id:
                     return CrawlWatcher(crawl_response.id, self)
                 else:
@@ -1688,12 +4307,22 @@ class FirecrawlApp:
         else:
             self._handle_error(response, 'start batch scrape job')
     
-    def check_batch_scrape_status(self, id: str) -> BatchScrapeStatusResponse:
+    def check_batch_scrape_status(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024,
+            result_sink: Optional[Union[ResultSink, str]] = None) -> Union[BatchScrapeStatusResponse, ResultSink]:
         """
         Check the status of a batch scrape job using the Firecrawl API.
 
         Args:
             id (str): The ID of the batch scrape job.
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents of every page to this sink, or to a new
+                sink for a file path, and return the sink instead
 
         Returns:
             BatchScrapeStatusResponse: The status of the batch scrape job.
@@ -1702,41 +4331,29 @@ class FirecrawlApp:
             Exception: If the status check request fails.
         """
         endpoint = f'/v1/batch/scrape/{id}'
+        if result_sink is not None:
+            return self._fill_result_sink(
+                id, f'{self.api_url}{endpoint}', 'check batch scrape status', result_sink, prefetch, max_prefetch_bytes)
 
         headers = self._prepare_headers()
-        response = self._get_request(f'{self.api_url}{endpoint}', headers)
+        response = self._get_request(self._status_url(f'{self.api_url}{endpoint}', prefetch), headers)
         if response.status_code == 200:
             try:
-                status_data = response.json()
+                status_data = _response_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
                     data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        try:
-                            status_response = self._get_request(next_url, headers)
-                            if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
-                                break
-                            try:
-                                next_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                    try:
+                        for next_data in self._iter_next_pages(status_data, headers, prefetch, max_prefetch_bytes):
                             data.extend(next_data.get('data', []))
                             status_data = next_data
-                        except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
-                            break
+                    except Exception as e:
+                        logger.error(f"Error during pagination request: {e}")
                     status_data['data'] = data
 
-            return BatchScrapeStatusResponse(**{
+            return self._build_status_response(BatchScrapeStatusResponse, {
                 'success': False if 'error' in status_data else True,
                 'status': status_data.get('status'),
                 'total': status_data.get('total'),
@@ -1750,34 +4367,123 @@ class FirecrawlApp:
         else:
             self._handle_error(response, 'check batch scrape status')
 
+    def iter_batch_scrape_documents(
+            self,
+            id: str,
+            *,
+            wait: bool = False,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> Iterator[FirecrawlDocument]:
+        """
+        Iterate over the documents of a batch scrape job one results page at a time.
+
+        Only the current page is held in memory, and the remaining pages are not
+        fetched if the caller stops iterating early.
+
+        Args:
+            id (str): The ID of the batch scrape job.
+            wait (bool): Keep polling until the job finishes, yielding new documents as they are scraped
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks when waiting, or a
+                PollingStrategy (default: the client's polling_strategy)
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read, ignored when
+                waiting (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+
+        Returns:
+            Iterator[FirecrawlDocument]: The scraped documents, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails, or the job fails while waiting
+        """
+        return self._iter_job_documents(
+            f'{self.api_url}/v1/batch/scrape/{id}', 'check batch scrape status', 'Batch scrape',
+            wait, poll_interval, prefetch, max_prefetch_bytes)
+
+    def get_batch_scrape_result_set(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> CrawlResultSet:
+        """
+        Download the documents of a batch scrape job into a CrawlResultSet.
+
+        Each results page is added to the set as it arrives, without building a
+        FirecrawlDocument per document, so large jobs take much less memory than
+        with check_batch_scrape_status.
+
+        Args:
+            id (str): The ID of the batch scrape job
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+
+        Returns:
+            CrawlResultSet: The documents available now, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails
+        """
+        result_set = CrawlResultSet()
+        for status_data in self._iter_status_pages(
+                f'{self.api_url}/v1/batch/scrape/{id}', self._prepare_headers(), 'check batch scrape status',
+                prefetch, max_prefetch_bytes):
+            result_set.extend(status_data.get('data') or [])
+        return result_set
+
     def check_batch_scrape_errors(self, id: str) -> CrawlErrorsResponse:
         """
-        Returns information about batch scrape errors.
+        Returns information about batch scrape errors.
+
+        Args:
+            id (str): The ID of the crawl job.
+
+        Returns:
+            CrawlErrorsResponse containing:
+            * errors (List[Dict[str, str]]): List of errors with fields:
+              * id (str): Error ID
+              * timestamp (str): When the error occurred
+              * url (str): URL that caused the error
+              * error (str): Error message
+            * robotsBlocked (List[str]): List of URLs blocked by robots.txt
+
+        Raises:
+            Exception: If the error check request fails
+        """
+        headers = self._prepare_headers()
+        response = self._get_request(f'{self.api_url}/v1/batch/scrape/{id}/errors', headers)
+        if response.status_code == 200:
+            try:
+                return CrawlErrorsResponse(**_response_json(response))
+            except:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+        else:
+            self._handle_error(response, "check batch scrape errors")
+
+    def cancel_batch_scrape(self, id: str) -> Dict[str, Any]:
+        """
+        Cancel a batch scrape job.
 
         Args:
-            id (str): The ID of the crawl job.
+            id (str): The ID of the batch scrape job to cancel
 
         Returns:
-            CrawlErrorsResponse containing:
-            * errors (List[Dict[str, str]]): List of errors with fields:
-              * id (str): Error ID
-              * timestamp (str): When the error occurred
-              * url (str): URL that caused the error
-              * error (str): Error message
-            * robotsBlocked (List[str]): List of URLs blocked by robots.txt
+            Dict[str, Any] containing:
+            * success (bool): Whether cancellation was successful
+            * error (str, optional): Error message if cancellation failed
 
         Raises:
-            Exception: If the error check request fails
+            Exception: If cancellation fails
         """
         headers = self._prepare_headers()
-        response = self._get_request(f'{self.api_url}/v1/batch/scrape/{id}/errors', headers)
+        response = self._delete_request(f'{self.api_url}/v1/batch/scrape/{id}', headers)
         if response.status_code == 200:
             try:
-                return CrawlErrorsResponse(**response.json())
+                return _response_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
-            self._handle_error(response, "check batch scrape errors")
+            self._handle_error(response, "cancel batch scrape job")
 
     def extract(
             self,
@@ -1790,6 +4496,8 @@ class FirecrawlApp:
             enable_web_search: Optional[bool] = False,
             show_sources: Optional[bool] = False,
             agent: Optional[Dict[str, Any]] = None,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            deadline: Optional[float] = None,
             **kwargs) -> ExtractResponse[Any]:
         """
         Extract structured information from URLs.
@@ -1803,6 +4511,10 @@ class FirecrawlApp:
             enable_web_search (Optional[bool]): Enable web search
             show_sources (Optional[bool]): Include source URLs
             agent (Optional[Dict[str, Any]]): Agent configuration
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            deadline (Optional[float]): Seconds the whole call may take, including starting the job and waiting for it;
+                extract jobs can't be cancelled, so the job keeps running when the deadline passes
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -1813,6 +4525,7 @@ class FirecrawlApp:
 
         Raises:
             ValueError: If prompt/schema missing or extraction fails
+            DeadlineExceededError: If the deadline passes first
         """
         # Validate any additional kwargs
         self._validate_kwargs(kwargs, "extract")
@@ -1849,46 +4562,56 @@ class FirecrawlApp:
         # Add any additional kwargs
         request_data.update(kwargs)
 
+        job_id = None
         try:
-            # Send the initial extract request
-            response = self._post_request(
-                f'{self.api_url}/v1/extract',
-                request_data,
-                headers
-            )
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                except:
-                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                if data['success']:
-                    job_id = data.get('id')
-                    if not job_id:
-                        raise Exception('Job ID not returned from extract request.')
-
-                    # Poll for the extract status
-                    while True:
-                        status_response = self._get_request(
-                            f'{self.api_url}/v1/extract/{job_id}',
-                            headers
-                        )
-                        if status_response.status_code == 200:
-                            try:
-                                status_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            if status_data['status'] == 'completed':
-                                return ExtractResponse(**status_data)
-                            elif status_data['status'] in ['failed', 'cancelled']:
-                                raise Exception(f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
-                        else:
-                            self._handle_error(status_response, "extract-status")
-
-                        time.sleep(2)  # Polling interval
+            with _deadline_scope(deadline):
+                # Send the initial extract request
+                response = self._post_request(
+                    f'{self.api_url}/v1/extract',
+                    request_data,
+                    headers
+                )
+                if response.status_code == 200:
+                    try:
+                        data = _response_json(response)
+                    except:
+                        raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                    if data['success']:
+                        job_id = data.get('id')
+                        if not job_id:
+                            raise Exception('Job ID not returned from extract request.')
+
+                        # Poll for the extract status
+                        polling = self._get_polling_strategy(poll_interval)
+                        state = PollingState()
+                        while True:
+                            status_response = self._get_request(
+                                f'{self.api_url}/v1/extract/{job_id}',
+                                headers
+                            )
+                            if status_response.status_code == 200:
+                                try:
+                                    status_data = _response_json(status_response)
+                                except:
+                                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                                if status_data['status'] == 'completed':
+                                    return ExtractResponse(**status_data)
+                                elif status_data['status'] in ['failed', 'cancelled']:
+                                    raise Exception(
+                                        f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
+                            else:
+                                self._handle_error(status_response, "extract-status")
+
+                            state.record(status_data)
+                            _sleep(polling.next_interval(state))
+                    else:
+                        raise Exception(f'Failed to extract. Error: {data["error"]}')
                 else:
-                    raise Exception(f'Failed to extract. Error: {data["error"]}')
-            else:
-                self._handle_error(response, "extract")
+                    self._handle_error(response, "extract")
+        except DeadlineExceededError as e:
+            # The API can't cancel extract jobs, so the job is left to finish
+            e.job_id = job_id
+            raise
         except Exception as e:
             raise ValueError(str(e), 500)
 
@@ -1912,7 +4635,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/extract/{job_id}', headers)
             if response.status_code == 200:
                 try:
-                    return ExtractResponse(**response.json())
+                    return ExtractResponse(**_response_json(response))
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -1980,7 +4703,7 @@ class FirecrawlApp:
             response = self._post_request(f'{self.api_url}/v1/extract', request_data, headers)
             if response.status_code == 200:
                 try:
-                    return ExtractResponse(**response.json())
+                    return ExtractResponse(**_response_json(response))
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -1995,7 +4718,8 @@ class FirecrawlApp:
             max_urls: Optional[int] = None,
             show_full_text: Optional[bool] = None,
             cache: Optional[bool] = None,
-            experimental_stream: Optional[bool] = None) -> GenerateLLMsTextStatusResponse:
+            experimental_stream: Optional[bool] = None,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None) -> GenerateLLMsTextStatusResponse:
         """
         Generate LLMs.txt for a given URL and poll until completion.
 
@@ -2005,6 +4729,8 @@ class FirecrawlApp:
             show_full_text (Optional[bool]): Include full text in output (default: False)
             cache (Optional[bool]): Whether to use cached content if available (default: True)
             experimental_stream (Optional[bool]): Enable experimental streaming
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
 
         Returns:
             GenerateLLMsTextStatusResponse with:
@@ -2040,6 +4766,8 @@ class FirecrawlApp:
             )
 
         job_id = response.id
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
         while True:
             status = self.check_generate_llms_text_status(job_id)
             
@@ -2055,7 +4783,8 @@ class FirecrawlApp:
                     expiresAt=''
                 )
 
-            time.sleep(2)  # Polling interval
+            state.record(status)
+            time.sleep(polling.next_interval(state))
 
     def async_generate_llms_text(
             self,
@@ -2097,7 +4826,7 @@ class FirecrawlApp:
 
         try:
             req = self._post_request(f'{self.api_url}/v1/llmstxt', json_data, headers)
-            response = req.json()
+            response = _response_json(req)
             print("json_data", json_data)
             print("response", response)
             if response.get('success'):
@@ -2115,209 +4844,998 @@ class FirecrawlApp:
             error='Internal server error'
         )
 
-    def check_generate_llms_text_status(self, id: str) -> GenerateLLMsTextStatusResponse:
+    def check_generate_llms_text_status(self, id: str) -> GenerateLLMsTextStatusResponse:
+        """
+        Check the status of a LLMs.txt generation operation.
+
+        Args:
+            id (str): The unique identifier of the LLMs.txt generation job to check status for.
+
+        Returns:
+            GenerateLLMsTextStatusResponse: A response containing:
+            * success (bool): Whether the generation was successful
+            * status (str): Status of generation ("processing", "completed", "failed")
+            * data (Dict[str, str], optional): Generated text with fields:
+              * llmstxt (str): Generated LLMs.txt content
+              * llmsfulltxt (str, optional): Full version if requested
+            * error (str, optional): Error message if generation failed
+            * expiresAt (str): When the generated data expires
+
+        Raises:
+            Exception: If the status check fails.
+        """
+        headers = self._prepare_headers()
+        try:
+            response = self._get_request(f'{self.api_url}/v1/llmstxt/{id}', headers)
+            if response.status_code == 200:
+                try:
+                    json_data = _response_json(response)
+                    return GenerateLLMsTextStatusResponse(**json_data)
+                except Exception as e:
+                    raise Exception(f'Failed to parse Firecrawl response as GenerateLLMsTextStatusResponse: {str(e)}')
+            elif response.status_code == 404:
+                raise Exception('LLMs.txt generation job not found')
+            else:
+                self._handle_error(response, 'check LLMs.txt generation status')
+        except Exception as e:
+            raise ValueError(str(e))
+
+        return GenerateLLMsTextStatusResponse(success=False, error='Internal server error', status='failed', expiresAt='')
+
+    def _prepare_headers(
+            self,
+            idempotency_key: Optional[str] = None) -> Dict[str, str]:
+        """
+        Prepare the headers for API requests.
+
+        Args:
+            idempotency_key (Optional[str]): A unique key to ensure idempotency of requests.
+
+        Returns:
+            Dict[str, str]: The headers including content type, authorization, and optionally idempotency key.
+        """
+        if idempotency_key:
+            try:
+                uuid.UUID(idempotency_key)
+            except ValueError:
+                raise ValueError(f'Idempotency keys must be UUIDs, got {idempotency_key!r}')
+            return {
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {self.api_key}',
+                'x-idempotency-key': idempotency_key
+            }
+
+        return {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}',
+        }
+
+    def _get_idempotency_key(self, idempotency_key: Optional[str] = None) -> Optional[str]:
+        """
+        Return the idempotency key for a job submission: the caller's, or a new one
+        when auto_idempotency_keys is enabled.
+
+        The key is created once per submission and sent with every retry of it.
+        """
+        if idempotency_key or not self.auto_idempotency_keys:
+            return idempotency_key
+        return str(uuid.uuid4())
+
+    def _get_polling_strategy(self, poll_interval: Optional[Union[float, PollingStrategy]]) -> PollingStrategy:
+        """
+        Resolve the poll_interval argument of a waiter to a polling strategy.
+
+        Args:
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, a strategy, or None
+                for the client's strategy
+
+        Returns:
+            PollingStrategy: The strategy to use
+        """
+        if poll_interval is None:
+            return self.polling_strategy
+        if isinstance(poll_interval, PollingStrategy):
+            return poll_interval
+        return FixedPolling(poll_interval)
+
+    def _get_session(self) -> requests.Session:
+        """
+        Return the pooled HTTP session, creating it on first use.
+
+        Returns:
+            requests.Session: The session shared by all requests of this instance.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    def _create_session(self) -> requests.Session:
+        """
+        Build a requests.Session with a connection pool sized from the instance settings.
+
+        Returns:
+            requests.Session: A new session with HTTP and HTTPS adapters mounted.
+        """
+        session = _CodecSession()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def _send(self, method: str, url: str, server_timeout: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        Send a request on the pooled session, through the circuit breaker of its endpoint
+        family and holding a slot of the concurrency limiter, when they are set.
+
+        The connect and read timeouts are set from the client settings, and shortened
+        to the time left before the current deadline.
+
+        Args:
+            method (str): The session method to call ('get', 'post' or 'delete').
+            url (str): The URL to send the request to.
+            server_timeout (Optional[int]): Milliseconds the API may spend on the request, when the request sets one.
+            **kwargs: Arguments passed to the session method.
+
+        Returns:
+            requests.Response: The response.
+
+        Raises:
+            CircuitBreakerOpenError: If the endpoint family's circuit breaker is open.
+            DeadlineExceededError: If the current deadline passes before the response arrives.
+        """
+        try:
+            return self._send_within_limits(method, url, server_timeout, **kwargs)
+        except requests.exceptions.Timeout as e:
+            if _deadline_passed():
+                raise DeadlineExceededError(f'Deadline exceeded during {method.upper()} {url}') from e
+            raise
+
+    def _send_http(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.transport is not None:
+            return self.transport.request(method.upper(), url, **kwargs)
+        return getattr(self._get_session(), method)(url, **kwargs)
+
+    def _get_timeout(self, server_timeout: Optional[int] = None) -> Tuple[float, Optional[float]]:
+        """
+        Return the (connect, read) timeouts in seconds for a request.
+
+        Args:
+            server_timeout (Optional[int]): Milliseconds the API may spend on the request, if it sets one.
+
+        Returns:
+            Tuple[float, Optional[float]]: The connect and read timeouts, within the current deadline.
+
+        Raises:
+            DeadlineExceededError: If the current deadline has passed.
+        """
+        read = self.read_timeout if server_timeout is None else server_timeout / 1000 + 5
+        remaining = _time_left()
+        if remaining is None:
+            return (self.connect_timeout, read)
+        return (min(self.connect_timeout, remaining), remaining if read is None else min(read, remaining))
+
+    def _send_within_limits(self, method: str, url: str, server_timeout: Optional[int], **kwargs) -> requests.Response:
+        limiter = self.concurrency_limiter
+        breaker = self.circuit_breakers.for_url(url) if self.circuit_breakers is not None else None
+        if limiter is None and breaker is None:
+            return self._send_http(method, url, timeout=self._get_timeout(server_timeout), **kwargs)
+
+        # Take the limiter's slot before the breaker's, so a wait that fails holds no trial call
+        if limiter is not None and not limiter.acquire(_time_left()):
+            raise DeadlineExceededError(f'Deadline exceeded waiting to send {method.upper()} {url}')
+        if breaker is not None:
+            try:
+                breaker.before_call()
+            except CircuitBreakerOpenError:
+                if limiter is not None:
+                    limiter.release()
+                raise
+        try:
+            kwargs['timeout'] = self._get_timeout(server_timeout)
+        except DeadlineExceededError:
+            if limiter is not None:
+                limiter.release()
+            if breaker is not None:
+                breaker.cancel_call()
+            raise
+        start = time.monotonic()
+        response = None
+        try:
+            response = self._send_http(method, url, **kwargs)
+            return response
+        finally:
+            latency = time.monotonic() - start
+            if limiter is not None:
+                if response is None:
+                    limiter.release()
+                else:
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    limiter.release(response.status_code, latency, retry_after)
+            if breaker is not None:
+                if response is None and _deadline_passed():
+                    # Cut short by the caller's deadline, which says nothing about the API's health
+                    breaker.cancel_call()
+                else:
+                    breaker.after_call(response is None or response.status_code >= 500, latency)
+
+    def _request(
+            self,
+            method: str,
+            url: str,
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None,
+            **kwargs) -> requests.Response:
+        """
+        Send a request, retrying it as the client's retry policy allows.
+
+        Args:
+            method (str): The session method to call ('get', 'post' or 'delete').
+            url (str): The URL to send the request to.
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
+            **kwargs: Arguments passed to _send().
+
+        Returns:
+            requests.Response: The last response received.
+
+        Raises:
+            requests.RequestException: If the last attempt fails without a response.
+            DeadlineExceededError: If the current deadline passes before a response that isn't retried.
+        """
+        policy = self._get_retry_policy(retries, backoff_factor)
+        state = policy.start()
+        idempotency_key = (kwargs.get('headers') or {}).get('x-idempotency-key') if method == 'post' else None
+        idempotent = method != 'post' or idempotency_key is not None
+        while True:
+            try:
+                response = self._send(method, url, **kwargs)
+            except DeadlineExceededError:
+                raise
+            except Exception as e:
+                delay = policy.next_delay(state, idempotent, exception=e)
+                if delay is None:
+                    raise
+                logger.debug(f"{method.upper()} {url} failed, retrying in {delay:.2f}s: {e}")
+            else:
+                if response.status_code == 409 and idempotency_key is not None:
+                    raise IdempotencyConflictError(idempotency_key, response=response)
+                delay = policy.next_delay(
+                    state, idempotent, response.status_code,
+                    retry_after=_parse_retry_after(response.headers.get('Retry-After')))
+                if delay is None:
+                    return response
+                logger.debug(f"{method.upper()} {url} returned {response.status_code}, retrying in {delay:.2f}s")
+            remaining = _time_left()
+            if remaining is not None and delay >= remaining:
+                raise DeadlineExceededError(f'Deadline exceeded before {method.upper()} {url} could be retried')
+            time.sleep(delay)
+
+    def _hedged_request(self, hedging: Optional[HedgingPolicy], method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Send a request and, if it is still outstanding after the hedging policy's delay,
+        a duplicate of it. The first successful response is returned.
+
+        The slower copy can't be interrupted, so it finishes in the background and its
+        response is discarded. Both copies run in the caller's context, so they keep to
+        its deadline.
+
+        Args:
+            hedging (Optional[HedgingPolicy]): The hedging policy, or None to send a single request.
+            method (str): The session method to call ('get', 'post' or 'delete').
+            path (str): The API path to send the request to.
+            **kwargs: Arguments passed to _request().
+
+        Returns:
+            requests.Response: The first successful response, or the last failed one.
+
+        Raises:
+            DeadlineExceededError: If the current deadline passes before a response.
+        """
+        if hedging is None:
+            return self._request(method, f'{self.api_url}{path}', **kwargs)
+
+        hedging.start()
+        start = time.monotonic()
+        executor = self._get_hedge_executor()
+        # Each copy runs in its own copy of the context, which carries the deadline
+        pending = {executor.submit(
+            contextvars.copy_context().run, self._request, method, f'{self.api_url}{path}', **kwargs)}
+        delay = hedging.get_delay()
+        remaining = _time_left()
+        done, _ = wait(pending, timeout=delay if remaining is None else min(delay, remaining))
+        if not done and hedging.try_hedge():
+            logger.debug(f"Hedging {method.upper()} {path} after {time.monotonic() - start:.2f}s")
+            pending.add(executor.submit(
+                contextvars.copy_context().run, self._request, method,
+                f'{hedging.api_url or self.api_url}{path}', **kwargs))
+
+        failed = None
+        while pending:
+            done, pending = wait(pending, timeout=_time_left(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceededError(f'Deadline exceeded waiting for {method.upper()} {path}')
+            for future in done:
+                if future.exception() is None and future.result().status_code < 500:
+                    hedging.record(time.monotonic() - start)
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                failed = future
+        return failed.result()
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._session_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * self.pool_maxsize, thread_name_prefix='firecrawl-hedge')
+            return self._hedge_executor
+
+    def _get_retry_policy(self, retries: Optional[int] = None, backoff_factor: Optional[float] = None) -> RetryPolicy:
+        """
+        Return the client's retry policy, with the attempts and base delay of one request overridden.
+        """
+        if retries is None and backoff_factor is None:
+            return self.retry_policy
+        policy = copy.copy(self.retry_policy)
+        if retries is not None:
+            policy.max_attempts = retries
+        if backoff_factor is not None:
+            policy.base_delay = backoff_factor
+        return policy
+
+    def _post_request(
+            self,
+            url: str,
+            data: Dict[str, Any],
+            headers: Dict[str, str],
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> requests.Response:
+        """
+        Make a POST request with retries.
+
+        Args:
+            url (str): The URL to send the POST request to.
+            data (Dict[str, Any]): The JSON data to include in the POST request.
+            headers (Dict[str, str]): The headers to include in the POST request.
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
+
+        Returns:
+            requests.Response: The response from the POST request.
+
+        Raises:
+            requests.RequestException: If the request fails after the specified retries.
+        """
+        return self._request(
+            'post', url, retries, backoff_factor, headers=headers, json=data, server_timeout=data.get('timeout'))
+
+    def _get_request(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> requests.Response:
+        """
+        Make a GET request with retries.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            headers (Dict[str, str]): The headers to include in the GET request.
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
+
+        Returns:
+            requests.Response: The response from the GET request.
+
+        Raises:
+            requests.RequestException: If the request fails after the specified retries.
+        """
+        return self._request('get', url, retries, backoff_factor, headers=headers)
+    
+    def _delete_request(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> requests.Response:
+        """
+        Make a DELETE request with retries.
+
+        Args:
+            url (str): The URL to send the DELETE request to.
+            headers (Dict[str, str]): The headers to include in the DELETE request.
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
+
+        Returns:
+            requests.Response: The response from the DELETE request.
+
+        Raises:
+            requests.RequestException: If the request fails after the specified retries.
+        """
+        return self._request('delete', url, retries, backoff_factor, headers=headers)
+
+    def _status_url(self, url: str, prefetch: int) -> str:
+        """
+        Return the status URL to request, asking for fixed-size pages when prefetching.
+
+        Args:
+            url (str): The status URL of the job.
+            prefetch (int): Number of pages to prefetch.
+
+        Returns:
+            str: The URL, with a `limit` parameter if pages are prefetched.
+        """
+        if prefetch > 0:
+            return self._set_query_params(url, {'limit': PREFETCH_PAGE_SIZE})
+        return url
+
+    def _set_query_params(self, url: str, params: Dict[str, Any]) -> str:
+        """
+        Set query parameters on a URL, replacing existing values.
+
+        Args:
+            url (str): The URL to update.
+            params (Dict[str, Any]): The query parameters to set.
+
+        Returns:
+            str: The updated URL.
+        """
+        parsed = urlparse(url)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        query.update({k: str(v) for k, v in params.items()})
+        return urlunparse(parsed._replace(query=urlencode(query)))
+
+    def _get_page_urls(self, status_data: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Predict the URLs of the remaining result pages of a completed job.
+
+        Offsets are only predictable when the `next` link carries a fixed page size
+        (`limit`), in which case the remaining pages sit at fixed `skip` offsets up
+        to the number of completed documents.
+
+        Args:
+            status_data (Dict[str, Any]): The last page fetched.
+
+        Returns:
+            Optional[List[str]]: The URLs of the remaining pages, or None if they can't be predicted.
+        """
+        next_url = status_data.get('next')
+        if status_data.get('status') != 'completed' or not next_url or not status_data.get('data'):
+            return None
+        query = parse_qs(urlparse(next_url).query)
+        try:
+            skip = int(query['skip'][0])
+            limit = int(query['limit'][0])
+        except (KeyError, ValueError):
+            return None
+        if limit <= 0:
+            return None
+        return [
+            self._set_query_params(next_url, {'skip': offset, 'limit': limit})
+            for offset in range(skip, status_data.get('completed') or 0, limit)
+        ]
+
+    def _estimate_page_bytes(self, status_data: Dict[str, Any]) -> int:
+        """
+        Estimate the size of a results page from the text fields of its documents.
+
+        Args:
+            status_data (Dict[str, Any]): A page of results.
+
+        Returns:
+            int: The approximate number of bytes the page occupies.
+        """
+        return sum(
+            len(value)
+            for document in status_data.get('data') or []
+            for value in document.values()
+            if isinstance(value, str)
+        )
+
+    def _fetch_status_page(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
         """
-        Check the status of a LLMs.txt generation operation.
+        Fetch one page of a paginated status response.
 
         Args:
-            id (str): The unique identifier of the LLMs.txt generation job to check status for.
+            url (str): The URL of the page.
+            headers (Dict[str, str]): The headers to include in the request.
 
         Returns:
-            GenerateLLMsTextStatusResponse: A response containing:
-            * success (bool): Whether the generation was successful
-            * status (str): Status of generation ("processing", "completed", "failed")
-            * data (Dict[str, str], optional): Generated text with fields:
-              * llmstxt (str): Generated LLMs.txt content
-              * llmsfulltxt (str, optional): Full version if requested
-            * error (str, optional): Error message if generation failed
-            * expiresAt (str): When the generated data expires
+            Dict[str, Any]: The page, as parsed JSON.
 
         Raises:
-            Exception: If the status check fails.
+            Exception: If the request fails or the response cannot be parsed.
         """
-        headers = self._prepare_headers()
+        response = self._get_request(url, headers)
+        if response.status_code != 200:
+            self._handle_error(response, 'fetch next page')
         try:
-            response = self._get_request(f'{self.api_url}/v1/llmstxt/{id}', headers)
-            if response.status_code == 200:
-                try:
-                    json_data = response.json()
-                    return GenerateLLMsTextStatusResponse(**json_data)
-                except Exception as e:
-                    raise Exception(f'Failed to parse Firecrawl response as GenerateLLMsTextStatusResponse: {str(e)}')
-            elif response.status_code == 404:
-                raise Exception('LLMs.txt generation job not found')
-            else:
-                self._handle_error(response, 'check LLMs.txt generation status')
-        except Exception as e:
-            raise ValueError(str(e))
-
-        return GenerateLLMsTextStatusResponse(success=False, error='Internal server error', status='failed', expiresAt='')
+            return _response_json(response)
+        except:
+            raise Exception(f'Failed to parse Firecrawl response as JSON.')
 
-    def _prepare_headers(
+    def _iter_next_pages(
             self,
-            idempotency_key: Optional[str] = None) -> Dict[str, str]:
+            status_data: Dict[str, Any],
+            headers: Dict[str, str],
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> Iterator[Dict[str, Any]]:
         """
-        Prepare the headers for API requests.
+        Follow the `next` links of a paginated status response.
+
+        With `prefetch`, the remaining pages of a completed job are requested
+        concurrently when their offsets are predictable, and yielded in order.
 
         Args:
-            idempotency_key (Optional[str]): A unique key to ensure idempotency of requests.
+            status_data (Dict[str, Any]): The page to start from (not yielded again).
+            headers (Dict[str, str]): The headers to include in the page requests.
+            prefetch (int): Number of pages to fetch ahead of the one being read.
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead.
 
-        Returns:
-            Dict[str, str]: The headers including content type, authorization, and optionally idempotency key.
+        Yields:
+            Dict[str, Any]: Each following page, as parsed JSON.
+
+        Raises:
+            Exception: If a page request fails or cannot be parsed.
         """
-        if idempotency_key:
-            return {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}',
-                'x-idempotency-key': idempotency_key
-            }
+        page_urls = self._get_page_urls(status_data) if prefetch > 0 else None
+        if page_urls is not None:
+            yield from self._iter_prefetched_pages(
+                page_urls, headers, prefetch, max_prefetch_bytes, self._estimate_page_bytes(status_data))
+            return
 
-        return {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.api_key}',
-        }
+        while status_data.get('next') and status_data.get('data'):
+            status_data = self._fetch_status_page(status_data['next'], headers)
+            yield status_data
 
-    def _post_request(
+    def _iter_prefetched_pages(
+            self,
+            page_urls: List[str],
+            headers: Dict[str, str],
+            prefetch: int,
+            max_prefetch_bytes: int,
+            page_bytes: int) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch result pages on a thread pool, keeping a bounded window of pages ahead of the reader.
+
+        The window is the smaller of `prefetch` and the number of pages of the
+        largest size seen so far that fit in `max_prefetch_bytes`.
+
+        Args:
+            page_urls (List[str]): The URLs of the pages, in order.
+            headers (Dict[str, str]): The headers to include in the page requests.
+            prefetch (int): Maximum number of pages fetched ahead.
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead.
+            page_bytes (int): Estimated size of a page.
+
+        Yields:
+            Dict[str, Any]: Each page, in the order of `page_urls`.
+        """
+        remaining = iter(page_urls)
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            while True:
+                window = max(1, min(prefetch, max_prefetch_bytes // max(page_bytes, 1)))
+                while len(pending) < window:
+                    url = next(remaining, None)
+                    if url is None:
+                        break
+                    pending.append(executor.submit(self._fetch_status_page, url, headers))
+                if not pending:
+                    return
+                status_data = pending.popleft().result()
+                page_bytes = max(page_bytes, self._estimate_page_bytes(status_data))
+                yield status_data
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_status_pages(
             self,
             url: str,
-            data: Dict[str, Any],
             headers: Dict[str, str],
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> requests.Response:
+            action: str,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> Iterator[Dict[str, Any]]:
         """
-        Make a POST request with retries.
+        Fetch a status response and yield it followed by each of its `next` pages.
 
         Args:
-            url (str): The URL to send the POST request to.
-            data (Dict[str, Any]): The JSON data to include in the POST request.
-            headers (Dict[str, str]): The headers to include in the POST request.
-            retries (int): Number of retries for the request.
-            backoff_factor (float): Backoff factor for retries.
+            url (str): The status URL of the job.
+            headers (Dict[str, str]): The headers to include in the requests.
+            action (str): Description of the action, used in error messages.
+            prefetch (int): Number of pages to fetch ahead of the one being read.
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead.
+
+        Yields:
+            Dict[str, Any]: Each page, as parsed JSON.
+        """
+        response = self._get_request(self._status_url(url, prefetch), headers)
+        if response.status_code != 200:
+            self._handle_error(response, action)
+        try:
+            status_data = _response_json(response)
+        except:
+            raise Exception(f'Failed to parse Firecrawl response as JSON.')
+        yield status_data
+        yield from self._iter_next_pages(status_data, headers, prefetch, max_prefetch_bytes)
 
-        Returns:
-            requests.Response: The response from the POST request.
+    def _iter_progressive_pages(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            action: str,
+            job_kind: str,
+            poll_interval: Optional[Union[float, PollingStrategy]]) -> Iterator[Dict[str, Any]]:
+        """
+        Poll a job until it finishes, yielding each page of newly scraped documents.
+
+        The `next` link of every response is used as a skip cursor, so each document
+        is downloaded once, as soon as the job has scraped it, instead of all at the end.
+
+        Args:
+            url (str): The status URL of the job.
+            headers (Dict[str, str]): The headers to include in the requests.
+            action (str): Description of the action, used in error messages.
+            job_kind (str): Kind of the job, such as 'Crawl' or 'Batch scrape', used in error messages.
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds to wait when no new documents are
+                available, or a strategy.
+
+        Yields:
+            Dict[str, Any]: Each page, as parsed JSON. The last page carries the final job status.
 
         Raises:
-            requests.RequestException: If the request fails after the specified retries.
+            Exception: If the job fails or is stopped, after its remaining documents are yielded.
         """
-        for attempt in range(retries):
-            response = requests.post(url, headers=headers, json=data, timeout=((data["timeout"] + 5000) if "timeout" in data else None))
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
+        while True:
+            response = self._get_request(url, headers)
+            if response.status_code != 200:
+                self._handle_error(response, action)
+            try:
+                status_data = _response_json(response)
+            except:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+            yield status_data
+
+            if status_data.get('next'):
+                url = status_data['next']
+                if status_data.get('data'):
+                    # More documents are ready, fetch them without waiting
+                    continue
+
+            if status_data['status'] == 'completed':
+                return
+            elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+                state.record(status_data)
+                _sleep(polling.next_interval(state))
             else:
-                return response
-        return response
+                raise Exception(f'{job_kind} job failed or was stopped. Status: {status_data["status"]}')
 
-    def _get_request(
+    def _iter_job_documents(
             self,
             url: str,
-            headers: Dict[str, str],
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> requests.Response:
+            action: str,
+            job_kind: str,
+            wait: bool = False,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> Iterator[FirecrawlDocument]:
         """
-        Make a GET request with retries.
+        Yield the documents of a crawl or batch scrape job, page by page.
 
         Args:
-            url (str): The URL to send the GET request to.
-            headers (Dict[str, str]): The headers to include in the GET request.
-            retries (int): Number of retries for the request.
-            backoff_factor (float): Backoff factor for retries.
+            url (str): The status URL of the job.
+            action (str): Description of the action, used in error messages.
+            job_kind (str): Kind of the job, such as 'Crawl' or 'Batch scrape', used in error messages.
+            wait (bool): Keep polling until the job finishes, yielding documents as they are scraped.
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks when waiting, or a
+                strategy.
+            prefetch (int): Number of pages to fetch ahead of the one being read, ignored when waiting.
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead.
+
+        Yields:
+            FirecrawlDocument: Each document of the job.
+        """
+        headers = self._prepare_headers()
+        if wait:
+            pages = self._iter_progressive_pages(url, headers, action, job_kind, poll_interval)
+        else:
+            pages = self._iter_status_pages(url, headers, action, prefetch, max_prefetch_bytes)
+
+        for status_data in pages:
+            for document in status_data.get('data') or []:
+                yield self._build_document(document)
+
+    def _build_document(self, document: Dict[str, Any]) -> FirecrawlDocument:
+        """
+        Build a document of a crawl or batch scrape job, validating it unless the
+        client trusts responses.
+
+        Args:
+            document (Dict[str, Any]): The document as decoded from the API.
 
         Returns:
-            requests.Response: The response from the GET request.
+            FirecrawlDocument: The document.
+        """
+        if self.validate_responses:
+            return FirecrawlDocument(**document)
+        return _construct_document(document)
 
-        Raises:
-            requests.RequestException: If the request fails after the specified retries.
+    def _build_status_response(self, response_class: Any, status_data: Dict[str, Any]) -> Any:
         """
-        for attempt in range(retries):
-            response = requests.get(url, headers=headers)
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
-                return response
+        Build a crawl or batch scrape status response. When the client trusts
+        responses only the status fields are validated, and the documents are built
+        without validation.
+
+        Args:
+            response_class (Any): CrawlStatusResponse or BatchScrapeStatusResponse.
+            status_data (Dict[str, Any]): The status as decoded from the API, with the documents of every page.
+
+        Returns:
+            Any: An instance of response_class.
+        """
+        if self.validate_responses:
+            return response_class(**status_data)
+        data = status_data.get('data')
+        response = response_class(**{**status_data, 'data': [] if data is not None else None})
+        if data:
+            response.data = [_construct_document(document) for document in data]
         return response
-    
-    def _delete_request(
+
+    def _store_page(
+            self,
+            sink: ResultSink,
+            id: str,
+            status_data: Dict[str, Any],
+            on_document: Optional[Callable[[FirecrawlDocument], Any]] = None) -> None:
+        """
+        Write a page of documents to a result sink with its pagination cursor, and record the job status.
+
+        Args:
+            sink (ResultSink): The sink to write to.
+            id (str): The ID of the job.
+            status_data (Dict[str, Any]): The page, as decoded from the API.
+            on_document (Optional[Callable]): Also called with each document of the page.
+        """
+        documents = status_data.get('data') or []
+        sink.add(documents, _page_cursor(sink, id, status_data))
+        sink.set_status(status_data)
+        if on_document is not None:
+            for document in documents:
+                on_document(self._build_document(document))
+
+    def _fill_result_sink(
             self,
+            id: str,
             url: str,
-            headers: Dict[str, str],
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> requests.Response:
+            action: str,
+            sink: Union[ResultSink, str],
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> ResultSink:
         """
-        Make a DELETE request with retries.
+        Write the documents of a job's status response and of all its `next` pages to a
+        result sink. If the sink already holds a cursor of the job, resume after it.
 
         Args:
-            url (str): The URL to send the DELETE request to.
-            headers (Dict[str, str]): The headers to include in the DELETE request.
-            retries (int): Number of retries for the request.
-            backoff_factor (float): Backoff factor for retries.
+            id (str): The ID of the job.
+            url (str): The status URL of the job.
+            action (str): Description of the action, used in error messages.
+            sink (Union[ResultSink, str]): The sink, or a file path to open one for.
+            prefetch (int): Number of pages to fetch ahead of the one being written.
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead.
 
         Returns:
-            requests.Response: The response from the DELETE request.
+            ResultSink: The sink.
 
         Raises:
-            requests.RequestException: If the request fails after the specified retries.
+            Exception: If the results of the job to resume have expired.
         """
-        for attempt in range(retries):
-            response = requests.delete(url, headers=headers)
-            if response.status_code == 502:
-                time.sleep(backoff_factor * (2 ** attempt))
-            else:
-                return response
-        return response
+        sink = _open_result_sink(sink)
+        url = self._resume_url(sink, id, url)
+        if url is not None:
+            pages = self._iter_status_pages(url, self._prepare_headers(), action, prefetch, max_prefetch_bytes)
+            for status_data in pages:
+                self._store_page(sink, id, status_data)
+        return sink
+
+    def _resume_url(self, sink: ResultSink, id: str, url: str) -> Optional[str]:
+        """
+        Return the URL to continue writing a job's results to a sink from.
+
+        Args:
+            sink (ResultSink): The sink.
+            id (str): The ID of the job.
+            url (str): The status URL of the job.
+
+        Returns:
+            Optional[str]: The status URL when the sink holds no cursor of the job, the page
+            after the cursor otherwise, or None when every page has been written.
+
+        Raises:
+            Exception: If the results of the job have expired.
+        """
+        cursor = sink.cursor
+        if cursor is None or cursor.get('id') != id:
+            return url
+        if cursor.get('status') == 'completed' and not cursor.get('next'):
+            return None
+        expires_at = cursor.get('expiresAt')
+        if expires_at and datetime.fromisoformat(expires_at.replace('Z', '+00:00')) <= datetime.now(timezone.utc):
+            raise Exception(f'The results of job {id} expired at {expires_at} and can no longer be resumed')
+        logger.debug(f"Resuming the results of job {id} after {cursor.get('written')} documents")
+        return cursor.get('next') or self._set_query_params(url, {'skip': cursor.get('written', 0)})
 
     def _monitor_job_status(
             self,
             id: str,
             headers: Dict[str, str],
-            poll_interval: int) -> CrawlStatusResponse:
+            poll_interval: Optional[Union[float, PollingStrategy]],
+            on_document: Optional[Callable[[FirecrawlDocument], Any]] = None,
+            result_sink: Optional[ResultSink] = None) -> Union[CrawlStatusResponse, ResultSink]:
         """
         Monitor the status of a crawl job until completion.
 
         Args:
             id (str): The ID of the crawl job.
             headers (Dict[str, str]): The headers to include in the status check requests.
-            poll_interval (int): Seconds between status checks.
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a strategy.
+            on_document (Optional[Callable]): If given, documents are downloaded on every poll
+                while the job runs and passed to this callback as they arrive.
+            result_sink (Optional[ResultSink]): If given, documents are downloaded on every poll
+                while the job runs and written to this sink, which is returned.
 
         Returns:
-            CrawlStatusResponse: The crawl results if the job is completed successfully.
+            Union[CrawlStatusResponse, ResultSink]: The crawl results if the job is completed successfully, or the sink.
 
         Raises:
             Exception: If the job fails or an error occurs during status checks.
         """
+        if result_sink is not None:
+            for status_data in self._iter_progressive_pages(
+                    f'{self.api_url}/v1/crawl/{id}', headers, 'check crawl status', 'Crawl', poll_interval):
+                self._store_page(result_sink, id, status_data, on_document)
+            return result_sink
+
+        if on_document is not None:
+            documents = []
+            for status_data in self._iter_progressive_pages(
+                    f'{self.api_url}/v1/crawl/{id}', headers, 'check crawl status', 'Crawl', poll_interval):
+                for document in status_data.get('data') or []:
+                    document = self._build_document(document)
+                    documents.append(document)
+                    on_document(document)
+            status_data['data'] = documents
+            return self._build_status_response(CrawlStatusResponse, status_data)
+
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
         while True:
             api_url = f'{self.api_url}/v1/crawl/{id}'
 
             status_response = self._get_request(api_url, headers)
             if status_response.status_code == 200:
                 try:
-                    status_data = status_response.json()
+                    status_data = _response_json(status_response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
                 if status_data['status'] == 'completed':
                     if 'data' in status_data:
                         data = status_data['data']
-                        while 'next' in status_data:
-                            if len(status_data['data']) == 0:
-                                break
-                            status_response = self._get_request(status_data['next'], headers)
-                            try:
-                                status_data = status_response.json()
-                            except:
-                                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(status_data.get('data', []))
+                        for next_data in self._iter_next_pages(status_data, headers):
+                            data.extend(next_data.get('data', []))
+                            status_data = next_data
                         status_data['data'] = data
-                        return CrawlStatusResponse(**status_data)
+                        return self._build_status_response(CrawlStatusResponse, status_data)
                     else:
                         raise Exception('Crawl job completed but no data was returned')
                 elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                    poll_interval=max(poll_interval,2)
-                    time.sleep(poll_interval)  # Wait for the specified interval before checking again
+                    state.record(status_data)
+                    # Wait for the polling strategy's interval before checking again
+                    _sleep(polling.next_interval(state))
                 else:
                     raise Exception(f'Crawl job failed or was stopped. Status: {status_data["status"]}')
             else:
                 self._handle_error(status_response, 'check crawl status')
 
+    def _wait_within_deadline(self, id: str, wait: Callable[[], T], cancel: Callable[[str], Any]) -> T:
+        """
+        Wait for a job, cancelling it if the current deadline passes first.
+
+        Args:
+            id (str): The ID of the job.
+            wait (Callable): Waits for the job and returns its results.
+            cancel (Callable): Cancels the job, given its ID.
+
+        Returns:
+            T: The result of wait.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes, after the job is cancelled.
+        """
+        try:
+            return wait()
+        except DeadlineExceededError as e:
+            e.job_id = id
+            # The deadline has passed, so the cancellation is sent without one
+            token = _deadline.set(None)
+            try:
+                cancel(id)
+            except Exception as cancel_error:
+                logger.warning(f"Failed to cancel job {id} after its deadline passed: {cancel_error}")
+            finally:
+                _deadline.reset(token)
+            raise
+
+    def _wait_for_webhook(
+            self,
+            id: str,
+            receiver: WebhookReceiver,
+            check_status: Callable[[str], Any],
+            poll: Callable[[Optional[Callable[[FirecrawlDocument], Any]]], Any],
+            on_document: Optional[Callable[[FirecrawlDocument], Any]] = None) -> Any:
+        """
+        Wait for a job to finish using the events sent to a webhook receiver, then fetch its results.
+
+        If no event arrives within the receiver's event_timeout, the job is polled
+        instead, skipping the documents already passed to on_document.
+
+        Args:
+            id (str): The ID of the job.
+            receiver (WebhookReceiver): The receiver the job posts its events to.
+            check_status (Callable): Fetches the final status and results of the job.
+            poll (Callable): Polls the job until it finishes, given the document callback.
+            on_document (Optional[Callable]): Called with each document as it is received.
+
+        Returns:
+            Any: The result of check_status once the job has completed, or of poll.
+
+        Raises:
+            Exception: If the job fails.
+            DeadlineExceededError: If the deadline passes.
+        """
+        documents = receiver.documents(id)
+        received = set()
+        try:
+            while True:
+                timeout, at_deadline = _next_event_wait(receiver.event_timeout)
+                try:
+                    document = documents.get(timeout=timeout)
+                except queue.Empty:
+                    if at_deadline:
+                        raise DeadlineExceededError('Deadline exceeded waiting for webhook events')
+                    logger.warning(f"No webhook event for job {id} in {timeout} seconds, polling it instead")
+                    break
+                if document is None:
+                    timeout, at_deadline = _next_event_wait(receiver.event_timeout)
+                    try:
+                        receiver.completion(id).result(timeout=timeout)
+                    except FutureTimeoutError:
+                        raise DeadlineExceededError('Deadline exceeded waiting for webhook events')
+                    return check_status(id)
+                url = _document_url(document.__dict__)
+                if url is not None:
+                    received.add(url)
+                if on_document is not None:
+                    on_document(document)
+        finally:
+            receiver.forget(id)
+        return poll(_skip_received(on_document, received))
+
     def _handle_error(
             self,
             response: requests.Response,
@@ -2333,8 +5851,8 @@ class FirecrawlApp:
             Exception: An exception with a message containing the status code and error details from the response.
         """
         try:
-            error_message = response.json().get('error', 'No error message provided.')
-            error_details = response.json().get('details', 'No additional error details provided.')
+            error_message = _response_json(response).get('error', 'No error message provided.')
+            error_details = _response_json(response).get('details', 'No additional error details provided.')
         except:
             raise requests.exceptions.HTTPError(f'Failed to parse Firecrawl error response as JSON. Status code: {response.status_code}', response=response)
         
@@ -2380,7 +5898,8 @@ class FirecrawlApp:
             system_prompt: Optional[str] = None,
             __experimental_stream_steps: Optional[bool] = None,
             on_activity: Optional[Callable[[Dict[str, Any]], None]] = None,
-            on_source: Optional[Callable[[Dict[str, Any]], None]] = None) -> DeepResearchStatusResponse:
+            on_source: Optional[Callable[[Dict[str, Any]], None]] = None,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None) -> DeepResearchStatusResponse:
         """
         Initiates a deep research operation on a given query and polls until completion.
 
@@ -2394,6 +5913,8 @@ class FirecrawlApp:
             __experimental_stream_steps (Optional[bool]): Enable experimental streaming
             on_activity (Optional[Callable]): Progress callback receiving {type, status, message, timestamp, depth}
             on_source (Optional[Callable]): Source discovery callback receiving {url, title, description}
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
 
         Returns:
             DeepResearchStatusResponse containing:
@@ -2438,6 +5959,8 @@ class FirecrawlApp:
         job_id = response['id']
         last_activity_count = 0
         last_source_count = 0
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
 
         while True:
             status = self.check_deep_research_status(job_id)
@@ -2461,7 +5984,8 @@ class FirecrawlApp:
             elif status['status'] != 'processing':
                 break
 
-            time.sleep(2)  # Polling interval
+            state.record(status)
+            time.sleep(polling.next_interval(state))
 
         return {'success': False, 'error': 'Deep research job terminated unexpectedly'}
 
@@ -2526,7 +6050,7 @@ class FirecrawlApp:
             response = self._post_request(f'{self.api_url}/v1/deep-research', json_data, headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return _response_json(response)
                 except:
                     raise Exception('Failed to parse Firecrawl response as JSON.')
             else:
@@ -2566,7 +6090,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/deep-research/{id}', headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return _response_json(response)
                 except:
                     raise Exception('Failed to parse Firecrawl response as JSON.')
             elif response.status_code == 404:
@@ -2651,6 +6175,17 @@ class CrawlWatcher:
     """
     A class to watch and handle crawl job events via WebSocket connection.
 
+    If the connection drops before the job is done, the watcher reconnects with
+    jittered exponential backoff. The catch-up sent on every connection is
+    deduplicated by document id (or URL), so each document is dispatched once.
+
+    Received events go through a bounded queue to the handlers, so a slow handler
+    does not stall the connection. When the queue is full, `overflow` decides
+    whether to wait ('block'), drop the oldest or the newest event, or raise
+    ('error'). Handlers may be coroutine functions; plain functions run on
+    `executor` if one is given. With `retain_documents` off, documents are only
+    passed to the handlers and not kept in `data`.
+
     Attributes:
         id (str): The ID of the crawl job to watch
         app (FirecrawlApp): The FirecrawlApp instance
@@ -2658,8 +6193,36 @@ class CrawlWatcher:
         status (str): Current status of the crawl job
         ws_url (str): WebSocket URL for the crawl job
         event_handlers (dict): Dictionary of event type to list of handler functions
+        reconnect (bool): Whether to reconnect when the connection drops
+        max_reconnects (Optional[int]): Consecutive dropped connections without new documents after which connect()
+            raises, None for no limit
+        backoff_base (float): Base delay in seconds of the reconnection backoff
+        backoff_max (float): Maximum delay in seconds between reconnection attempts
+        ping_interval (Optional[float]): Seconds between keepalive pings, None to disable them
+        ping_timeout (Optional[float]): Seconds to wait for a pong before the connection is considered dropped
+        retain_documents (bool): Whether to keep received documents in `data`
+        queue_size (int): Maximum number of events waiting for the handlers, 0 for no limit
+        overflow (str): What to do when the queue is full: 'block', 'drop_oldest', 'drop_newest' or 'error'
+        handler_concurrency (int): Number of events handled at once. Above 1, documents may be handled out of order
+        executor (Optional[Executor]): Executor running plain function handlers, off the event loop
+        dropped_events (int): Number of events dropped because the queue was full
     """
-    def __init__(self, id: str, app: FirecrawlApp):
+    def __init__(
+            self,
+            id: str,
+            app: FirecrawlApp,
+            *,
+            reconnect: bool = True,
+            max_reconnects: Optional[int] = 10,
+            backoff_base: float = 0.5,
+            backoff_max: float = 30,
+            ping_interval: Optional[float] = 20,
+            ping_timeout: Optional[float] = 20,
+            retain_documents: bool = True,
+            queue_size: int = 1000,
+            overflow: Literal['block', 'drop_oldest', 'drop_newest', 'error'] = 'block',
+            handler_concurrency: int = 1,
+            executor: Optional[Executor] = None):
         self.id = id
         self.app = app
         self.data: List[Dict[str, Any]] = []
@@ -2670,17 +6233,122 @@ class CrawlWatcher:
             'error': [],
             'document': []
         }
+        self.reconnect = reconnect
+        self.max_reconnects = max_reconnects
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.retain_documents = retain_documents
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.handler_concurrency = handler_concurrency
+        self.executor = executor
+        self.dropped_events = 0
+        self._seen_documents: set = set()
+        self._events: Optional[asyncio.Queue] = None
+        self._final_event: Optional[tuple] = None
+        self._handler_error: Optional[BaseException] = None
 
     async def connect(self) -> None:
         """
-        Establishes WebSocket connection and starts listening for messages.
+        Establishes WebSocket connection and listens for messages until the job is done,
+        reconnecting when the connection drops. Returns once every event has been handled.
+
+        Raises:
+            Exception: If the connection keeps failing after max_reconnects attempts,
+                the event queue overflows with the 'error' policy, or a handler raised
+        """
+        self._events = asyncio.Queue(maxsize=self.queue_size)
+        self._final_event = None
+        self._handler_error = None
+        workers = [asyncio.ensure_future(self._handle_events()) for _ in range(max(self.handler_concurrency, 1))]
+        try:
+            await self._receive()
+            await self._events.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        # Done and error events are dispatched last, once every document has been handled
+        if self._final_event is not None and self._handler_error is None:
+            await self._call_handlers(*self._final_event)
+        if self._handler_error is not None:
+            raise self._handler_error
+
+    async def _receive(self) -> None:
+        """
+        Receives messages until the job is done, reconnecting when the connection drops.
         """
-        async with websockets.connect(
+        failures = 0
+        while True:
+            error = None
+            close_message = None
+            received = len(self._seen_documents)
+            try:
+                async with self._open() as websocket:
+                    try:
+                        await self._listen(websocket)
+                    finally:
+                        close_message = self._parse_close_reason(websocket.close_reason)
+            except websockets.exceptions.ConnectionClosed as e:
+                error = e
+            except websockets.exceptions.InvalidHandshake as e:
+                # Client errors (e.g. an invalid API key) won't go away by reconnecting
+                response = getattr(e, 'response', None)
+                status_code = getattr(response, 'status_code', None) or getattr(e, 'status_code', None)
+                if status_code is not None and status_code < 500:
+                    raise
+                error = e
+            except (OSError, asyncio.TimeoutError) as e:
+                error = e
+
+            # The server sends the final done/error message as the reason of the close frame
+            if close_message is None and self.status == 'completed':
+                close_message = {'type': 'done'}
+            if close_message is not None:
+                await self._handle_message(close_message)
+            if self.status != 'scraping':
+                return
+
+            # Only count consecutive connections that brought no new documents
+            failures = 1 if len(self._seen_documents) > received else failures + 1
+            if not self.reconnect or (self.max_reconnects is not None and failures > self.max_reconnects):
+                raise Exception(f'WebSocket connection to crawl {self.id} closed before it finished: {error}')
+            delay = self._get_backoff(failures)
+            logger.debug(f"WebSocket connection to crawl {self.id} dropped ({error}), reconnecting in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def _open(self):
+        """
+        Opens the WebSocket connection to the job.
+        """
+        return websockets.connect(
             self.ws_url,
             max_size=None,
-            additional_headers=[("Authorization", f"Bearer {self.app.api_key}")]
-        ) as websocket:
-            await self._listen(websocket)
+            additional_headers=[("Authorization", f"Bearer {self.app.api_key}")],
+            ping_interval=self.ping_interval,
+            ping_timeout=self.ping_timeout
+        )
+
+    def _get_backoff(self, failures: int) -> float:
+        """
+        Returns a reconnection delay with full jitter, growing exponentially with the number of failures.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** min(failures, 32)))
+
+    def _parse_close_reason(self, reason: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Parses the message carried by a close frame, if any.
+        """
+        if not reason:
+            return None
+        try:
+            msg = json.loads(reason)
+        except ValueError:
+            return None
+        return msg if isinstance(msg, dict) and msg.get('type') in ['done', 'error'] else None
 
     async def _listen(self, websocket) -> None:
         """
@@ -2690,7 +6358,7 @@ class CrawlWatcher:
             websocket: The WebSocket connection object
         """
         async for message in websocket:
-            msg = json.loads(message)
+            msg = _json_codec.loads(message)
             await self._handle_message(msg)
 
     def add_event_listener(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
@@ -2725,115 +6393,412 @@ class CrawlWatcher:
         """
         if msg['type'] == 'done':
             self.status = 'completed'
-            self.dispatch_event('done', {'status': self.status, 'data': self.data, 'id': self.id})
+            self._final_event = ('done', {'status': self.status, 'data': self.data, 'id': self.id})
         elif msg['type'] == 'error':
             self.status = 'failed'
-            self.dispatch_event('error', {'status': self.status, 'data': self.data, 'error': msg['error'], 'id': self.id})
+            self._final_event = (
+                'error', {'status': self.status, 'data': self.data, 'error': msg['error'], 'id': self.id})
         elif msg['type'] == 'catchup':
             self.status = msg['data']['status']
-            self.data.extend(msg['data'].get('data', []))
-            for doc in self.data:
-                self.dispatch_event('document', {'data': doc, 'id': self.id})
+            for doc in msg['data'].get('data') or []:
+                await self._add_document(doc)
         elif msg['type'] == 'document':
-            self.data.append(msg['data'])
-            self.dispatch_event('document', {'data': msg['data'], 'id': self.id})
+            await self._add_document(msg['data'])
+
+    async def _add_document(self, doc: Dict[str, Any]) -> None:
+        """
+        Records and queues a document for the handlers, unless it was already received.
+
+        Args:
+            doc (Dict[str, Any]): The document
+        """
+        key = self._get_document_key(doc)
+        if key in self._seen_documents:
+            return
+        self._seen_documents.add(key)
+        if self.retain_documents:
+            self.data.append(doc)
+        await self._queue_event('document', {'data': doc, 'id': self.id})
+
+    async def _queue_event(self, event_type: str, detail: Dict[str, Any]) -> None:
+        """
+        Puts an event on the handler queue, applying the overflow policy when it is full.
+
+        Args:
+            event_type (str): Type of event
+            detail (Dict[str, Any]): Event details/data to pass to handlers
+        """
+        if self._events is None:
+            # Messages handled outside connect() are dispatched right away
+            self.dispatch_event(event_type, detail)
+            return
+        if self._handler_error is not None:
+            # Stop receiving once a handler has failed
+            raise self._handler_error
+        if self._events.full():
+            if self.overflow == 'error':
+                raise Exception(f'CrawlWatcher event queue is full ({self.queue_size} events)')
+            if self.overflow == 'drop_newest':
+                self.dropped_events += 1
+                return
+            if self.overflow == 'drop_oldest':
+                self._events.get_nowait()
+                self._events.task_done()
+                self.dropped_events += 1
+        await self._events.put((event_type, detail))
+
+    async def _handle_events(self) -> None:
+        """
+        Takes events off the queue and passes them to the handlers.
+        """
+        while True:
+            event_type, detail = await self._events.get()
+            try:
+                if self._handler_error is None:
+                    await self._call_handlers(event_type, detail)
+            except Exception as e:
+                logger.error(f"Error in CrawlWatcher {event_type} handler: {e}")
+                self._handler_error = e
+            finally:
+                self._events.task_done()
+
+    async def _call_handlers(self, event_type: str, detail: Dict[str, Any]) -> None:
+        """
+        Calls the handlers of an event, awaiting coroutine handlers and running
+        plain functions on the executor if one is set.
+
+        Args:
+            event_type (str): Type of event
+            detail (Dict[str, Any]): Event details/data to pass to handlers
+        """
+        for handler in self.event_handlers.get(event_type, []):
+            if self.executor is not None and not asyncio.iscoroutinefunction(handler):
+                result = await asyncio.get_running_loop().run_in_executor(self.executor, handler, detail)
+            else:
+                result = handler(detail)
+            if asyncio.iscoroutine(result):
+                await result
+
+    def _get_document_key(self, doc: Dict[str, Any]) -> str:
+        """
+        Returns the key identifying a document across catch-ups: its scrape id, else its URL.
+        """
+        metadata = doc.get('metadata') or {}
+        return (metadata.get('scrapeId') or metadata.get('sourceURL') or metadata.get('url')
+                or json.dumps(doc, sort_keys=True))
 
 class AsyncFirecrawlApp(FirecrawlApp):
     """
     Asynchronous version of FirecrawlApp that implements async methods using aiohttp.
     Provides non-blocking alternatives to all FirecrawlApp operations.
     """
+    def __init__(
+            self,
+            api_key: Optional[str] = None,
+            api_url: Optional[str] = None,
+            *,
+            connector_limit: int = 100,
+            connector_limit_per_host: int = 0,
+            dns_cache_ttl: Optional[int] = 10,
+            keepalive_timeout: float = 15,
+            **kwargs) -> None:
+        """
+        Initialize the AsyncFirecrawlApp instance.
+
+        The instance owns one aiohttp ClientSession and TCPConnector, created on first
+        use and shared by every request so connections, DNS lookups and TLS sessions
+        are reused. Use `async with AsyncFirecrawlApp(...)` or await close() to release them.
+
+        Args:
+            api_key (Optional[str]): API key for authenticating with the Firecrawl API.
+            api_url (Optional[str]): Base URL for the Firecrawl API.
+            connector_limit (int): Maximum simultaneous connections, 0 for no limit (default: 100)
+            connector_limit_per_host (int): Maximum simultaneous connections per host, 0 for no limit (default: 0)
+            dns_cache_ttl (Optional[int]): Seconds to cache DNS lookups, None to cache forever (default: 10)
+            keepalive_timeout (float): Seconds to keep idle connections open (default: 15)
+            **kwargs: Additional settings passed to FirecrawlApp
+        """
+        super().__init__(api_key, api_url, **kwargs)
+        self.connector_limit = connector_limit
+        self.connector_limit_per_host = connector_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> 'AsyncFirecrawlApp':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the shared aiohttp session and its connector.
+
+        The session is recreated transparently if the instance is used again.
+        """
+        session, self._async_session = self._async_session, None
+        self._async_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+        super().close()
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session for the running event loop.
+
+        A session is bound to the loop it was created on, so a new one is created
+        when the instance is used from a different loop or after close().
+
+        Returns:
+            aiohttp.ClientSession: The session shared by all requests on this loop.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._async_session
+        if session is not None and not session.closed and self._async_session_loop is loop:
+            return session
+
+        if session is not None and not session.closed:
+            # The old loop owns this session's transports; it can't be awaited from here.
+            logger.debug("Event loop changed, recreating aiohttp session")
+            session.detach()
+
+        connector = aiohttp.TCPConnector(
+            limit=self.connector_limit,
+            limit_per_host=self.connector_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        self._async_session = aiohttp.ClientSession(
+            connector=connector, json_serialize=lambda obj: _json_codec.dumps(obj).decode())
+        self._async_session_loop = loop
+        return self._async_session
+
+    async def _async_request(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            data: Optional[Dict[str, Any]] = None,
+            retries: Optional[int] = None,
+            backoff_factor: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Generic async request method, retrying as the client's retry policy allows.
+
+        Args:
+            method (str): The HTTP method to use (e.g., "GET" or "POST").
+            url (str): The URL to send the request to.
+            headers (Dict[str, str]): Headers to include in the request.
+            data (Optional[Dict[str, Any]]): The JSON data to include in the request body (only for POST requests).
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
+
+        Returns:
+            Dict[str, Any]: The parsed JSON response from the server.
+
+        Raises:
+            aiohttp.ClientError: If the last attempt fails without a response.
+            DeadlineExceededError: If the current deadline passes before a response that isn't retried.
+            Exception: If the last response is an error.
+        """
+        send = self.transport.async_request if self.transport is not None else self._get_async_session().request
+        limiter = self.concurrency_limiter
+        breaker = self.circuit_breakers.for_url(url) if self.circuit_breakers is not None else None
+        policy = self._get_retry_policy(retries, backoff_factor)
+        state = policy.start()
+        idempotency_key = headers.get('x-idempotency-key') if method.upper() == 'POST' else None
+        idempotent = method.upper() != 'POST' or idempotency_key is not None
+        while True:
+            # Take the limiter's slot before the breaker's, so a wait that fails or is cancelled holds no trial call
+            if limiter is not None and not await limiter.acquire_async(_time_left()):
+                raise DeadlineExceededError(f'Deadline exceeded waiting to send {method} {url}')
+            if breaker is not None:
+                try:
+                    breaker.before_call()
+                except CircuitBreakerOpenError:
+                    if limiter is not None:
+                        limiter.release()
+                    raise
+            start = time.monotonic()
+            status = retry_after = None
+            cancelled = False
+            try:
+                timeout = self._get_async_timeout(data.get('timeout') if data else None)
+                async with send(
+                    method=method, url=url, headers=headers, json=data, timeout=timeout
+                ) as response:
+                    status = response.status
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    if status == 409 and idempotency_key is not None:
+                        raise IdempotencyConflictError(idempotency_key)
+                    delay = None
+                    if status >= 300:
+                        delay = policy.next_delay(state, idempotent, status, retry_after=retry_after)
+                    if delay is None:
+                        if status >= 300:
+                            await self._handle_error(response, f"make {method} request")
+                        return await response.json(loads=_json_codec.loads)
+                    logger.debug(f"{method} {url} returned {status}, retrying in {delay:.2f}s")
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            except Exception as e:
+                if isinstance(e, (DeadlineExceededError, asyncio.TimeoutError)) and _deadline_passed():
+                    # Cut short by the caller's deadline, which says nothing about the API's health
+                    cancelled = True
+                    if isinstance(e, DeadlineExceededError):
+                        raise
+                    raise DeadlineExceededError(f'Deadline exceeded during {method} {url}') from e
+                if status is not None:
+                    raise
+                delay = policy.next_delay(state, idempotent, exception=e)
+                if delay is None:
+                    raise
+                logger.debug(f"{method} {url} failed, retrying in {delay:.2f}s: {e}")
+            finally:
+                latency = time.monotonic() - start
+                if limiter is not None:
+                    limiter.release(status, latency, retry_after)
+                if breaker is not None:
+                    if cancelled:
+                        breaker.cancel_call()
+                    else:
+                        breaker.after_call(status is None or status >= 500, latency)
+            remaining = _time_left()
+            if remaining is not None and delay >= remaining:
+                raise DeadlineExceededError(f'Deadline exceeded before {method} {url} could be retried')
+            await asyncio.sleep(delay)
+
+    def _get_async_timeout(self, server_timeout: Optional[int] = None) -> aiohttp.ClientTimeout:
+        """
+        Return the aiohttp timeouts for a request.
+
+        Args:
+            server_timeout (Optional[int]): Milliseconds the API may spend on the request, if it sets one.
 
-    async def _async_request(
+        Returns:
+            aiohttp.ClientTimeout: The connect and read timeouts, and the time left before the current deadline as the
+                total.
+
+        Raises:
+            DeadlineExceededError: If the current deadline has passed.
+        """
+        connect, read = self._get_timeout(server_timeout)
+        return aiohttp.ClientTimeout(total=_time_left(), sock_connect=connect, sock_read=read)
+
+    async def _async_hedged_post_request(
             self,
-            method: str,
-            url: str,
-            headers: Dict[str, str],
-            data: Optional[Dict[str, Any]] = None,
-            retries: int = 3,
-            backoff_factor: float = 0.5) -> Dict[str, Any]:
+            hedging: Optional[HedgingPolicy],
+            path: str,
+            data: Dict[str, Any],
+            headers: Dict[str, str]) -> Dict[str, Any]:
         """
-        Generic async request method with exponential backoff retry logic.
+        Make an async POST request and, if it is still outstanding after the hedging
+        policy's delay, a duplicate of it. The first to succeed wins and the other is cancelled.
 
         Args:
-            method (str): The HTTP method to use (e.g., "GET" or "POST").
-            url (str): The URL to send the request to.
+            hedging (Optional[HedgingPolicy]): The hedging policy, or None to send a single request.
+            path (str): The API path to send the POST request to.
+            data (Dict[str, Any]): The JSON data to include in the request body.
             headers (Dict[str, str]): Headers to include in the request.
-            data (Optional[Dict[str, Any]]): The JSON data to include in the request body (only for POST requests).
-            retries (int): Maximum number of retry attempts (default: 3).
-            backoff_factor (float): Factor to calculate delay between retries (default: 0.5).
-                Delay will be backoff_factor * (2 ** retry_count).
 
         Returns:
             Dict[str, Any]: The parsed JSON response from the server.
 
         Raises:
-            aiohttp.ClientError: If the request fails after all retries.
-            Exception: If max retries are exceeded or other errors occur.
+            Exception: If both requests fail.
         """
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(retries):
-                try:
-                    async with session.request(
-                        method=method, url=url, headers=headers, json=data
-                    ) as response:
-                        if response.status == 502:
-                            await asyncio.sleep(backoff_factor * (2 ** attempt))
-                            continue
-                        if response.status >= 300:
-                            await self._handle_error(response, f"make {method} request")
-                        return await response.json()
-                except aiohttp.ClientError as e:
-                    if attempt == retries - 1:
-                        raise e
-                    await asyncio.sleep(backoff_factor * (2 ** attempt))
-            raise Exception("Max retries exceeded")
+        if hedging is None:
+            return await self._async_post_request(f'{self.api_url}{path}', data, headers)
+
+        hedging.start()
+        start = time.monotonic()
+        pending = {asyncio.ensure_future(self._async_post_request(f'{self.api_url}{path}', data, headers))}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedging.get_delay())
+            if not done and hedging.try_hedge():
+                logger.debug(f"Hedging POST {path} after {time.monotonic() - start:.2f}s")
+                pending.add(asyncio.ensure_future(
+                    self._async_post_request(f'{hedging.api_url or self.api_url}{path}', data, headers)))
+
+            failed = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        hedging.record(time.monotonic() - start)
+                        return task.result()
+                    failed = task
+            return failed.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _async_post_request(
             self, url: str, data: Dict[str, Any], headers: Dict[str, str],
-            retries: int = 3, backoff_factor: float = 0.5) -> Dict[str, Any]:
+            retries: Optional[int] = None, backoff_factor: Optional[float] = None) -> Dict[str, Any]:
         """
-        Make an async POST request with exponential backoff retry logic.
+        Make an async POST request with retries.
 
         Args:
             url (str): The URL to send the POST request to.
             data (Dict[str, Any]): The JSON data to include in the request body.
             headers (Dict[str, str]): Headers to include in the request.
-            retries (int): Maximum number of retry attempts (default: 3).
-            backoff_factor (float): Factor to calculate delay between retries (default: 0.5).
-                Delay will be backoff_factor * (2 ** retry_count).
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
 
         Returns:
             Dict[str, Any]: The parsed JSON response from the server.
 
         Raises:
-            aiohttp.ClientError: If the request fails after all retries.
-            Exception: If max retries are exceeded or other errors occur.
+            aiohttp.ClientError: If the last attempt fails without a response.
+            Exception: If the last response is an error.
         """
         return await self._async_request("POST", url, headers, data, retries, backoff_factor)
 
     async def _async_get_request(
             self, url: str, headers: Dict[str, str],
-            retries: int = 3, backoff_factor: float = 0.5) -> Dict[str, Any]:
+            retries: Optional[int] = None, backoff_factor: Optional[float] = None) -> Dict[str, Any]:
         """
-        Make an async GET request with exponential backoff retry logic.
+        Make an async GET request with retries.
 
         Args:
             url (str): The URL to send the GET request to.
             headers (Dict[str, str]): Headers to include in the request.
-            retries (int): Maximum number of retry attempts (default: 3).
-            backoff_factor (float): Factor to calculate delay between retries (default: 0.5).
-                Delay will be backoff_factor * (2 ** retry_count).
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
 
         Returns:
             Dict[str, Any]: The parsed JSON response from the server.
 
         Raises:
-            aiohttp.ClientError: If the request fails after all retries.
-            Exception: If max retries are exceeded or other errors occur.
+            aiohttp.ClientError: If the last attempt fails without a response.
+            Exception: If the last response is an error.
         """
         return await self._async_request("GET", url, headers, None, retries, backoff_factor)
 
+    async def _async_delete_request(
+            self, url: str, headers: Dict[str, str],
+            retries: Optional[int] = None, backoff_factor: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Make an async DELETE request with retries.
+
+        Args:
+            url (str): The URL to send the DELETE request to.
+            headers (Dict[str, str]): Headers to include in the request.
+            retries (Optional[int]): Maximum number of attempts (default: the retry policy's).
+            backoff_factor (Optional[float]): Shortest delay between attempts (default: the retry policy's).
+
+        Returns:
+            Dict[str, Any]: The parsed JSON response from the server.
+
+        Raises:
+            aiohttp.ClientError: If the last attempt fails without a response.
+            Exception: If the last response is an error.
+        """
+        return await self._async_request("DELETE", url, headers, None, retries, backoff_factor)
+
     async def _handle_error(self, response: aiohttp.ClientResponse, action: str) -> None:
         """
         Handle errors from async API responses with detailed error messages.
@@ -2851,7 +6816,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
                 - Other: Unexpected error with status code
         """
         try:
-            error_data = await response.json()
+            error_data = await response.json(loads=_json_codec.loads)
             error_message = error_data.get('error', 'No error message provided.')
             error_details = error_data.get('details', 'No additional error details provided.')
         except:
@@ -2983,6 +6948,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             extract: Optional[JsonConfig] = None,
             json_options: Optional[JsonConfig] = None,
             actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
+            hedging: Optional[HedgingPolicy] = None,
             **kwargs) -> ScrapeResponse[Any]:
         """
         Scrape a single URL asynchronously.
@@ -3005,6 +6971,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
           extract (Optional[JsonConfig]): Content extraction settings
           json_options (Optional[JsonConfig]): JSON extraction settings
           actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]]): Actions to perform
+          hedging (Optional[HedgingPolicy]): Send a duplicate request if this one is slow (default: the client's
+              hedging)
           **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3082,8 +7050,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         # Make async request
         endpoint = f'/v1/scrape'
-        response = await self._async_post_request(
-            f'{self.api_url}{endpoint}',
+        response = await self._async_hedged_post_request(
+            hedging or self.hedging,
+            endpoint,
             scrape_params,
             _headers
         )
@@ -3097,6 +7066,80 @@ class AsyncFirecrawlApp(FirecrawlApp):
             error_content = response.get('error', str(response))
             raise Exception(f'Failed to scrape URL. Error: {error_content}')
 
+    async def scrape_many(
+            self,
+            urls: List[str],
+            *,
+            max_concurrency: Optional[int] = None,
+            max_per_domain: int = 4,
+            deadline: Optional[float] = None,
+            **scrape_options) -> AsyncIterator[ScrapeManyResult]:
+        """
+        Asynchronously scrape many URLs with a global and a per-domain concurrency limit.
+
+        Domains take turns to start their next scrape, so a domain with many URLs
+        can't hold up the others. A URL that fails to scrape yields an unsuccessful
+        result with its error instead of stopping the others.
+
+        Args:
+            urls (List[str]): URLs to scrape
+            max_concurrency (Optional[int]): Maximum number of scrapes in flight (default: the client's connector_limit)
+            max_per_domain (int): Maximum number of scrapes in flight per target domain, 0 for no limit (default: 4)
+            deadline (Optional[float]): Seconds after which the scrapes in flight are cancelled, and they and the
+                remaining URLs are yielded as failed
+            **scrape_options: Options passed to scrape_url for every URL
+
+        Returns:
+            AsyncIterator[ScrapeManyResult]: One result per URL as it completes, with its index in `urls`
+        """
+        queue = _DomainRoundRobin(urls, max_per_domain)
+        limit = max_concurrency or self.connector_limit or 100
+        stop_at = time.monotonic() + deadline if deadline is not None else None
+        running: Dict[asyncio.Future, Tuple[int, str]] = {}
+
+        try:
+            while True:
+                while len(running) < limit:
+                    item = queue.next()
+                    if item is None:
+                        break
+                    running[asyncio.ensure_future(self._scrape_one(*item, stop_at, scrape_options))] = item
+                if not running:
+                    return
+
+                timeout = max(0, stop_at - time.monotonic()) if stop_at is not None else None
+                done, _ = await asyncio.wait(list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    index, url = running.pop(task)
+                    queue.release(url)
+                    yield task.result()
+
+            # The deadline has passed
+            for task, (index, url) in list(running.items()):
+                task.cancel()
+                del running[task]
+                yield self._scrape_expired(index, url)
+            for index, url in queue.drain():
+                yield self._scrape_expired(index, url)
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _scrape_one(
+            self,
+            index: int,
+            url: str,
+            stop_at: Optional[float],
+            scrape_options: Dict[str, Any]) -> ScrapeManyResult:
+        if stop_at is not None and time.monotonic() >= stop_at:
+            return self._scrape_expired(index, url)
+        try:
+            return ScrapeManyResult(index=index, url=url, data=await self.scrape_url(url, **scrape_options))
+        except Exception as e:
+            return ScrapeManyResult(index=index, url=url, success=False, error=str(e))
+
     async def batch_scrape_urls(
         self,
         urls: List[str],
@@ -3118,10 +7161,14 @@ class AsyncFirecrawlApp(FirecrawlApp):
         json_options: Optional[JsonConfig] = None,
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction, PDFAction]]] = None,
         agent: Optional[AgentOptions] = None,
-        poll_interval: Optional[int] = 2,
+        poll_interval: Optional[Union[float, PollingStrategy]] = None,
+        on_document: Optional[Callable[[FirecrawlDocument], Any]] = None,
+        result_sink: Optional[Union[ResultSink, str]] = None,
+        webhook_receiver: Optional[WebhookReceiver] = None,
         idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> BatchScrapeStatusResponse:
+    ) -> Union[BatchScrapeStatusResponse, ResultSink]:
         """
         Asynchronously scrape multiple URLs and monitor until completion.
 
@@ -3144,8 +7191,17 @@ class AsyncFirecrawlApp(FirecrawlApp):
             json_options (Optional[JsonConfig]): JSON extraction config
             actions (Optional[List[Union]]): Actions to perform
             agent (Optional[AgentOptions]): Agent configuration
-            poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            on_document (Optional[Callable]): Called with each document as soon as it is scraped, while the job is still
+                running
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents to this sink, or to a new sink for a
+                file path, as they arrive, and return the sink instead of the results
+            webhook_receiver (Optional[WebhookReceiver]): Wait for the job's webhook events on this receiver instead of
+                polling
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            deadline (Optional[float]): Seconds the whole call may take, including starting the job, waiting for it and
+                fetching its results; the job is cancelled when the deadline passes
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3156,6 +7212,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         Raises:
             Exception: If batch scrape fails
+            DeadlineExceededError: If the deadline passes first
         """
         # Validate any additional kwargs
         self._validate_kwargs(kwargs, "batch_scrape_urls")
@@ -3211,6 +7268,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
         final_params = ScrapeParams(**scrape_params)
         params_dict = final_params.dict(exclude_none=True)
         params_dict['urls'] = urls
+        if webhook_receiver is not None and 'webhook' not in params_dict:
+            params_dict['webhook'] = webhook_receiver.webhook_config().dict(exclude_none=True)
         params_dict['origin'] = f"python-sdk@{version}"
 
         if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
@@ -3219,21 +7278,34 @@ class AsyncFirecrawlApp(FirecrawlApp):
             params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
-        response = await self._async_post_request(
-            f'{self.api_url}/v1/batch/scrape',
-            params_dict,
-            headers
-        )
+        with _deadline_scope(deadline):
+            if webhook_receiver is not None:
+                _check_event_timeout(webhook_receiver)
+            headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
+            response = await self._async_post_request(
+                f'{self.api_url}/v1/batch/scrape',
+                params_dict,
+                headers
+            )
 
-        if response.get('success'):
-            try:
-                id = response.get('id')
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return await self._async_monitor_job_status(id, headers, poll_interval)
-        else:
-            self._handle_error(response, 'start batch scrape job')
+            if response.get('success'):
+                try:
+                    id = response.get('id')
+                except:
+                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                sink = _open_result_sink(result_sink) if result_sink is not None else None
+                if webhook_receiver is not None:
+                    return await self._async_wait_within_deadline(
+                        id, self._async_wait_for_webhook(
+                            id, webhook_receiver, functools.partial(self.check_batch_scrape_status, result_sink=sink),
+                            lambda on_document: self._async_monitor_job_status(id, headers, poll_interval, on_document, sink),
+                                on_document),
+                            self.cancel_batch_scrape)
+                return await self._async_wait_within_deadline(
+                    id, self._async_monitor_job_status(id, headers, poll_interval, on_document, sink),
+                    self.cancel_batch_scrape)
+            else:
+                self._handle_error(response, 'start batch scrape job')
 
 
     async def async_batch_scrape_urls(
@@ -3361,21 +7433,122 @@ class AsyncFirecrawlApp(FirecrawlApp):
             params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
+        headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
         response = await self._async_post_request(
             f'{self.api_url}/v1/batch/scrape',
             params_dict,
             headers
         )
 
-        if response.get('status_code') == 200:
+        if response.get('success'):
             try:
-                return BatchScrapeResponse(**response.json())
+                return BatchScrapeResponse(**response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
             await self._handle_error(response, 'start batch scrape job')
 
+    async def batch_scrape_urls_sharded(
+            self,
+            urls: List[str],
+            *,
+            chunk_size: int = 1000,
+            max_in_flight_chunks: int = 4,
+            ordered: bool = True,
+            chunk_retries: int = 2,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            on_progress: Optional[Callable[[BatchScrapeProgress], Any]] = None,
+            **scrape_options) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Asynchronously batch scrape a very large list of URLs as several smaller batch scrape jobs.
+
+        Args:
+            urls (List[str]): URLs to scrape
+            chunk_size (int): Number of URLs per batch scrape job (default: 1000)
+            max_in_flight_chunks (int): Maximum number of chunk jobs running at a time (default: 4)
+            ordered (bool): Yield documents in the order of `urls` instead of as chunks complete (default: True)
+            chunk_retries (int): Times a failed chunk job is submitted again before giving up (default: 2)
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            on_progress (Optional[Callable[[BatchScrapeProgress], Any]]): Called with the combined progress and credits
+                of all chunks
+            **scrape_options: Scrape options passed to async_batch_scrape_urls for every chunk
+
+        Returns:
+            AsyncIterator[FirecrawlDocument]: The scraped documents. Ordering is best effort within
+            a chunk, as documents are matched to their URL by metadata.sourceURL
+
+        Raises:
+            ValueError: If chunk_size or max_in_flight_chunks is below 1, or an idempotency_key is given
+            IdempotencyConflictError: If a chunk job was most likely started by a submission whose response was lost
+            Exception: If a chunk job still fails after `chunk_retries` retries
+        """
+        if chunk_size < 1 or max_in_flight_chunks < 1:
+            raise ValueError('chunk_size and max_in_flight_chunks must be at least 1')
+        if scrape_options.get('idempotency_key') is not None:
+            raise ValueError('An idempotency_key cannot be shared by the chunk jobs of a sharded batch scrape')
+
+        shards = _BatchScrapeShards(urls, chunk_size, on_progress)
+        monitor = AsyncJobMonitor(
+            self, max_concurrency=max_in_flight_chunks, polling_strategy=self._get_polling_strategy(poll_interval))
+        pending: Dict[asyncio.Future, int] = {}
+        finished: Dict[int, List[FirecrawlDocument]] = {}
+        next_chunk = 0
+        yielded = 0
+
+        async def submit(index: int) -> None:
+            # Every attempt to start this chunk's job sends the same key, so a job
+            # created by an attempt whose response was lost is not started twice
+            idempotency_key = self._get_idempotency_key()
+            while True:
+                try:
+                    job = await self.async_batch_scrape_urls(
+                        shards.chunks[index], idempotency_key=idempotency_key, **scrape_options)
+                    if not job.success or not job.id:
+                        raise Exception(f'Failed to start batch scrape job. Error: {job.error}')
+                    break
+                except IdempotencyConflictError:
+                    raise
+                except Exception as e:
+                    if not shards.retry(index, e, chunk_retries):
+                        raise
+            shards.started(index, job)
+            future = monitor.watch_batch_scrape(job.id, on_status=lambda status: shards.update(index, status))
+            pending[future] = index
+
+        try:
+            while yielded < len(shards.chunks):
+                window = yielded + max_in_flight_chunks if ordered else len(shards.chunks)
+                while len(pending) < max_in_flight_chunks and next_chunk < min(window, len(shards.chunks)):
+                    await submit(next_chunk)
+                    next_chunk += 1
+
+                done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        if not shards.retry(index, e, chunk_retries):
+                            raise
+                        await submit(index)
+                        continue
+                    shards.completed(index)
+                    finished[index] = shards.sort_documents(index, status.data) if ordered else status.data
+
+                if ordered:
+                    while yielded in finished:
+                        for document in finished.pop(yielded):
+                            yield document
+                        yielded += 1
+                else:
+                    for index in list(finished):
+                        for document in finished.pop(index):
+                            yield document
+                        yielded += 1
+        finally:
+            await monitor.close()
+
     async def crawl_url(
         self,
         url: str,
@@ -3396,10 +7569,14 @@ class AsyncFirecrawlApp(FirecrawlApp):
         regex_on_full_url: Optional[bool] = None,
         delay: Optional[int] = None,
         allow_subdomains: Optional[bool] = None,
-        poll_interval: Optional[int] = 2,
+        poll_interval: Optional[Union[float, PollingStrategy]] = None,
+        on_document: Optional[Callable[[FirecrawlDocument], Any]] = None,
+        result_sink: Optional[Union[ResultSink, str]] = None,
+        webhook_receiver: Optional[WebhookReceiver] = None,
         idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> CrawlStatusResponse:
+    ) -> Union[CrawlStatusResponse, ResultSink]:
         """
         Crawl a website starting from a URL.
 
@@ -3421,8 +7598,17 @@ class AsyncFirecrawlApp(FirecrawlApp):
             regex_on_full_url (Optional[bool]): Apply regex to full URLs
             delay (Optional[int]): Delay in seconds between scrapes
             allow_subdomains (Optional[bool]): Follow subdomains
-            poll_interval (Optional[int]): Seconds between status checks (default: 2)
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            on_document (Optional[Callable]): Called with each document as soon as it is scraped, while the job is still
+                running
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents to this sink, or to a new sink for a
+                file path, as they arrive, and return the sink instead of the results
+            webhook_receiver (Optional[WebhookReceiver]): Wait for the job's webhook events on this receiver instead of
+                polling
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            deadline (Optional[float]): Seconds the whole call may take, including starting the job, waiting for it and
+                fetching its results; the job is cancelled when the deadline passes
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3433,6 +7619,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         Raises:
             Exception: If crawl fails
+            DeadlineExceededError: If the deadline passes first
         """
         # Validate any additional kwargs
         self._validate_kwargs(kwargs, "crawl_url")
@@ -3460,6 +7647,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             crawl_params['ignoreSitemap'] = ignore_sitemap
         if scrape_options is not None:
             crawl_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+        if webhook is None and webhook_receiver is not None:
+            webhook = webhook_receiver.webhook_config()
         if webhook is not None:
             crawl_params['webhook'] = webhook
         if deduplicate_similar_urls is not None:
@@ -3482,18 +7671,31 @@ class AsyncFirecrawlApp(FirecrawlApp):
         params_dict['url'] = url
         params_dict['origin'] = f"python-sdk@{version}"
         # Make request
-        headers = self._prepare_headers(idempotency_key)
-        response = await self._async_post_request(
-          f'{self.api_url}/v1/crawl', params_dict, headers)
+        with _deadline_scope(deadline):
+            if webhook_receiver is not None:
+                _check_event_timeout(webhook_receiver)
+            headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
+            response = await self._async_post_request(
+              f'{self.api_url}/v1/crawl', params_dict, headers)
 
-        if response.get('success'):
-            try:
-                id = response.get('id')
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return await self._async_monitor_job_status(id, headers, poll_interval)
-        else:
-            await self._handle_error(response, 'start crawl job')
+            if response.get('success'):
+                try:
+                    id = response.get('id')
+                except:
+                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                sink = _open_result_sink(result_sink) if result_sink is not None else None
+                if webhook_receiver is not None:
+                    return await self._async_wait_within_deadline(
+                        id, self._async_wait_for_webhook(
+                            id, webhook_receiver, functools.partial(self.check_crawl_status, result_sink=sink),
+                            lambda on_document: self._async_monitor_job_status(id, headers, poll_interval, on_document, sink),
+                                on_document),
+                            self.cancel_crawl)
+                return await self._async_wait_within_deadline(
+                    id, self._async_monitor_job_status(id, headers, poll_interval, on_document, sink),
+                    self.cancel_crawl)
+            else:
+                await self._handle_error(response, 'start crawl job')
 
 
     async def async_crawl_url(
@@ -3598,102 +7800,539 @@ class AsyncFirecrawlApp(FirecrawlApp):
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
-        headers = self._prepare_headers(idempotency_key)
+        headers = self._prepare_headers(self._get_idempotency_key(idempotency_key))
         response = await self._async_post_request(
           f'{self.api_url}/v1/crawl',
           params_dict,
           headers
         )
 
-        if response.get('success'):
+        if response.get('success'):
+            try:
+                return CrawlResponse(**response)
+            except:
+                raise Exception(f'Failed to parse Firecrawl response as JSON.')
+        else:
+            await self._handle_error(response, 'start crawl job')
+
+    async def check_crawl_status(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024,
+            result_sink: Optional[Union[ResultSink, str]] = None) -> Union[CrawlStatusResponse, ResultSink]:
+        """
+        Check the status and results of an asynchronous crawl job.
+
+        Args:
+            id (str): Unique identifier for the crawl job
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents of every page to this sink, or to a new
+                sink for a file path, and return the sink instead
+
+        Returns:
+            CrawlStatusResponse containing:
+            Status Information:
+            * status - Current state (scraping/completed/failed/cancelled)
+            * completed - Number of pages crawled
+            * total - Total pages to crawl
+            * creditsUsed - API credits consumed
+            * expiresAt - Data expiration timestamp
+            
+            Results:
+            * data - List of crawled documents
+            * next - URL for next page of results (if paginated)
+            * success - Whether status check succeeded
+            * error - Error message if failed
+
+        Raises:
+            Exception: If status check fails
+        """
+        headers = self._prepare_headers()
+        endpoint = f'/v1/crawl/{id}'
+        if result_sink is not None:
+            return await self._async_fill_result_sink(
+                id, f'{self.api_url}{endpoint}', result_sink, prefetch, max_prefetch_bytes)
+        
+        status_data = await self._async_get_request(
+            self._status_url(f'{self.api_url}{endpoint}', prefetch),
+            headers
+        )
+
+        if status_data.get('status') == 'completed':
+            if 'data' in status_data:
+                data = status_data['data']
+                async for next_data in self._async_iter_next_pages(status_data, headers, prefetch, max_prefetch_bytes):
+                    data.extend(next_data.get('data', []))
+                    status_data = next_data
+                status_data['data'] = data
+        # Create CrawlStatusResponse object from status data
+        response = self._build_status_response(CrawlStatusResponse, {
+            'status': status_data.get('status'),
+            'total': status_data.get('total'),
+            'completed': status_data.get('completed'),
+            'creditsUsed': status_data.get('creditsUsed'),
+            'expiresAt': status_data.get('expiresAt'),
+            'data': status_data.get('data'),
+            'success': False if 'error' in status_data else True
+        })
+
+        if 'error' in status_data:
+            response.error = status_data.get('error')
+
+        if 'next' in status_data:
+            response.next = status_data.get('next')
+
+        return response
+
+    async def iter_crawl_documents(
+            self,
+            id: str,
+            *,
+            wait: bool = False,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Asynchronously iterate over the documents of a crawl job one results page at a time.
+
+        Only the current page is held in memory, and the remaining pages are not
+        fetched if the caller stops iterating early.
+
+        Args:
+            id (str): Unique identifier for the crawl job
+            wait (bool): Keep polling until the crawl finishes, yielding new documents as they are scraped
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks when waiting, or a
+                PollingStrategy (default: the client's polling_strategy)
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read, ignored when
+                waiting (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+
+        Returns:
+            AsyncIterator[FirecrawlDocument]: The crawled documents, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails, or the crawl fails while waiting
+        """
+        async for document in self._async_iter_job_documents(
+                f'{self.api_url}/v1/crawl/{id}', 'Crawl', wait, poll_interval, prefetch, max_prefetch_bytes):
+            yield document
+
+    async def get_crawl_result_set(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> CrawlResultSet:
+        """
+        Asynchronously download the documents of a crawl job into a CrawlResultSet.
+
+        Each results page is added to the set as it arrives, without building a
+        FirecrawlDocument per document, so large jobs take much less memory than
+        with check_crawl_status.
+
+        Args:
+            id (str): Unique identifier for the crawl job
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+
+        Returns:
+            CrawlResultSet: The documents available now, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails
+        """
+        result_set = CrawlResultSet()
+        async for status_data in self._async_iter_status_pages(
+                f'{self.api_url}/v1/crawl/{id}', self._prepare_headers(), prefetch, max_prefetch_bytes):
+            result_set.extend(status_data.get('data') or [])
+        return result_set
+
+    async def _async_iter_next_pages(
+            self,
+            status_data: Dict[str, Any],
+            headers: Dict[str, str],
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Follow the `next` links of a paginated status response asynchronously.
+
+        With `prefetch`, the remaining pages of a completed job are requested
+        concurrently when their offsets are predictable, and yielded in order.
+
+        Args:
+            status_data (Dict[str, Any]): The page to start from (not yielded again)
+            headers (Dict[str, str]): Headers to include in the page requests
+            prefetch (int): Number of pages to fetch ahead of the one being read
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead
+
+        Yields:
+            Dict[str, Any]: Each following page, as parsed JSON
+        """
+        page_urls = self._get_page_urls(status_data) if prefetch > 0 else None
+        if page_urls is not None:
+            async for next_data in self._async_iter_prefetched_pages(
+                    page_urls, headers, prefetch, max_prefetch_bytes, self._estimate_page_bytes(status_data)):
+                yield next_data
+            return
+
+        while status_data.get('next') and status_data.get('data'):
+            status_data = await self._async_get_request(status_data['next'], headers)
+            yield status_data
+
+    async def _async_iter_prefetched_pages(
+            self,
+            page_urls: List[str],
+            headers: Dict[str, str],
+            prefetch: int,
+            max_prefetch_bytes: int,
+            page_bytes: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch result pages as concurrent tasks, keeping a bounded window of pages ahead of the reader.
+
+        Args:
+            page_urls (List[str]): The URLs of the pages, in order
+            headers (Dict[str, str]): Headers to include in the page requests
+            prefetch (int): Maximum number of pages fetched ahead
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead
+            page_bytes (int): Estimated size of a page
+
+        Yields:
+            Dict[str, Any]: Each page, in the order of `page_urls`
+        """
+        remaining = iter(page_urls)
+        pending = deque()
+        try:
+            while True:
+                window = max(1, min(prefetch, max_prefetch_bytes // max(page_bytes, 1)))
+                while len(pending) < window:
+                    url = next(remaining, None)
+                    if url is None:
+                        break
+                    pending.append(asyncio.ensure_future(self._async_get_request(url, headers)))
+                if not pending:
+                    return
+                status_data = await pending.popleft()
+                page_bytes = max(page_bytes, self._estimate_page_bytes(status_data))
+                yield status_data
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _async_iter_status_pages(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch a status response asynchronously and yield it followed by each of its `next` pages.
+
+        Args:
+            url (str): The status URL of the job
+            headers (Dict[str, str]): Headers to include in the requests
+            prefetch (int): Number of pages to fetch ahead of the one being read
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead
+
+        Yields:
+            Dict[str, Any]: Each page, as parsed JSON
+        """
+        status_data = await self._async_get_request(self._status_url(url, prefetch), headers)
+        yield status_data
+        async for status_data in self._async_iter_next_pages(status_data, headers, prefetch, max_prefetch_bytes):
+            yield status_data
+
+    async def _async_iter_progressive_pages(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            job_kind: str,
+            poll_interval: Optional[Union[float, PollingStrategy]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Poll a job asynchronously until it finishes, yielding each page of newly scraped documents.
+
+        The `next` link of every response is used as a skip cursor, so each document
+        is downloaded once, as soon as the job has scraped it.
+
+        Args:
+            url (str): The status URL of the job
+            headers (Dict[str, str]): Headers to include in the requests
+            job_kind (str): Kind of the job, such as 'Crawl' or 'Batch scrape', used in error messages
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds to wait when no new documents are
+                available, or a strategy
+
+        Yields:
+            Dict[str, Any]: Each page, as parsed JSON. The last page carries the final job status
+
+        Raises:
+            Exception: If the job fails or is stopped, after its remaining documents are yielded
+        """
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
+        while True:
+            status_data = await self._async_get_request(url, headers)
+            yield status_data
+
+            if status_data.get('next'):
+                url = status_data['next']
+                if status_data.get('data'):
+                    # More documents are ready, fetch them without waiting
+                    continue
+
+            if status_data.get('status') == 'completed':
+                return
+            elif status_data.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
+                state.record(status_data)
+                await _async_sleep(polling.next_interval(state))
+            else:
+                raise Exception(f'{job_kind} job failed or was stopped. Status: {status_data["status"]}')
+
+    async def _async_iter_job_documents(
+            self,
+            url: str,
+            job_kind: str,
+            wait: bool = False,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Yield the documents of a crawl or batch scrape job asynchronously, page by page.
+
+        Args:
+            url (str): The status URL of the job
+            job_kind (str): Kind of the job, such as 'Crawl' or 'Batch scrape', used in error messages
+            wait (bool): Keep polling until the job finishes, yielding documents as they are scraped
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks when waiting, or a
+                strategy
+            prefetch (int): Number of pages to fetch ahead of the one being read, ignored when waiting
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead
+
+        Yields:
+            FirecrawlDocument: Each document of the job
+        """
+        headers = self._prepare_headers()
+        if wait:
+            pages = self._async_iter_progressive_pages(url, headers, job_kind, poll_interval)
+        else:
+            pages = self._async_iter_status_pages(url, headers, prefetch, max_prefetch_bytes)
+
+        async for status_data in pages:
+            for document in status_data.get('data') or []:
+                yield self._build_document(document)
+
+    async def _async_wait_within_deadline(
+            self,
+            id: str,
+            wait: Awaitable[T],
+            cancel: Callable[[str], Awaitable[Any]]) -> T:
+        """
+        Wait for a job, cancelling it if the current deadline passes first.
+
+        Args:
+            id (str): The ID of the job
+            wait (Awaitable): Waits for the job and returns its results
+            cancel (Callable): Coroutine function cancelling the job, given its ID
+
+        Returns:
+            T: The result of wait
+
+        Raises:
+            DeadlineExceededError: If the deadline passes, after the job is cancelled
+        """
+        try:
+            return await wait
+        except DeadlineExceededError as e:
+            e.job_id = id
+            # The deadline has passed, so the cancellation is sent without one
+            token = _deadline.set(None)
             try:
-                return CrawlResponse(**response)
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-        else:
-            await self._handle_error(response, 'start crawl job')
-
-    async def check_crawl_status(self, id: str) -> CrawlStatusResponse:
+                await cancel(id)
+            except Exception as cancel_error:
+                logger.warning(f"Failed to cancel job {id} after its deadline passed: {cancel_error}")
+            finally:
+                _deadline.reset(token)
+            raise
+
+    async def _async_wait_for_webhook(
+            self,
+            id: str,
+            receiver: WebhookReceiver,
+            check_status: Callable[[str], Any],
+            poll: Callable[[Optional[Callable[[FirecrawlDocument], Any]]], Awaitable[Any]],
+            on_document: Optional[Callable[[FirecrawlDocument], Any]] = None) -> Any:
         """
-        Check the status and results of an asynchronous crawl job.
+        Wait for a job to finish using the events sent to a webhook receiver, then fetch its results.
+
+        The receiver wakes the event loop as events arrive, so no thread is left
+        blocked if the wait is cancelled. If no event arrives within the
+        receiver's event_timeout, the job is polled instead, skipping the
+        documents already passed to on_document.
 
         Args:
-            id (str): Unique identifier for the crawl job
+            id (str): The ID of the job
+            receiver (WebhookReceiver): The receiver the job posts its events to
+            check_status (Callable): Coroutine function fetching the final status and results of the job
+            poll (Callable): Coroutine function polling the job until it finishes, given the document callback
+            on_document (Optional[Callable]): Called (or awaited) with each document as it is received
 
         Returns:
-            CrawlStatusResponse containing:
-            Status Information:
-            * status - Current state (scraping/completed/failed/cancelled)
-            * completed - Number of pages crawled
-            * total - Total pages to crawl
-            * creditsUsed - API credits consumed
-            * expiresAt - Data expiration timestamp
-            
-            Results:
-            * data - List of crawled documents
-            * next - URL for next page of results (if paginated)
-            * success - Whether status check succeeded
-            * error - Error message if failed
+            Any: The result of check_status once the job has completed, or of poll
 
         Raises:
-            Exception: If status check fails
+            Exception: If the job fails
+            DeadlineExceededError: If the deadline passes
         """
-        headers = self._prepare_headers()
-        endpoint = f'/v1/crawl/{id}'
-        
-        status_data = await self._async_get_request(
-            f'{self.api_url}{endpoint}',
-            headers
-        )
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
 
-        if status_data.get('status') == 'completed':
-            if 'data' in status_data:
-                data = status_data['data']
-                while 'next' in status_data:
-                    if len(status_data['data']) == 0:
-                        break
-                    next_url = status_data.get('next')
-                    if not next_url:
-                        logger.warning("Expected 'next' URL is missing.")
+        def wake() -> None:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # The loop has been closed
+
+        receiver._add_listener(id, wake)
+        documents = receiver.documents(id)
+        received = set()
+        try:
+            while True:
+                try:
+                    document = documents.get_nowait()
+                except queue.Empty:
+                    timeout, at_deadline = _next_event_wait(receiver.event_timeout)
+                    try:
+                        await asyncio.wait_for(event.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        if at_deadline:
+                            raise DeadlineExceededError('Deadline exceeded waiting for webhook events')
+                        logger.warning(f"No webhook event for job {id} in {timeout} seconds, polling it instead")
                         break
-                    next_data = await self._async_get_request(next_url, headers)
-                    data.extend(next_data.get('data', []))
-                    status_data = next_data
-                status_data['data'] = data
-        # Create CrawlStatusResponse object from status data
-        response = CrawlStatusResponse(
-            status=status_data.get('status'),
-            total=status_data.get('total'),
-            completed=status_data.get('completed'),
-            creditsUsed=status_data.get('creditsUsed'),
-            expiresAt=status_data.get('expiresAt'),
-            data=status_data.get('data'),
-            success=False if 'error' in status_data else True
-        )
+                    event.clear()
+                    continue
+                if document is None:
+                    timeout, at_deadline = _next_event_wait(receiver.event_timeout)
+                    try:
+                        await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(receiver.completion(id))), timeout)
+                    except asyncio.TimeoutError:
+                        raise DeadlineExceededError('Deadline exceeded waiting for webhook events')
+                    return await check_status(id)
+                url = _document_url(document.__dict__)
+                if url is not None:
+                    received.add(url)
+                if on_document is not None:
+                    result = on_document(document)
+                    if asyncio.iscoroutine(result):
+                        await result
+        finally:
+            receiver.forget(id)
+        return await poll(_skip_received(on_document, received))
+
+    async def _async_store_page(
+            self,
+            sink: ResultSink,
+            id: str,
+            status_data: Dict[str, Any],
+            on_document: Optional[Callable[[FirecrawlDocument], Any]] = None) -> None:
+        """
+        Write a page of documents to a result sink with its pagination cursor without
+        blocking the event loop, and record the job status.
 
-        if 'error' in status_data:
-            response.error = status_data.get('error')
+        Args:
+            sink (ResultSink): The sink to write to
+            id (str): The ID of the job
+            status_data (Dict[str, Any]): The page, as decoded from the API
+            on_document (Optional[Callable]): Also called (or awaited) with each document of the page
+        """
+        documents = status_data.get('data') or []
+        await asyncio.get_running_loop().run_in_executor(None, sink.add, documents, _page_cursor(sink, id, status_data))
+        sink.set_status(status_data)
+        if on_document is not None:
+            for document in documents:
+                result = on_document(self._build_document(document))
+                if asyncio.iscoroutine(result):
+                    await result
+
+    async def _async_fill_result_sink(
+            self,
+            id: str,
+            url: str,
+            sink: Union[ResultSink, str],
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> ResultSink:
+        """
+        Write the documents of a job's status response and of all its `next` pages to a
+        result sink. If the sink already holds a cursor of the job, resume after it.
 
-        if 'next' in status_data:
-            response.next = status_data.get('next')
+        Args:
+            id (str): The ID of the job
+            url (str): The status URL of the job
+            sink (Union[ResultSink, str]): The sink, or a file path to open one for
+            prefetch (int): Number of pages to fetch ahead of the one being written
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead
 
-        return response
+        Returns:
+            ResultSink: The sink
+
+        Raises:
+            Exception: If the results of the job to resume have expired
+        """
+        sink = _open_result_sink(sink)
+        url = self._resume_url(sink, id, url)
+        if url is not None:
+            pages = self._async_iter_status_pages(url, self._prepare_headers(), prefetch, max_prefetch_bytes)
+            async for status_data in pages:
+                await self._async_store_page(sink, id, status_data)
+        return sink
 
-    async def _async_monitor_job_status(self, id: str, headers: Dict[str, str], poll_interval: int = 2) -> CrawlStatusResponse:
+    async def _async_monitor_job_status(
+            self,
+            id: str,
+            headers: Dict[str, str],
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            on_document: Optional[Callable[[FirecrawlDocument], Any]] = None,
+            result_sink: Optional[ResultSink] = None) -> Union[CrawlStatusResponse, ResultSink]:
         """
         Monitor the status of an asynchronous job until completion.
 
         Args:
             id (str): The ID of the job to monitor
             headers (Dict[str, str]): Headers to include in status check requests
-            poll_interval (int): Seconds between status checks (default: 2)
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a strategy
+                (default: the client's polling_strategy)
+            on_document (Optional[Callable]): If given, documents are downloaded on every poll
+                while the job runs and passed to this callback (or coroutine function) as they arrive
+            result_sink (Optional[ResultSink]): If given, documents are downloaded on every poll
+                while the job runs and written to this sink, which is returned
 
         Returns:
-            CrawlStatusResponse: The job results if completed successfully
+            Union[CrawlStatusResponse, ResultSink]: The job results if completed successfully, or the sink
 
         Raises:
             Exception: If the job fails or an error occurs during status checks
         """
+        if result_sink is not None:
+            async for status_data in self._async_iter_progressive_pages(
+                    f'{self.api_url}/v1/crawl/{id}', headers, 'Crawl', poll_interval):
+                await self._async_store_page(result_sink, id, status_data, on_document)
+            return result_sink
+
+        if on_document is not None:
+            documents = []
+            async for status_data in self._async_iter_progressive_pages(
+                    f'{self.api_url}/v1/crawl/{id}', headers, 'Crawl', poll_interval):
+                for document in status_data.get('data') or []:
+                    document = self._build_document(document)
+                    documents.append(document)
+                    result = on_document(document)
+                    if asyncio.iscoroutine(result):
+                        await result
+            status_data['data'] = documents
+            return self._build_status_response(CrawlStatusResponse, status_data)
+
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
         while True:
             status_data = await self._async_get_request(
                 f'{self.api_url}/v1/crawl/{id}',
@@ -3703,22 +8342,16 @@ class AsyncFirecrawlApp(FirecrawlApp):
             if status_data.get('status') == 'completed':
                 if 'data' in status_data:
                     data = status_data['data']
-                    while 'next' in status_data:
-                        if len(status_data['data']) == 0:
-                            break
-                        next_url = status_data.get('next')
-                        if not next_url:
-                            logger.warning("Expected 'next' URL is missing.")
-                            break
-                        next_data = await self._async_get_request(next_url, headers)
+                    async for next_data in self._async_iter_next_pages(status_data, headers):
                         data.extend(next_data.get('data', []))
                         status_data = next_data
                     status_data['data'] = data
-                    return CrawlStatusResponse(**status_data)
+                    return self._build_status_response(CrawlStatusResponse, status_data)
                 else:
                     raise Exception('Job completed but no data was returned')
             elif status_data.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                await asyncio.sleep(max(poll_interval, 2))
+                state.record(status_data)
+                await _async_sleep(polling.next_interval(state))
             else:
                 raise Exception(f'Job failed or was stopped. Status: {status_data["status"]}')
 
@@ -3806,7 +8439,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
             allow_external_links: Optional[bool] = False,
             enable_web_search: Optional[bool] = False,
             show_sources: Optional[bool] = False,
-            agent: Optional[Dict[str, Any]] = None) -> ExtractResponse[Any]:
+            agent: Optional[Dict[str, Any]] = None,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            deadline: Optional[float] = None) -> ExtractResponse[Any]:
             
         """
         Asynchronously extract structured information from URLs.
@@ -3820,6 +8455,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
             enable_web_search (Optional[bool]): Enable web search
             show_sources (Optional[bool]): Include source URLs
             agent (Optional[Dict[str, Any]]): Agent configuration
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
+            deadline (Optional[float]): Seconds the whole call may take, including starting the job and waiting for it;
+                extract jobs can't be cancelled, so the job keeps running when the deadline passes
 
         Returns:
           ExtractResponse with:
@@ -3829,6 +8468,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         Raises:
           ValueError: If prompt/schema missing or extraction fails
+          DeadlineExceededError: If the deadline passes first
         """
         headers = self._prepare_headers()
 
@@ -3859,38 +8499,58 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if agent:
             request_data['agent'] = agent
 
-        response = await self._async_post_request(
-            f'{self.api_url}/v1/extract',
-            request_data,
-            headers
-        )
-
-        if response.get('success'):
-            job_id = response.get('id')
-            if not job_id:
-                raise Exception('Job ID not returned from extract request.')
-
-            while True:
-                status_data = await self._async_get_request(
-                    f'{self.api_url}/v1/extract/{job_id}',
+        job_id = None
+        try:
+            with _deadline_scope(deadline):
+                response = await self._async_post_request(
+                    f'{self.api_url}/v1/extract',
+                    request_data,
                     headers
                 )
 
-                if status_data['status'] == 'completed':
-                    return ExtractResponse(**status_data)
-                elif status_data['status'] in ['failed', 'cancelled']:
-                    raise Exception(f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
+                if response.get('success'):
+                    job_id = response.get('id')
+                    if not job_id:
+                        raise Exception('Job ID not returned from extract request.')
 
-                await asyncio.sleep(2)
-        else:
-            raise Exception(f'Failed to extract. Error: {response.get("error")}')
+                    polling = self._get_polling_strategy(poll_interval)
+                    state = PollingState()
+                    while True:
+                        status_data = await self._async_get_request(
+                            f'{self.api_url}/v1/extract/{job_id}',
+                            headers
+                        )
 
-    async def check_batch_scrape_status(self, id: str) -> BatchScrapeStatusResponse:
+                        if status_data['status'] == 'completed':
+                            return ExtractResponse(**status_data)
+                        elif status_data['status'] in ['failed', 'cancelled']:
+                            raise Exception(f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
+
+                        state.record(status_data)
+                        await _async_sleep(polling.next_interval(state))
+                else:
+                    raise Exception(f'Failed to extract. Error: {response.get("error")}')
+        except DeadlineExceededError as e:
+            # The API can't cancel extract jobs, so the job is left to finish
+            e.job_id = job_id
+            raise
+
+    async def check_batch_scrape_status(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024,
+            result_sink: Optional[Union[ResultSink, str]] = None) -> Union[BatchScrapeStatusResponse, ResultSink]:
         """
         Check the status of an asynchronous batch scrape job.
 
         Args:
             id (str): The ID of the batch scrape job
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+            result_sink (Optional[Union[ResultSink, str]]): Write the documents of every page to this sink, or to a new
+                sink for a file path, and return the sink instead
 
         Returns:
             BatchScrapeStatusResponse containing:
@@ -3912,46 +8572,98 @@ class AsyncFirecrawlApp(FirecrawlApp):
         """
         headers = self._prepare_headers()
         endpoint = f'/v1/batch/scrape/{id}'
+        if result_sink is not None:
+            return await self._async_fill_result_sink(
+                id, f'{self.api_url}{endpoint}', result_sink, prefetch, max_prefetch_bytes)
 
         status_data = await self._async_get_request(
-            f'{self.api_url}{endpoint}',
+            self._status_url(f'{self.api_url}{endpoint}', prefetch),
             headers
         )
 
         if status_data['status'] == 'completed':
             if 'data' in status_data:
                 data = status_data['data']
-                while 'next' in status_data:
-                    if len(status_data['data']) == 0:
-                        break
-                    next_url = status_data.get('next')
-                    if not next_url:
-                        logger.warning("Expected 'next' URL is missing.")
-                        break
-                    next_data = await self._async_get_request(next_url, headers)
+                async for next_data in self._async_iter_next_pages(status_data, headers, prefetch, max_prefetch_bytes):
                     data.extend(next_data.get('data', []))
                     status_data = next_data
                 status_data['data'] = data
 
-        response = BatchScrapeStatusResponse(
-            status=status_data.get('status'),
-            total=status_data.get('total'),
-            completed=status_data.get('completed'),
-            creditsUsed=status_data.get('creditsUsed'),
-            expiresAt=status_data.get('expiresAt'),
-            data=status_data.get('data')
-        )
+        return self._build_status_response(BatchScrapeStatusResponse, {
+            'success': False if 'error' in status_data else True,
+            'status': status_data.get('status'),
+            'total': status_data.get('total'),
+            'completed': status_data.get('completed'),
+            'creditsUsed': status_data.get('creditsUsed'),
+            'expiresAt': status_data.get('expiresAt'),
+            'data': status_data.get('data'),
+            'next': status_data.get('next'),
+            'error': status_data.get('error')
+        })
+
+    async def iter_batch_scrape_documents(
+            self,
+            id: str,
+            *,
+            wait: bool = False,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Asynchronously iterate over the documents of a batch scrape job one results page at a time.
 
-        if 'error' in status_data:
-            response['error'] = status_data['error']
+        Only the current page is held in memory, and the remaining pages are not
+        fetched if the caller stops iterating early.
 
-        if 'next' in status_data:
-            response['next'] = status_data['next']
+        Args:
+            id (str): The ID of the batch scrape job
+            wait (bool): Keep polling until the job finishes, yielding new documents as they are scraped
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks when waiting, or a
+                PollingStrategy (default: the client's polling_strategy)
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read, ignored when
+                waiting (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
 
-        return {
-            'success': False if 'error' in status_data else True,
-            **response
-        }
+        Returns:
+            AsyncIterator[FirecrawlDocument]: The scraped documents, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails, or the job fails while waiting
+        """
+        async for document in self._async_iter_job_documents(
+                f'{self.api_url}/v1/batch/scrape/{id}', 'Batch scrape',
+                wait, poll_interval, prefetch, max_prefetch_bytes):
+            yield document
+
+    async def get_batch_scrape_result_set(
+            self,
+            id: str,
+            *,
+            prefetch: int = 0,
+            max_prefetch_bytes: int = 64 * 1024 * 1024) -> CrawlResultSet:
+        """
+        Asynchronously download the documents of a batch scrape job into a CrawlResultSet.
+
+        Each results page is added to the set as it arrives, without building a
+        FirecrawlDocument per document, so large jobs take much less memory than
+        with check_batch_scrape_status.
+
+        Args:
+            id (str): The ID of the batch scrape job
+            prefetch (int): Number of result pages to fetch concurrently ahead of the one being read (default: 0)
+            max_prefetch_bytes (int): Approximate cap on the size of pages fetched ahead (default: 64 MiB)
+
+        Returns:
+            CrawlResultSet: The documents available now, in result order
+
+        Raises:
+            Exception: If a status or pagination request fails
+        """
+        result_set = CrawlResultSet()
+        async for status_data in self._async_iter_status_pages(
+                f'{self.api_url}/v1/batch/scrape/{id}', self._prepare_headers(), prefetch, max_prefetch_bytes):
+            result_set.extend(status_data.get('data') or [])
+        return result_set
 
     async def check_batch_scrape_errors(self, id: str) -> CrawlErrorsResponse:
         """
@@ -3978,6 +8690,24 @@ class AsyncFirecrawlApp(FirecrawlApp):
             headers
         )
 
+    async def cancel_batch_scrape(self, id: str) -> Dict[str, Any]:
+        """
+        Cancel an asynchronous batch scrape job.
+
+        Args:
+            id (str): The ID of the batch scrape job to cancel
+
+        Returns:
+            Dict[str, Any] containing:
+            * success (bool): Whether cancellation was successful
+            * error (str, optional): Error message if cancellation failed
+
+        Raises:
+            Exception: If cancellation fails
+        """
+        headers = self._prepare_headers()
+        return await self._async_delete_request(f'{self.api_url}/v1/batch/scrape/{id}', headers)
+
     async def check_crawl_errors(self, id: str) -> CrawlErrorsResponse:
         """
         Get information about errors from an asynchronous crawl job.
@@ -4019,9 +8749,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             Exception: If cancellation fails
         """
         headers = self._prepare_headers()
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(f'{self.api_url}/v1/crawl/{id}', headers=headers) as response:
-                return await response.json()
+        return await self._async_delete_request(f'{self.api_url}/v1/crawl/{id}', headers)
 
     async def get_extract_status(self, job_id: str) -> ExtractResponse[Any]:
         """
@@ -4126,7 +8854,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             *,
             max_urls: Optional[int] = None,
             show_full_text: Optional[bool] = None,
-            experimental_stream: Optional[bool] = None) -> GenerateLLMsTextStatusResponse:
+            experimental_stream: Optional[bool] = None,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None) -> GenerateLLMsTextStatusResponse:
         """
         Generate LLMs.txt for a given URL and monitor until completion.
 
@@ -4135,6 +8864,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             max_urls (Optional[int]): Maximum URLs to process (default: 10)
             show_full_text (Optional[bool]): Include full text in output (default: False)
             experimental_stream (Optional[bool]): Enable experimental streaming
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
 
         Returns:
             GenerateLLMsTextStatusResponse containing:
@@ -4168,6 +8899,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             return response
 
         job_id = response['id']
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
         while True:
             status = await self.check_generate_llms_text_status(job_id)
             
@@ -4178,7 +8911,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             elif status['status'] != 'processing':
                 break
 
-            await asyncio.sleep(2)
+            state.record(status)
+            await asyncio.sleep(polling.next_interval(state))
 
         return GenerateLLMsTextStatusResponse(success=False, error='LLMs.txt generation job terminated unexpectedly')
 
@@ -4277,7 +9011,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             system_prompt: Optional[str] = None,
             __experimental_stream_steps: Optional[bool] = None,
             on_activity: Optional[Callable[[Dict[str, Any]], None]] = None,
-            on_source: Optional[Callable[[Dict[str, Any]], None]] = None) -> DeepResearchStatusResponse:
+            on_source: Optional[Callable[[Dict[str, Any]], None]] = None,
+            poll_interval: Optional[Union[float, PollingStrategy]] = None) -> DeepResearchStatusResponse:
         """
         Initiates a deep research operation on a given query and polls until completion.
 
@@ -4291,6 +9026,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             __experimental_stream_steps (Optional[bool]): Enable experimental streaming
             on_activity (Optional[Callable]): Progress callback receiving {type, status, message, timestamp, depth}
             on_source (Optional[Callable]): Source discovery callback receiving {url, title, description}
+            poll_interval (Optional[Union[float, PollingStrategy]]): Seconds between status checks, or a PollingStrategy
+                (default: the client's polling_strategy)
 
         Returns:
             DeepResearchStatusResponse containing:
@@ -4335,6 +9072,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
         job_id = response['id']
         last_activity_count = 0
         last_source_count = 0
+        polling = self._get_polling_strategy(poll_interval)
+        state = PollingState()
 
         while True:
             status = await self.check_deep_research_status(job_id)
@@ -4358,7 +9097,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             elif status['status'] != 'processing':
                 break
 
-            await asyncio.sleep(2)
+            state.record(status)
+            await asyncio.sleep(polling.next_interval(state))
 
         return DeepResearchStatusResponse(success=False, error='Deep research job terminated unexpectedly')
 
@@ -4540,58 +9280,15 @@ class AsyncCrawlWatcher(CrawlWatcher):
     """
     Async version of CrawlWatcher that properly handles async operations.
     """
-    def __init__(self, id: str, app: AsyncFirecrawlApp):
-        super().__init__(id, app)
-
-    async def connect(self) -> None:
-        """
-        Establishes async WebSocket connection and starts listening for messages.
-        """
-        async with websockets.connect(
-            self.ws_url,
-            additional_headers=[("Authorization", f"Bearer {self.app.api_key}")]
-        ) as websocket:
-            await self._listen(websocket)
-
-    async def _listen(self, websocket) -> None:
-        """
-        Listens for incoming WebSocket messages and handles them asynchronously.
-
-        Args:
-            websocket: The WebSocket connection object
-        """
-        async for message in websocket:
-            msg = json.loads(message)
-            await self._handle_message(msg)
-
-    async def _handle_message(self, msg: Dict[str, Any]) -> None:
-        """
-        Handles incoming WebSocket messages based on their type asynchronously.
-
-        Args:
-            msg (Dict[str, Any]): The message to handle
-        """
-        if msg['type'] == 'done':
-            self.status = 'completed'
-            self.dispatch_event('done', {'status': self.status, 'data': self.data, 'id': self.id})
-        elif msg['type'] == 'error':
-            self.status = 'failed'
-            self.dispatch_event('error', {'status': self.status, 'data': self.data, 'error': msg['error'], 'id': self.id})
-        elif msg['type'] == 'catchup':
-            self.status = msg['data']['status']
-            self.data.extend(msg['data'].get('data', []))
-            for doc in self.data:
-                self.dispatch_event('document', {'data': doc, 'id': self.id})
-        elif msg['type'] == 'document':
-            self.data.append(msg['data'])
-            self.dispatch_event('document', {'data': msg['data'], 'id': self.id})
+    def __init__(self, id: str, app: AsyncFirecrawlApp, **kwargs):
+        super().__init__(id, app, **kwargs)
 
     async def _handle_error(self, response: aiohttp.ClientResponse, action: str) -> None:
         """
         Handle errors from async API responses.
         """
         try:
-            error_data = await response.json()
+            error_data = await response.json(loads=_json_codec.loads)
             error_message = error_data.get('error', 'No error message provided.')
             error_details = error_data.get('details', 'No additional error details provided.')
         except:
@@ -4616,3 +9313,511 @@ class AsyncCrawlWatcher(CrawlWatcher):
             str: A formatted error message
         """
         return self._get_error_message(status_code, action, error_message, error_details)
+
+class _DomainRoundRobin:
+    """
+    URLs queued per target domain and handed out round-robin across domains,
+    with a cap on how many of each domain are in flight.
+    """
+    def __init__(self, urls: List[str], max_per_domain: int = 0):
+        self.max_per_domain = max_per_domain
+        self._queues: Dict[str, deque] = {}
+        for index, url in enumerate(urls):
+            self._queues.setdefault(self.domain(url), deque()).append((index, url))
+        self._ring = deque(self._queues)
+        self._active = {domain: 0 for domain in self._queues}
+
+    @staticmethod
+    def domain(url: str) -> str:
+        """Host of a URL, also for URLs given without a scheme."""
+        parsed = urlparse(url if '//' in url else f'//{url}')
+        return (parsed.hostname or url).lower()
+
+    def next(self) -> Optional[Tuple[int, str]]:
+        """
+        Take the next URL of the first domain in turn that is below its cap.
+
+        Returns:
+            Optional[Tuple[int, str]]: The index and URL, or None if every domain with queued URLs is at its cap
+        """
+        for _ in range(len(self._ring)):
+            domain = self._ring[0]
+            self._ring.rotate(-1)
+            if self.max_per_domain and self._active[domain] >= self.max_per_domain:
+                continue
+            queue = self._queues[domain]
+            item = queue.popleft()
+            self._active[domain] += 1
+            if not queue:
+                # The domain was just rotated to the end of the ring
+                self._ring.pop()
+            return item
+        return None
+
+    def release(self, url: str) -> None:
+        """Mark a URL handed out by next() as finished."""
+        self._active[self.domain(url)] -= 1
+
+    def drain(self) -> List[Tuple[int, str]]:
+        """Remove and return every queued URL."""
+        items = [item for domain in self._ring for item in self._queues[domain]]
+        for domain in self._ring:
+            self._queues[domain].clear()
+        self._ring.clear()
+        return sorted(items)
+
+class _MonitoredJob:
+    """
+    A job tracked by a JobMonitor.
+    """
+    def __init__(
+            self,
+            kind: str,
+            id: str,
+            future: Any,
+            polling: PollingStrategy,
+            on_status: Optional[Callable[[Any], None]] = None):
+        self.kind = kind
+        self.id = id
+        self.future = future
+        self.polling = polling
+        self.on_status = on_status
+        self.state = PollingState()
+        self.errors = 0
+
+class JobMonitor:
+    """
+    Track many crawl, batch scrape, extract, deep research and LLMs.txt jobs from one background thread.
+
+    Every watched job gets a concurrent.futures.Future that resolves with the
+    result of the matching check/get status method once the job completes, or
+    raises if the job fails. Status checks that fall due within `coalesce_window`
+    of each other share one wake-up, and at most `max_concurrency` of them run
+    at a time, so a single monitor can track thousands of jobs.
+
+    Attributes:
+        app (FirecrawlApp): The FirecrawlApp instance used for status checks
+        max_concurrency (int): Maximum number of status checks in flight
+        polling_strategy (Optional[PollingStrategy]): Default strategy of the watched jobs
+        coalesce_window (float): Seconds by which a status check may be brought forward to share a wake-up
+        max_errors (int): Consecutive failed status checks after which a job's future raises
+    """
+    # Job kind -> (lightweight status endpoint, method returning the job's result)
+    JOB_KINDS = {
+        'crawl': ('/v1/crawl/{id}', 'check_crawl_status'),
+        'batch_scrape': ('/v1/batch/scrape/{id}', 'check_batch_scrape_status'),
+        'extract': (None, 'get_extract_status'),
+        'deep_research': (None, 'check_deep_research_status'),
+        'llms_text': (None, 'check_generate_llms_text_status'),
+    }
+
+    def __init__(
+            self,
+            app: FirecrawlApp,
+            *,
+            max_concurrency: int = 8,
+            polling_strategy: Optional[PollingStrategy] = None,
+            coalesce_window: float = 0.25,
+            max_errors: int = 3) -> None:
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.polling_strategy = polling_strategy
+        self.coalesce_window = coalesce_window
+        self.max_errors = max_errors
+        self._queue: List[Any] = []
+        self._sequence = itertools.count()
+        self._jobs: set = set()
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> 'JobMonitor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of watched jobs that have not finished yet."""
+        return len(self._jobs)
+
+    def watch(
+            self,
+            kind: str,
+            id: str,
+            *,
+            polling_strategy: Optional[PollingStrategy] = None,
+            on_status: Optional[Callable[[Any], None]] = None) -> Future:
+        """
+        Start tracking a job.
+
+        Args:
+            kind (str): The kind of job ('crawl', 'batch_scrape', 'extract', 'deep_research' or 'llms_text')
+            id (str): The ID of the job
+            polling_strategy (Optional[PollingStrategy]): Strategy for this job (default: the monitor's, then the
+                client's)
+            on_status (Optional[Callable[[Any], None]]): Called with every status check of the job, including the final
+                one
+
+        Returns:
+            Future: Resolves with the job's result, or raises if the job fails
+
+        Raises:
+            ValueError: If the kind of job is unknown or the monitor is closed
+        """
+        if kind not in self.JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}. Expected one of {', '.join(self.JOB_KINDS)}")
+        if self._closed:
+            raise ValueError('JobMonitor is closed')
+        job = _MonitoredJob(
+            kind, id, self._create_future(),
+            self.app._get_polling_strategy(polling_strategy or self.polling_strategy),
+            on_status)
+        self._jobs.add(job)
+        self._start()
+        self._schedule(job, 0)
+        return job.future
+
+    def watch_crawl(self, id: str, **kwargs) -> Future:
+        """Start tracking a crawl job. See watch()."""
+        return self.watch('crawl', id, **kwargs)
+
+    def watch_batch_scrape(self, id: str, **kwargs) -> Future:
+        """Start tracking a batch scrape job. See watch()."""
+        return self.watch('batch_scrape', id, **kwargs)
+
+    def watch_extract(self, id: str, **kwargs) -> Future:
+        """Start tracking an extract job. See watch()."""
+        return self.watch('extract', id, **kwargs)
+
+    def watch_deep_research(self, id: str, **kwargs) -> Future:
+        """Start tracking a deep research job. See watch()."""
+        return self.watch('deep_research', id, **kwargs)
+
+    def watch_llms_text(self, id: str, **kwargs) -> Future:
+        """Start tracking an LLMs.txt generation job. See watch()."""
+        return self.watch('llms_text', id, **kwargs)
+
+    def close(self) -> None:
+        """
+        Stop the background thread and cancel the futures of unfinished jobs.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for job in list(self._jobs):
+            job.future.cancel()
+        self._jobs.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _create_future(self) -> Future:
+        return Future()
+
+    def _start(self) -> None:
+        """
+        Start the background thread and the status check pool on first use.
+        """
+        with self._condition:
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix='firecrawl-monitor')
+                self._thread = threading.Thread(target=self._run, name='firecrawl-job-monitor', daemon=True)
+                self._thread.start()
+
+    def _schedule(self, job: _MonitoredJob, delay: float) -> None:
+        with self._condition:
+            heapq.heappush(self._queue, (time.monotonic() + delay, next(self._sequence), job))
+            self._condition.notify()
+
+    def _pop_due(self) -> List[_MonitoredJob]:
+        """
+        Remove the jobs due within the coalescing window of now from the schedule.
+
+        Returns:
+            List[_MonitoredJob]: The jobs to check, skipping the ones whose futures were cancelled
+        """
+        horizon = time.monotonic() + self.coalesce_window
+        due = []
+        while self._queue and self._queue[0][0] <= horizon:
+            job = heapq.heappop(self._queue)[2]
+            if job.future.done():
+                self._jobs.discard(job)
+            else:
+                due.append(job)
+        return due
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        delay = self._queue[0][0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                due = self._pop_due()
+            for job in due:
+                try:
+                    self._executor.submit(self._poll, job)
+                except RuntimeError:
+                    # The pool was shut down by close()
+                    return
+
+    def _poll(self, job: _MonitoredJob) -> None:
+        """
+        Check the status of a job, then resolve its future or schedule the next check.
+        """
+        try:
+            status = self._check(job)
+        except Exception as e:
+            self._handle_check_error(job, e)
+        else:
+            self._handle_status(job, status)
+
+    def _check(self, job: _MonitoredJob) -> Any:
+        """
+        Fetch the status of a job.
+
+        Crawls and batch scrapes are polled with a single-document page, and their
+        full results are only downloaded once they have completed.
+
+        Returns:
+            Any: The status response, or the job's result once it has completed
+        """
+        endpoint, method = self.JOB_KINDS[job.kind]
+        if endpoint is not None:
+            url = self.app._set_query_params(f'{self.app.api_url}{endpoint.format(id=job.id)}', {'limit': 1})
+            response = self.app._get_request(url, self.app._prepare_headers())
+            if response.status_code != 200:
+                self.app._handle_error(response, f'check {job.kind} status')
+            status_data = _response_json(response)
+            if status_data.get('status') != 'completed':
+                return status_data
+        return getattr(self.app, method)(job.id)
+
+    def _handle_check_error(self, job: _MonitoredJob, error: Exception) -> None:
+        job.errors += 1
+        if job.errors >= self.max_errors:
+            self._resolve(job, exception=error)
+        else:
+            logger.debug(f"Status check of {job.kind} job {job.id} failed, retrying: {error}")
+            job.state.record({})
+            self._schedule(job, job.polling.next_interval(job.state))
+
+    def _handle_status(self, job: _MonitoredJob, status: Any) -> None:
+        job.errors = 0
+        if job.on_status is not None:
+            try:
+                job.on_status(status)
+            except Exception as e:
+                logger.error(f"Error in status callback of {job.kind} job {job.id}: {e}")
+        value = status.get('status') if isinstance(status, dict) else getattr(status, 'status', None)
+        if value == 'completed':
+            self._resolve(job, result=status)
+        elif value in ['failed', 'cancelled']:
+            error = status.get('error') if isinstance(status, dict) else getattr(status, 'error', None)
+            self._resolve(job, exception=Exception(f'{job.kind} job {job.id} {value}. Error: {error}'))
+        else:
+            job.state.record(status)
+            self._schedule(job, job.polling.next_interval(job.state))
+
+    def _resolve(self, job: _MonitoredJob, result: Any = None, exception: Optional[Exception] = None) -> None:
+        self._jobs.discard(job)
+        if job.future.done():
+            return
+        try:
+            if exception is not None:
+                job.future.set_exception(exception)
+            else:
+                job.future.set_result(result)
+        except (InvalidStateError, asyncio.InvalidStateError):
+            # Cancelled by the caller in the meantime
+            pass
+
+class AsyncJobMonitor(JobMonitor):
+    """
+    Async version of JobMonitor that tracks jobs from one task on the running event loop.
+
+    watch() and its shortcuts must be called from the event loop, and return
+    asyncio futures.
+    """
+    def __init__(self, app: AsyncFirecrawlApp, **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._polls: set = set()
+
+    async def __aenter__(self) -> 'AsyncJobMonitor':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Stop the monitor task and cancel the futures of unfinished jobs.
+        """
+        self._closed = True
+        tasks = [task for task in [self._task, *self._polls] if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in list(self._jobs):
+            job.future.cancel()
+        self._jobs.clear()
+
+    def _create_future(self) -> asyncio.Future:
+        return asyncio.get_running_loop().create_future()
+
+    def _start(self) -> None:
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._task = asyncio.ensure_future(self._run())
+
+    def _schedule(self, job: _MonitoredJob, delay: float) -> None:
+        heapq.heappush(self._queue, (time.monotonic() + delay, next(self._sequence), job))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.clear()
+            delay = self._queue[0][0] - time.monotonic() if self._queue else None
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            for job in self._pop_due():
+                task = asyncio.ensure_future(self._poll(job))
+                self._polls.add(task)
+                task.add_done_callback(self._polls.discard)
+
+    async def _poll(self, job: _MonitoredJob) -> None:
+        async with self._semaphore:
+            try:
+                status = await self._check(job)
+            except Exception as e:
+                self._handle_check_error(job, e)
+            else:
+                self._handle_status(job, status)
+
+    async def _check(self, job: _MonitoredJob) -> Any:
+        endpoint, method = self.JOB_KINDS[job.kind]
+        if endpoint is not None:
+            url = self.app._set_query_params(f'{self.app.api_url}{endpoint.format(id=job.id)}', {'limit': 1})
+            status_data = await self.app._async_get_request(url, self.app._prepare_headers())
+            if status_data.get('status') != 'completed':
+                return status_data
+        return await getattr(self.app, method)(job.id)
+
+class _BatchScrapeShards:
+    """
+    Bookkeeping of the chunk jobs of a sharded batch scrape.
+
+    Status updates may arrive from the threads of a JobMonitor, so every
+    update happens under a lock and hands a fresh BatchScrapeProgress to the
+    progress callback.
+    """
+    def __init__(
+            self,
+            urls: List[str],
+            chunk_size: int,
+            on_progress: Optional[Callable[[BatchScrapeProgress], Any]] = None):
+        self.chunks = [urls[i:i + chunk_size] for i in range(0, len(urls), chunk_size)]
+        self.on_progress = on_progress
+        self.attempts = [0] * len(self.chunks)
+        self._statuses: Dict[int, Dict[str, int]] = {}
+        self._spent_credits = 0
+        self._completed_chunks = 0
+        self._retried_chunks = 0
+        self._invalid_urls: List[str] = []
+        self._lock = threading.Lock()
+
+    def started(self, index: int, job: BatchScrapeResponse) -> None:
+        with self._lock:
+            self._statuses[index] = {'total': len(self.chunks[index]), 'completed': 0, 'creditsUsed': 0}
+            if job.invalidURLs:
+                self._invalid_urls.extend(job.invalidURLs)
+        self._report()
+
+    def update(self, index: int, status: Any) -> None:
+        with self._lock:
+            if index not in self._statuses:
+                return
+            for key in ['total', 'completed', 'creditsUsed']:
+                value = status.get(key) if isinstance(status, dict) else getattr(status, key, None)
+                if value is not None:
+                    self._statuses[index][key] = value
+        self._report()
+
+    def completed(self, index: int) -> None:
+        with self._lock:
+            self._completed_chunks += 1
+        self._report()
+
+    def retry(self, index: int, error: Exception, max_retries: int) -> bool:
+        """
+        Record a failed attempt of a chunk job.
+
+        Returns:
+            bool: Whether the chunk should be submitted again
+        """
+        self.attempts[index] += 1
+        if self.attempts[index] > max_retries:
+            return False
+        logger.warning(f"Batch scrape chunk {index} failed, retrying ({self.attempts[index]}/{max_retries}): {error}")
+        with self._lock:
+            status = self._statuses.pop(index, None)
+            if status is not None:
+                self._spent_credits += status['creditsUsed']
+            self._retried_chunks += 1
+        self._report()
+        return True
+
+    def progress(self) -> BatchScrapeProgress:
+        with self._lock:
+            statuses = [self._statuses.get(i) for i in range(len(self.chunks))]
+            return BatchScrapeProgress(
+                totalChunks=len(self.chunks),
+                completedChunks=self._completed_chunks,
+                retriedChunks=self._retried_chunks,
+                total=sum(status['total'] if status else len(chunk) for status, chunk in zip(statuses, self.chunks)),
+                completed=sum(status['completed'] for status in statuses if status),
+                creditsUsed=self._spent_credits + sum(status['creditsUsed'] for status in statuses if status),
+                invalidURLs=list(self._invalid_urls)
+            )
+
+    def sort_documents(self, index: int, documents: List[FirecrawlDocument]) -> List[FirecrawlDocument]:
+        """
+        Put the documents of a chunk back in the order of its URLs.
+
+        Batch scrape results come back in the order the pages finished, so documents
+        are matched to their URL by metadata.sourceURL, and the ones that can't be
+        matched keep their relative order at the end.
+        """
+        positions = {url: position for position, url in enumerate(self.chunks[index])}
+
+        def position(document: FirecrawlDocument) -> int:
+            metadata = document.metadata if isinstance(document.metadata, dict) else {}
+            return positions.get(metadata.get('sourceURL') or document.url, len(positions))
+
+        return sorted(documents, key=position)
+
+    def _report(self) -> None:
+        if self.on_progress is not None:
+            try:
+                self.on_progress(self.progress())
+            except Exception as e:
+                logger.error(f"Error in batch scrape progress callback: {e}")
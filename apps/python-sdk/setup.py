@@ -36,6 +36,11 @@ setup(
         'pydantic',
         'aiohttp'
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'fast-json': ['orjson'],
+        'zstd': ['zstandard'],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+from aiohttp import web
+
+
+def make_response(payload, status_code=200, headers=None):
+    """A mocked requests response whose json() returns payload."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = headers or {}
+    return response
+
+
+async def start_api_server(routes):
+    """
+    Serve routes on a free local port, standing in for the API.
+
+    Returns the runner, to clean up once done, and the server's base URL.
+    """
+    server_app = web.Application()
+    server_app.add_routes(routes)
+    runner = web.AppRunner(server_app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0).start()
+    host, port = runner.addresses[0][:2]
+    return runner, f'http://{host}:{port}'
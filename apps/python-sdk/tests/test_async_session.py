@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+
+from firecrawl import AsyncFirecrawlApp
+
+from helpers import start_api_server
+
+
+class TestAsyncSession(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.peers = set()
+
+        async def status(request):
+            self.peers.add(request.transport.get_extra_info('peername'))
+            return web.json_response({'success': True, 'status': 'completed'})
+
+        self.runner, self.api_url = await start_api_server([web.get('/v1/crawl/{id}', status)])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_requests_reuse_one_connection(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            for _ in range(5):
+                await app._async_get_request(f'{self.api_url}/v1/crawl/123', app._prepare_headers())
+            self.assertIs(app._get_async_session(), app._get_async_session())
+        self.assertEqual(len(self.peers), 1)
+        self.assertIsNone(app._async_session)
+
+    async def test_connector_settings_are_applied(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url, connector_limit=7, connector_limit_per_host=3) as app:
+            connector = app._get_async_session().connector
+            self.assertEqual(connector.limit, 7)
+            self.assertEqual(connector.limit_per_host, 3)
+
+
+class TestAsyncSessionAcrossLoops(unittest.TestCase):
+    def test_session_is_recreated_for_a_new_loop(self):
+        app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url='http://localhost:3002')
+
+        async def get_session():
+            return app._get_async_session()
+
+        first = asyncio.run(get_session())
+        second = asyncio.run(get_session())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        asyncio.run(app.close())
+
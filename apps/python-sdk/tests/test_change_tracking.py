@@ -5,7 +5,7 @@ import os
 from firecrawl import FirecrawlApp
 
 class TestChangeTracking(unittest.TestCase):
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_change_tracking_format(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -34,7 +34,7 @@ class TestChangeTracking(unittest.TestCase):
         self.assertEqual(result['changeTracking']['changeStatus'], 'changed')
         self.assertEqual(result['changeTracking']['visibility'], 'visible')
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_change_tracking_options(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -0,0 +1,126 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from firecrawl import (
+    FirecrawlApp, AsyncFirecrawlApp, AdaptiveConcurrencyLimiter, CircuitBreaker, CircuitBreakers,
+    CircuitBreakerOpenError, RetryPolicy)
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+
+def call(breaker, failed, latency=0.01):
+    breaker.before_call()
+    breaker.after_call(failed, latency)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_on_failure_rate_and_recovers(self):
+        changes = []
+        breaker = CircuitBreaker(
+            'scrape', window=4, minimum_calls=4, failure_rate_threshold=0.5, open_duration=0.1,
+            on_state_change=lambda family, old, new: changes.append((family, old, new)))
+
+        call(breaker, False)
+        call(breaker, True)
+        call(breaker, False)
+        self.assertEqual(breaker.state, 'closed')
+        call(breaker, True)
+        self.assertEqual(breaker.state, 'open')
+        with self.assertRaises(CircuitBreakerOpenError) as error:
+            breaker.before_call()
+        self.assertEqual(error.exception.family, 'scrape')
+
+        time.sleep(0.15)
+        self.assertEqual(breaker.state, 'half_open')
+        breaker.before_call()
+        # Only one trial call at a time
+        with self.assertRaises(CircuitBreakerOpenError):
+            breaker.before_call()
+        breaker.after_call(False)
+
+        self.assertEqual(breaker.state, 'closed')
+        self.assertEqual(changes, [
+            ('scrape', 'closed', 'open'),
+            ('scrape', 'open', 'half_open'),
+            ('scrape', 'half_open', 'closed'),
+        ])
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker('crawl', window=2, minimum_calls=2, open_duration=0.05)
+        call(breaker, True)
+        call(breaker, True)
+        time.sleep(0.06)
+        call(breaker, True)
+        self.assertEqual(breaker.state, 'open')
+
+    def test_cancelled_trial_frees_its_slot(self):
+        breaker = CircuitBreaker('crawl', window=1, minimum_calls=1, open_duration=0)
+        call(breaker, True)
+        breaker.before_call()
+        breaker.cancel_call()
+        breaker.before_call()
+        breaker.after_call(False)
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker('map', window=2, minimum_calls=2, slow_call_threshold=1)
+        call(breaker, False, latency=2)
+        call(breaker, False, latency=3)
+        self.assertEqual(breaker.state, 'open')
+
+
+class TestCircuitBreakers(unittest.TestCase):
+    def test_endpoint_families(self):
+        breakers = CircuitBreakers()
+        self.assertEqual(breakers.for_url(f'{API_URL}/v1/scrape').family, 'scrape')
+        self.assertEqual(breakers.for_url(f'{API_URL}/v1/crawl/abc?skip=10').family, 'crawl')
+        self.assertEqual(breakers.for_url(f'{API_URL}/v1/batch/scrape/abc').family, 'batch')
+        self.assertEqual(breakers.for_url(f'{API_URL}/v1/extract/abc').family, 'extract')
+        self.assertIsNone(breakers.for_url(f'{API_URL}/v1/deep-research'))
+        self.assertIs(breakers['crawl'], breakers.for_url(f'{API_URL}/v1/crawl'))
+        self.assertEqual(breakers.states(), {'scrape': 'closed', 'crawl': 'closed', 'batch': 'closed', 'extract': 'closed'})
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_client_fails_fast_while_open(self, mock_get, mock_sleep):
+        mock_get.return_value = make_response({'success': False, 'error': 'down'}, 500)
+        breakers = CircuitBreakers(window=3, minimum_calls=3, open_duration=60)
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, circuit_breakers=breakers, retry_policy=RetryPolicy(max_attempts=5))
+
+        # The breaker opens during the retries of the first request and stops them
+        with self.assertRaises(CircuitBreakerOpenError):
+            app.check_crawl_status('abc')
+        self.assertEqual(mock_get.call_count, 3)
+
+        with self.assertRaises(CircuitBreakerOpenError):
+            app.check_crawl_status('abc')
+        self.assertEqual(mock_get.call_count, 3)
+        # Other endpoint families are unaffected
+        self.assertEqual(breakers.states(), {'crawl': 'open'})
+
+    def test_cancelled_limiter_wait_keeps_no_trial_call(self):
+        breakers = CircuitBreakers(window=1, minimum_calls=1, open_duration=0)
+        call(breakers['crawl'], True)
+        limiter = AdaptiveConcurrencyLimiter(1, max_limit=1)
+        limiter.acquire()
+        app = AsyncFirecrawlApp(
+            api_key='dummy-api-key', api_url=API_URL, circuit_breakers=breakers, concurrency_limiter=limiter)
+
+        async def run():
+            task = asyncio.ensure_future(app.check_crawl_status('abc'))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        # The half-open breaker's trial call is still free
+        breakers['crawl'].before_call()
+
+
+if __name__ == '__main__':
+    unittest.main()
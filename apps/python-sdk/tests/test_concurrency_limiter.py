@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+import unittest
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, AdaptiveConcurrencyLimiter, RetryPolicy
+from firecrawl.firecrawl import _parse_retry_after
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    def test_grows_additively_while_in_use(self):
+        limiter = AdaptiveConcurrencyLimiter(4, max_limit=6)
+        limits = []
+        for _ in range(6):
+            # A round trip of requests filling the current limit
+            in_flight = limiter.limit
+            for _ in range(in_flight):
+                limiter.acquire()
+            for _ in range(in_flight):
+                limiter.release(200, 0.01)
+            limits.append(limiter.limit)
+        # Just under one step per round trip, up to max_limit
+        self.assertEqual(limits, [4, 5, 6, 6, 6, 6])
+
+    def test_does_not_grow_when_idle(self):
+        limiter = AdaptiveConcurrencyLimiter(8)
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(200, 0.01)
+        self.assertEqual(limiter.limit, 8)
+
+    def test_halves_once_per_round_trip_on_overload(self):
+        changes = []
+        limiter = AdaptiveConcurrencyLimiter(16, on_change=changes.append)
+        for _ in range(4):
+            limiter.acquire()
+        for _ in range(4):
+            limiter.release(429, 0.5)
+        self.assertEqual(limiter.limit, 8)
+        self.assertEqual(changes, [8])
+
+    def test_slow_requests_count_as_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(10, latency_target=0.2)
+        limiter.acquire()
+        limiter.release(200, 1.0)
+        self.assertEqual(limiter.limit, 5)
+
+    def test_never_below_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(2, min_limit=2)
+        limiter.acquire()
+        limiter.release(503, 0)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_blocks_at_limit_until_release(self):
+        limiter = AdaptiveConcurrencyLimiter(1)
+        limiter.acquire()
+        self.assertFalse(limiter.acquire(timeout=0.05))
+        threading.Timer(0.05, limiter.release, args=(200, 0.01)).start()
+        self.assertTrue(limiter.acquire(timeout=2))
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_retry_after_pauses_new_requests(self):
+        limiter = AdaptiveConcurrencyLimiter(4)
+        limiter.acquire()
+        limiter.release(429, 0.01, retry_after=0.2)
+        start = time.monotonic()
+        limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_pause_is_capped(self):
+        limiter = AdaptiveConcurrencyLimiter(4, max_pause=0.1)
+        limiter.acquire()
+        limiter.release(429, 0.01, retry_after=float('inf'))
+        self.assertFalse(limiter.acquire(timeout=0.01))
+        self.assertTrue(limiter.acquire(timeout=2))
+
+    def test_async_acquire_times_out(self):
+        limiter = AdaptiveConcurrencyLimiter(1)
+        limiter.acquire()
+        self.assertFalse(asyncio.run(limiter.acquire_async(timeout=0.05)))
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_async_acquire_waits_for_thread_release(self):
+        limiter = AdaptiveConcurrencyLimiter(1)
+        limiter.acquire()
+
+        async def run():
+            threading.Timer(0.05, limiter.release, args=(200, 0.01)).start()
+            await asyncio.wait_for(limiter.acquire_async(), 2)
+
+        asyncio.run(run())
+        self.assertEqual(limiter.in_flight, 1)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_seconds_and_dates(self):
+        self.assertEqual(_parse_retry_after('3'), 3.0)
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        self.assertAlmostEqual(_parse_retry_after(date), 30, delta=2)
+        self.assertIsNone(_parse_retry_after('soon'))
+        self.assertIsNone(_parse_retry_after(None))
+
+
+class TestClientLimiter(unittest.TestCase):
+    @patch('requests.Session.post')
+    def test_requests_feed_the_shared_limiter(self, mock_post):
+        mock_post.return_value = make_response({'success': False, 'error': 'Rate limit exceeded'}, 429, {'Retry-After': '0'})
+        limiter = AdaptiveConcurrencyLimiter(8)
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, concurrency_limiter=limiter, retry_policy=RetryPolicy(max_attempts=1))
+
+        with self.assertRaises(Exception):
+            app.scrape_url('https://example.com')
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+    @patch('requests.Session.post')
+    def test_huge_retry_after_does_not_stall_the_client(self, mock_post):
+        mock_post.side_effect = [
+            make_response({'success': False, 'error': 'Rate limit exceeded'}, 429, {'Retry-After': '86400'}),
+            make_response({'success': True, 'data': {'markdown': 'ok'}}),
+        ]
+        limiter = AdaptiveConcurrencyLimiter(8, max_pause=0.1)
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, concurrency_limiter=limiter, retry_policy=RetryPolicy(max_attempts=1))
+
+        with self.assertRaises(Exception):
+            app.scrape_url('https://example.com')
+        start = time.monotonic()
+        self.assertEqual(app.scrape_url('https://example.com').markdown, 'ok')
+        self.assertLess(time.monotonic() - start, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, CrawlResultSet
+from firecrawl.firecrawl import FirecrawlDocument
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+
+def make_document(i, status_code=200):
+    return {
+        'markdown': f'# Page {i} é',
+        'html': f'<h1>Page {i}</h1>',
+        'links': [f'https://example.com/{i + 1}'],
+        'metadata': {'sourceURL': f'https://example.com/{"blog" if i % 2 else "docs"}/{i}', 'title': f'Page {i}', 'statusCode': status_code},
+    }
+
+
+class TestCrawlResultSet(unittest.TestCase):
+    def setUp(self):
+        self.documents = [make_document(i, 404 if i == 3 else 200) for i in range(6)]
+        self.result_set = CrawlResultSet(self.documents)
+
+    def test_rows_are_built_on_demand(self):
+        self.assertEqual(len(self.result_set), 6)
+        document = self.result_set[2]
+        self.assertIsInstance(document, FirecrawlDocument)
+        self.assertEqual(document.markdown, '# Page 2 é')
+        self.assertEqual(document.links, ['https://example.com/3'])
+        self.assertEqual(document.metadata['title'], 'Page 2')
+        self.assertIsNone(document.rawHtml)
+        self.assertEqual(self.result_set[-1].html, '<h1>Page 5</h1>')
+        with self.assertRaises(IndexError):
+            self.result_set[6]
+
+    def test_columns(self):
+        self.assertEqual(self.result_set.url(1), 'https://example.com/blog/1')
+        self.assertEqual(self.result_set.title(0), 'Page 0')
+        self.assertEqual(self.result_set.status_code(3), 404)
+        self.assertEqual(self.result_set.text('markdown', 4), '# Page 4 é')
+        self.assertEqual(list(self.result_set.status_codes), [200, 200, 200, 404, 200, 200])
+        self.assertEqual(self.result_set.urls[:2], ['https://example.com/docs/0', 'https://example.com/blog/1'])
+
+    def test_filter(self):
+        ok = self.result_set.filter(status_code=range(200, 300))
+        self.assertEqual(len(ok), 5)
+        blog = ok.filter(url_prefix='https://example.com/blog/')
+        self.assertEqual(blog.urls, ['https://example.com/blog/1', 'https://example.com/blog/5'])
+        self.assertEqual(blog[1].markdown, '# Page 5 é')
+        matched = self.result_set.filter(status_code=404, predicate=lambda document: 'Page' in document.markdown)
+        self.assertEqual([document.metadata['statusCode'] for document in matched], [404])
+        with self.assertRaises(TypeError):
+            blog.append(make_document(9))
+
+    def test_models_and_slices(self):
+        result_set = CrawlResultSet([FirecrawlDocument(**document) for document in self.documents])
+        result_set.append({'markdown': 'no metadata'})
+        self.assertEqual([document.markdown for document in result_set[4:]], ['# Page 4 é', '# Page 5 é', 'no metadata'])
+        self.assertIsNone(result_set.status_code(-1))
+        self.assertIsNone(result_set.url(-1))
+
+    @patch('requests.Session.get')
+    def test_get_crawl_result_set(self, mock_get):
+        mock_get.side_effect = [
+            make_response({'status': 'completed', 'data': self.documents[:3], 'next': f'{API_URL}/v1/crawl/abc?skip=3'}),
+            make_response({'status': 'completed', 'data': self.documents[3:]}),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        result_set = app.get_crawl_result_set('abc')
+
+        self.assertEqual(len(result_set), 6)
+        self.assertEqual(result_set[5].markdown, '# Page 5 é')
+
+    def test_async_get_batch_scrape_result_set(self):
+        app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        with patch.object(app, '_async_get_request', AsyncMock(return_value={'status': 'completed', 'data': self.documents})) as mock_get:
+            result_set = asyncio.run(app.get_batch_scrape_result_set('abc'))
+        self.assertEqual(len(result_set), 6)
+        self.assertEqual(mock_get.call_args.args[0], f'{API_URL}/v1/batch/scrape/abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
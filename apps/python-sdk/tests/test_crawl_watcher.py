@@ -0,0 +1,175 @@
+import asyncio
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from websockets.asyncio.server import serve
+
+from firecrawl import FirecrawlApp
+from firecrawl.firecrawl import CrawlWatcher
+
+
+def make_doc(i):
+    return {'markdown': f'page {i}', 'metadata': {'sourceURL': f'https://example.com/{i}', 'scrapeId': f'scrape-{i}'}}
+
+
+def catchup(status, docs):
+    return json.dumps({'type': 'catchup', 'data': {'success': True, 'status': status, 'total': 4, 'completed': len(docs), 'data': docs}})
+
+
+class TestCrawlWatcherReconnect(unittest.IsolatedAsyncioTestCase):
+    async def start_server(self, handler):
+        self.server = await serve(handler, '127.0.0.1', 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.app = FirecrawlApp(api_key='dummy-api-key', api_url=f'http://127.0.0.1:{port}')
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_reconnects_and_dispatches_each_document_once(self):
+        connections = []
+
+        async def handler(websocket):
+            connections.append(websocket)
+            if len(connections) == 1:
+                await websocket.send(catchup('scraping', [make_doc(0), make_doc(1)]))
+                # Drop the connection without a close frame
+                websocket.transport.abort()
+            else:
+                await websocket.send(catchup('scraping', [make_doc(0), make_doc(1), make_doc(2)]))
+                await websocket.send(json.dumps({'type': 'document', 'data': make_doc(3)}))
+                await websocket.close(1000, json.dumps({'type': 'done'}))
+
+        await self.start_server(handler)
+        watcher = CrawlWatcher('abc', self.app, backoff_base=0.01)
+        documents, done = [], []
+        watcher.add_event_listener('document', lambda detail: documents.append(detail['data']['markdown']))
+        watcher.add_event_listener('done', lambda detail: done.append(detail['status']))
+
+        await watcher.connect()
+
+        self.assertEqual(len(connections), 2)
+        self.assertEqual(documents, [f'page {i}' for i in range(4)])
+        self.assertEqual(done, ['completed'])
+        self.assertEqual(len(watcher.data), 4)
+
+    async def test_error_close_reason_is_dispatched(self):
+        async def handler(websocket):
+            await websocket.close(1008, json.dumps({'type': 'error', 'error': 'Job not found'}))
+
+        await self.start_server(handler)
+        watcher = CrawlWatcher('abc', self.app, backoff_base=0.01)
+        errors = []
+        watcher.add_event_listener('error', lambda detail: errors.append(detail['error']))
+
+        await watcher.connect()
+
+        self.assertEqual(errors, ['Job not found'])
+        self.assertEqual(watcher.status, 'failed')
+
+    async def test_gives_up_after_max_reconnects(self):
+        connections = []
+
+        async def handler(websocket):
+            connections.append(websocket)
+            await websocket.send(catchup('scraping', []))
+            websocket.transport.abort()
+
+        await self.start_server(handler)
+        watcher = CrawlWatcher('abc', self.app, backoff_base=0.01, max_reconnects=2)
+
+        with self.assertRaises(Exception):
+            await watcher.connect()
+        self.assertEqual(len(connections), 3)
+
+
+class TestCrawlWatcherDelivery(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        async def handler(websocket):
+            await websocket.send(catchup('scraping', [make_doc(0), make_doc(1)]))
+            for i in range(2, 6):
+                await websocket.send(json.dumps({'type': 'document', 'data': make_doc(i)}))
+            await websocket.close(1000, json.dumps({'type': 'done'}))
+
+        self.server = await serve(handler, '127.0.0.1', 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.app = FirecrawlApp(api_key='dummy-api-key', api_url=f'http://127.0.0.1:{port}')
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_coroutine_handlers_without_retaining_documents(self):
+        watcher = CrawlWatcher('abc', self.app, retain_documents=False)
+        documents, done = [], []
+
+        async def on_document(detail):
+            await asyncio.sleep(0.01)
+            documents.append(detail['data']['markdown'])
+
+        watcher.add_event_listener('document', on_document)
+        watcher.add_event_listener('done', lambda detail: done.append(len(documents)))
+
+        await watcher.connect()
+
+        self.assertEqual(documents, [f'page {i}' for i in range(6)])
+        # Done is dispatched after every document was handled
+        self.assertEqual(done, [6])
+        self.assertEqual(watcher.data, [])
+
+    async def test_drop_newest_when_queue_is_full(self):
+        watcher = CrawlWatcher('abc', self.app, queue_size=1, overflow='drop_newest')
+        release = asyncio.Event()
+        documents = []
+
+        async def on_document(detail):
+            await release.wait()
+            documents.append(detail['data']['markdown'])
+
+        watcher.add_event_listener('document', on_document)
+        watcher.add_event_listener('done', lambda detail: release.set())
+        task = asyncio.ensure_future(watcher.connect())
+        while watcher.status == 'scraping':
+            await asyncio.sleep(0.01)
+        release.set()
+        await task
+
+        self.assertEqual(len(documents) + watcher.dropped_events, 6)
+        self.assertGreater(watcher.dropped_events, 0)
+
+    async def test_overflow_error(self):
+        watcher = CrawlWatcher('abc', self.app, queue_size=1, overflow='error', reconnect=False)
+        watcher.add_event_listener('document', lambda detail: asyncio.sleep(1))
+
+        with self.assertRaises(Exception) as error:
+            await watcher.connect()
+        self.assertIn('queue is full', str(error.exception))
+
+    async def test_executor_handlers_with_concurrency(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            watcher = CrawlWatcher('abc', self.app, executor=executor, handler_concurrency=3)
+            threads = set()
+            documents = []
+
+            def on_document(detail):
+                threads.add(threading.current_thread().name)
+                documents.append(detail['data']['markdown'])
+
+            watcher.add_event_listener('document', on_document)
+            await watcher.connect()
+
+        self.assertEqual(sorted(documents), [f'page {i}' for i in range(6)])
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    async def test_handler_error_is_raised(self):
+        watcher = CrawlWatcher('abc', self.app)
+
+        def on_document(detail):
+            raise ValueError('bad handler')
+
+        watcher.add_event_listener('document', on_document)
+
+        with self.assertRaises(ValueError):
+            await watcher.connect()
@@ -0,0 +1,134 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from aiohttp import web
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, DeadlineExceededError
+
+from helpers import make_response, start_api_server
+
+API_URL = 'http://localhost:3002'
+
+
+class TestTimeouts(unittest.TestCase):
+    @patch('requests.Session.post')
+    def test_scrape_timeout_is_converted_to_seconds(self, mock_post):
+        mock_post.return_value = make_response({'success': True, 'data': {'markdown': 'ok'}})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        app.scrape_url('https://example.com', timeout=30000)
+
+        self.assertEqual(mock_post.call_args.kwargs['timeout'], (10, 35.0))
+
+    @patch('requests.Session.get')
+    def test_every_request_has_connect_and_read_timeouts(self, mock_get):
+        mock_get.return_value = make_response({'success': True, 'status': 'completed', 'data': []})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, connect_timeout=3, read_timeout=30)
+
+        app._get_request(f'{API_URL}/v1/crawl/abc', {})
+
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], (3, 30))
+
+
+class TestDeadlines(unittest.TestCase):
+    @patch('requests.Session.delete')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_crawl_is_cancelled_when_the_deadline_passes(self, mock_post, mock_get, mock_delete):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.return_value = make_response({'success': True, 'status': 'scraping', 'completed': 1, 'total': 10})
+        mock_delete.return_value = make_response({'success': True})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError) as error:
+            app.crawl_url('https://example.com', poll_interval=0.05, deadline=0.3)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(error.exception.job_id, 'abc')
+        self.assertEqual(mock_delete.call_args.args[0], f'{API_URL}/v1/crawl/abc')
+        # Each status check only gets the time left before the deadline
+        for call in mock_get.call_args_list:
+            self.assertLessEqual(call.kwargs['timeout'][1], 0.3)
+
+    @patch('requests.Session.delete')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_batch_scrape_is_cancelled_when_the_deadline_passes(self, mock_post, mock_get, mock_delete):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.return_value = make_response({'success': True, 'status': 'scraping'})
+        mock_delete.return_value = make_response({'success': True})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with self.assertRaises(DeadlineExceededError):
+            app.batch_scrape_urls(['https://example.com'], poll_interval=0.05, deadline=0.2)
+
+        self.assertEqual(mock_delete.call_args.args[0], f'{API_URL}/v1/batch/scrape/abc')
+
+    @patch('requests.Session.delete')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_extract_stops_waiting(self, mock_post, mock_get, mock_delete):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.return_value = make_response({'success': True, 'status': 'processing'})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with self.assertRaises(DeadlineExceededError) as error:
+            app.extract(['https://example.com'], prompt='Get the title', poll_interval=0.05, deadline=0.2)
+
+        self.assertEqual(error.exception.job_id, 'abc')
+        mock_delete.assert_not_called()
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_completed_within_deadline(self, mock_post, mock_get):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.return_value = make_response({
+            'success': True, 'status': 'completed', 'completed': 1, 'total': 1, 'creditsUsed': 1,
+            'expiresAt': '2025-01-01T00:00:00Z', 'data': [{'markdown': 'ok'}]})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        result = app.crawl_url('https://example.com', deadline=5)
+
+        self.assertEqual(result.data[0].markdown, 'ok')
+
+
+class TestAsyncDeadlines(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cancelled = []
+
+        async def start(request):
+            return web.json_response({'success': True, 'id': 'abc'})
+
+        async def status(request):
+            # A status check that never answers
+            await asyncio.sleep(1.5)
+            return web.json_response({'success': True, 'status': 'scraping'})
+
+        async def cancel(request):
+            self.cancelled.append(request.match_info['id'])
+            return web.json_response({'success': True})
+
+        self.runner, self.api_url = await start_api_server([
+            web.post('/v1/crawl', start),
+            web.get('/v1/crawl/{id}', status),
+            web.delete('/v1/crawl/{id}', cancel),
+        ])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_hung_status_check_is_cut_at_the_deadline(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            start = time.monotonic()
+            with self.assertRaises(DeadlineExceededError) as error:
+                await app.crawl_url('https://example.com', deadline=0.5)
+            self.assertLess(time.monotonic() - start, 1.2)
+        self.assertEqual(error.exception.job_id, 'abc')
+        self.assertEqual(self.cancelled, ['abc'])
+
+
+if __name__ == '__main__':
+    unittest.main()
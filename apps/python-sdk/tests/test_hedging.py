@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from aiohttp import web
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, HedgingPolicy, DeadlineExceededError
+from firecrawl.firecrawl import _deadline_scope
+
+from helpers import make_response, start_api_server
+
+API_URL = 'http://localhost:3002'
+BACKUP_URL = 'http://localhost:3003'
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    def test_delay_follows_the_latency_percentile(self):
+        policy = HedgingPolicy(90, min_delay=0, min_samples=10, initial_delay=3)
+        self.assertEqual(policy.get_delay(), 3)
+        for i in range(1, 101):
+            policy.record(i / 100)
+        self.assertAlmostEqual(policy.get_delay(), 0.91)
+
+    def test_delay_is_clamped(self):
+        policy = HedgingPolicy(min_delay=0.5, max_delay=2, min_samples=1)
+        policy.record(0.01)
+        self.assertEqual(policy.get_delay(), 0.5)
+        policy.record(10)
+        policy.record(10)
+        self.assertEqual(policy.get_delay(), 2)
+
+    def test_hedges_are_capped_at_the_ratio(self):
+        policy = HedgingPolicy(max_hedge_ratio=0.25)
+        hedged = 0
+        for _ in range(40):
+            policy.start()
+            hedged += policy.try_hedge()
+        self.assertEqual(hedged, 10)
+        self.assertEqual(policy.hedges, 10)
+        self.assertEqual(policy.requests, 40)
+
+
+class TestHedgedScrape(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def serve(self, url, headers=None, json=None, timeout=None):
+        with self.lock:
+            self.calls.append(url)
+            first = len(self.calls) == 1
+        time.sleep(1 if first else 0.01)
+        return make_response({'success': True, 'data': {'markdown': 'primary' if first else url}})
+
+    @patch('requests.Session.post')
+    def test_hedge_wins_when_primary_is_slow(self, mock_post):
+        mock_post.side_effect = self.serve
+        policy = HedgingPolicy(initial_delay=0.05, min_delay=0, max_hedge_ratio=1, api_url=BACKUP_URL)
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, hedging=policy)
+
+        start = time.monotonic()
+        response = app.scrape_url('https://example.com')
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(response.markdown, f'{BACKUP_URL}/v1/scrape')
+        self.assertEqual(self.calls, [f'{API_URL}/v1/scrape', f'{BACKUP_URL}/v1/scrape'])
+        self.assertEqual(policy.hedges, 1)
+        app.close()
+
+    @patch('requests.Session.post')
+    def test_hedged_requests_keep_the_deadline(self, mock_post):
+        timeouts = []
+
+        def serve(url, headers=None, json=None, timeout=None):
+            timeouts.append(timeout)
+            time.sleep(1)
+            return make_response({'success': True, 'data': {'markdown': 'slow'}})
+
+        mock_post.side_effect = serve
+        policy = HedgingPolicy(initial_delay=0.05, min_delay=0, max_hedge_ratio=1)
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, hedging=policy)
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            with _deadline_scope(0.3):
+                app.scrape_url('https://example.com')
+
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(len(timeouts), 2)
+        # Both copies are sent with the time left before the caller's deadline
+        for timeout in timeouts:
+            self.assertLessEqual(max(timeout) if isinstance(timeout, tuple) else timeout, 0.3)
+        app.close()
+
+    @patch('requests.Session.post')
+    def test_no_hedge_without_budget(self, mock_post):
+        mock_post.side_effect = self.serve
+        policy = HedgingPolicy(initial_delay=0.05, min_delay=0, max_hedge_ratio=0)
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        response = app.scrape_url('https://example.com', hedging=policy)
+
+        self.assertEqual(response.markdown, 'primary')
+        self.assertEqual(len(self.calls), 1)
+        app.close()
+
+    @patch('requests.Session.post')
+    def test_hedging_is_opt_in(self, mock_post):
+        mock_post.return_value = make_response({'success': True, 'data': {'markdown': 'ok'}})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        app.scrape_url('https://example.com')
+        self.assertIsNone(app._hedge_executor)
+
+
+class TestAsyncHedgedScrape(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hits = 0
+        self.cancelled = False
+
+        async def scrape(request):
+            self.hits += 1
+            if self.hits == 1:
+                for _ in range(500):
+                    if request.transport is None or request.transport.is_closing():
+                        # The client gave up on this request
+                        self.cancelled = True
+                        break
+                    await asyncio.sleep(0.01)
+                return web.json_response({'success': True, 'data': {'markdown': 'primary'}})
+            return web.json_response({'success': True, 'data': {'markdown': 'hedge'}})
+
+        self.runner, self.api_url = await start_api_server([web.post('/v1/scrape', scrape)])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_first_success_wins_and_loser_is_cancelled(self):
+        policy = HedgingPolicy(initial_delay=0.05, min_delay=0, max_hedge_ratio=1)
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url, hedging=policy) as app:
+            start = time.monotonic()
+            response = await app.scrape_url('https://example.com')
+            self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(response.markdown, 'hedge')
+        self.assertEqual(self.hits, 2)
+        await asyncio.sleep(0.1)
+        self.assertTrue(self.cancelled)
+
+
+if __name__ == '__main__':
+    unittest.main()
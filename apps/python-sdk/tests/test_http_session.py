@@ -0,0 +1,46 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+from firecrawl import FirecrawlApp
+
+
+class TestHttpSession(unittest.TestCase):
+    def test_session_is_reused_across_requests(self):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url='http://localhost:3002')
+        self.assertIs(app._get_session(), app._get_session())
+
+    def test_session_is_shared_between_threads(self):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url='http://localhost:3002')
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sessions = list(pool.map(lambda _: app._get_session(), range(32)))
+        self.assertTrue(all(session is sessions[0] for session in sessions))
+
+    def test_pool_settings_are_applied(self):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url='http://localhost:3002', pool_connections=3, pool_maxsize=7, pool_block=True)
+        adapter = app._get_session().get_adapter('https://api.firecrawl.dev')
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertTrue(adapter._pool_block)
+
+    def test_keep_alive_disabled(self):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url='http://localhost:3002', keep_alive=False)
+        self.assertEqual(app._get_session().headers['Connection'], 'close')
+
+    def test_context_manager_closes_session(self):
+        with FirecrawlApp(api_key='dummy-api-key', api_url='http://localhost:3002') as app:
+            session = app._get_session()
+        self.assertIsNone(app._session)
+        self.assertIsNot(app._get_session(), session)
+
+    @patch('requests.Session.get')
+    def test_requests_go_through_session(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        app = FirecrawlApp(api_key='dummy-api-key', api_url='http://localhost:3002')
+        response = app._get_request('http://localhost:3002/v1/crawl/123', app._prepare_headers())
+
+        self.assertIs(response, mock_response)
+        mock_get.assert_called_once()
@@ -0,0 +1,99 @@
+import unittest
+import uuid
+from unittest.mock import patch
+
+import requests
+from aiohttp import web
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, IdempotencyConflictError
+
+from helpers import make_response, start_api_server
+
+API_URL = 'http://localhost:3002'
+
+
+class TestIdempotencyKeys(unittest.TestCase):
+    @patch('time.sleep')
+    @patch('requests.Session.post')
+    def test_submission_is_retried_with_the_same_key(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            requests.exceptions.ReadTimeout('timed out'),
+            make_response({'success': True, 'id': 'abc', 'url': f'{API_URL}/v1/crawl/abc'}),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        response = app.async_crawl_url('https://example.com')
+
+        self.assertEqual(response.id, 'abc')
+        keys = [call.kwargs['headers']['x-idempotency-key'] for call in mock_post.call_args_list]
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(keys[0], keys[1])
+        uuid.UUID(keys[0])
+
+    @patch('requests.Session.post')
+    def test_each_submission_gets_its_own_key(self, mock_post):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        app.async_batch_scrape_urls(['https://example.com'])
+        app.async_batch_scrape_urls(['https://example.com'])
+
+        keys = {call.kwargs['headers']['x-idempotency-key'] for call in mock_post.call_args_list}
+        self.assertEqual(len(keys), 2)
+
+    @patch('time.sleep')
+    @patch('requests.Session.post')
+    def test_conflict_after_retry_is_reported(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            requests.exceptions.ConnectionError('reset'),
+            make_response({'success': False, 'error': 'Idempotency key already used'}, 409),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with self.assertRaises(IdempotencyConflictError) as error:
+            app.async_crawl_url('https://example.com')
+        self.assertEqual(error.exception.idempotency_key, mock_post.call_args.kwargs['headers']['x-idempotency-key'])
+
+    @patch('requests.Session.post')
+    def test_disabled_keys_keep_posts_unretried(self, mock_post):
+        mock_post.side_effect = requests.exceptions.ConnectionError('reset')
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, auto_idempotency_keys=False)
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            app.async_crawl_url('https://example.com')
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertNotIn('x-idempotency-key', mock_post.call_args.kwargs['headers'])
+
+    def test_rejects_keys_that_are_not_uuids(self):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        with self.assertRaises(ValueError):
+            app.async_crawl_url('https://example.com', idempotency_key='my-key')
+
+
+class TestAsyncIdempotencyKeys(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.keys = []
+
+        async def crawl(request):
+            self.keys.append(request.headers.get('x-idempotency-key'))
+            if len(self.keys) == 1:
+                # The job is created, but the response never arrives
+                request.transport.abort()
+                return web.Response()
+            return web.json_response({'success': False, 'error': 'Idempotency key already used'}, status=409)
+
+        self.runner, self.api_url = await start_api_server([web.post('/v1/crawl', crawl)])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_conflict_after_lost_response(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            with self.assertRaises(IdempotencyConflictError):
+                await app.async_crawl_url('https://example.com')
+        self.assertEqual(len(self.keys), 2)
+        self.assertEqual(self.keys[0], self.keys[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
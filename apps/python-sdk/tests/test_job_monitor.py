@@ -0,0 +1,121 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from aiohttp import web
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, JobMonitor, AsyncJobMonitor, FixedPolling
+
+from helpers import make_response, start_api_server
+
+API_URL = 'http://localhost:3002'
+
+
+def crawl_status(status, completed, data=None):
+    return {
+        'success': True,
+        'status': status,
+        'completed': completed,
+        'total': 2,
+        'creditsUsed': completed,
+        'expiresAt': '2030-01-01T00:00:00Z',
+        'data': data or [],
+    }
+
+
+class TestJobMonitor(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.polls = {'crawl': 0, 'extract': 0}
+
+    def serve(self, url, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append(url)
+        if '/v1/crawl/' in url:
+            self.polls['crawl'] += 1
+            if self.polls['crawl'] < 3:
+                return make_response(crawl_status('scraping', self.polls['crawl']))
+            return make_response(crawl_status('completed', 2, [{'markdown': 'a'}, {'markdown': 'b'}]))
+        if '/v1/extract/' in url:
+            self.polls['extract'] += 1
+            if self.polls['extract'] < 2:
+                return make_response({'success': True, 'status': 'processing'})
+            return make_response({'success': False, 'status': 'failed', 'error': 'boom'})
+        raise AssertionError(url)
+
+    @patch('requests.Session.get')
+    def test_resolves_futures_of_different_kinds(self, mock_get):
+        mock_get.side_effect = self.serve
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with JobMonitor(app, polling_strategy=FixedPolling(0.01)) as monitor:
+            crawl = monitor.watch_crawl('abc')
+            extract = monitor.watch_extract('xyz')
+
+            result = crawl.result(timeout=5)
+            with self.assertRaises(Exception) as error:
+                extract.result(timeout=5)
+
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual([doc.markdown for doc in result.data], ['a', 'b'])
+        self.assertIn('boom', str(error.exception))
+        # Running crawls are polled for a single document
+        self.assertTrue(all('limit=1' in url for url in self.calls[:2] if '/v1/crawl/' in url))
+        self.assertEqual(monitor.pending, 0)
+
+    @patch('requests.Session.get')
+    def test_unknown_kind(self, mock_get):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        with JobMonitor(app) as monitor:
+            with self.assertRaises(ValueError):
+                monitor.watch('unknown', 'abc')
+        mock_get.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_fails_after_max_errors(self, mock_get):
+        mock_get.side_effect = ConnectionError('unreachable')
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with JobMonitor(app, polling_strategy=FixedPolling(0.01), max_errors=2) as monitor:
+            future = monitor.watch_crawl('abc')
+            with self.assertRaises(ConnectionError):
+                future.result(timeout=5)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_close_cancels_pending_jobs(self, mock_get):
+        mock_get.return_value = make_response(crawl_status('scraping', 0))
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        monitor = JobMonitor(app, polling_strategy=FixedPolling(10))
+        future = monitor.watch_crawl('abc')
+        monitor.close()
+
+        self.assertTrue(future.cancelled())
+
+
+class TestAsyncJobMonitor(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.polls = 0
+
+        async def status(request):
+            self.polls += 1
+            if self.polls < 3:
+                return web.json_response(crawl_status('scraping', self.polls))
+            return web.json_response(crawl_status('completed', 2, [{'markdown': 'a'}, {'markdown': 'b'}]))
+
+        self.runner, self.api_url = await start_api_server([web.get('/v1/crawl/{id}', status)])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_resolves_asyncio_future(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            async with AsyncJobMonitor(app, polling_strategy=FixedPolling(0.01)) as monitor:
+                result = await monitor.watch_crawl('abc')
+
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(len(result.data), 2)
+        self.assertEqual(self.polls, 4)
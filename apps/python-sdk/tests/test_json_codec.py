@@ -0,0 +1,131 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+from aiohttp import web
+
+import firecrawl.firecrawl as firecrawl_module
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, JSONCodec, OrjsonCodec, MsgspecCodec, get_json_codec, set_json_codec
+
+from helpers import start_api_server
+
+API_URL = 'http://localhost:3002'
+
+
+def available_codecs():
+    codecs = [JSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+class CountingCodec(JSONCodec):
+    name = 'counting'
+
+    def __init__(self):
+        self.loaded = 0
+        self.dumped = 0
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.dumped += 1
+        return super().dumps(obj)
+
+
+def make_encoded_response(payload, status_code=200):
+    # A real response with a byte body, so it is decoded by the codec rather than json()
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+class CodecTestCase(unittest.TestCase):
+    def setUp(self):
+        self.previous = get_json_codec()
+
+    def tearDown(self):
+        set_json_codec(self.previous)
+
+
+class TestCodecs(CodecTestCase):
+    def test_codecs_round_trip(self):
+        value = {'markdown': '# Café \U0001F600', 'links': ['https://example.com'], 'statusCode': 200, 'score': 0.5, 'ok': True, 'next': None}
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                encoded = codec.dumps(value)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), value)
+                self.assertEqual(codec.loads(encoded), value)
+                self.assertEqual(codec.loads(encoded.decode()), value)
+
+    def test_invalid_json_raises_value_error(self):
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                with self.assertRaises(ValueError):
+                    codec.loads(b'{"success": tru')
+
+    def test_set_json_codec(self):
+        set_json_codec('json')
+        self.assertEqual(get_json_codec().name, 'json')
+        codec = CountingCodec()
+        set_json_codec(codec)
+        self.assertIs(get_json_codec(), codec)
+        with self.assertRaises(ValueError):
+            set_json_codec('simplejson')
+
+    def test_fastest_installed_codec_is_the_default(self):
+        expected = available_codecs()[1].name if len(available_codecs()) > 1 else 'json'
+        self.assertEqual(firecrawl_module._default_json_codec().name, expected)
+
+
+class TestSyncClient(CodecTestCase):
+    @patch('requests.Session.send')
+    def test_requests_and_responses_use_the_codec(self, mock_send):
+        mock_send.return_value = make_encoded_response({'success': True, 'data': {'markdown': 'ok'}})
+        codec = CountingCodec()
+        set_json_codec(codec)
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        self.assertEqual(app.scrape_url('https://example.com').markdown, 'ok')
+
+        request = mock_send.call_args.args[0]
+        self.assertEqual(json.loads(request.body)['url'], 'https://example.com')
+        self.assertEqual(request.headers['Content-Type'], 'application/json')
+        self.assertEqual((codec.dumped, codec.loaded), (1, 1))
+        app.close()
+
+
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.previous = get_json_codec()
+        self.codec = CountingCodec()
+        set_json_codec(self.codec)
+
+        async def scrape(request):
+            body = await request.json()
+            return web.json_response({'success': True, 'data': {'markdown': body['url']}})
+
+        self.runner, self.api_url = await start_api_server([web.post('/v1/scrape', scrape)])
+
+    async def asyncTearDown(self):
+        set_json_codec(self.previous)
+        await self.runner.cleanup()
+
+    async def test_requests_and_responses_use_the_codec(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            response = await app.scrape_url('https://example.com')
+        self.assertEqual(response.markdown, 'https://example.com')
+        self.assertEqual((self.codec.dumped, self.codec.loaded), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,235 @@
+import threading
+import unittest
+from unittest.mock import patch
+from urllib.parse import urlparse, parse_qs
+
+from aiohttp import web
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+
+from helpers import make_response, start_api_server
+
+API_URL = 'http://localhost:3002'
+
+
+def make_page(start, count, next_url=None, status='completed'):
+    page = {
+        'success': True,
+        'status': status,
+        'completed': 6,
+        'total': 6,
+        'creditsUsed': 6,
+        'expiresAt': '2030-01-01T00:00:00Z',
+        'data': [{'markdown': f'page {i}', 'metadata': {'sourceURL': f'https://example.com/{i}'}} for i in range(start, start + count)],
+    }
+    if next_url:
+        page['next'] = next_url
+    return page
+
+
+def make_pages():
+    return [
+        make_page(0, 2, f'{API_URL}/v1/crawl/abc?skip=2'),
+        make_page(2, 2, f'{API_URL}/v1/crawl/abc?skip=4'),
+        make_page(4, 2),
+    ]
+
+
+class TestPagination(unittest.TestCase):
+    @patch('requests.Session.get')
+    def test_iter_crawl_documents_yields_every_page(self, mock_get):
+        mock_get.side_effect = [make_response(page) for page in make_pages()]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        documents = list(app.iter_crawl_documents('abc'))
+
+        self.assertEqual([doc.markdown for doc in documents], [f'page {i}' for i in range(6)])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_iter_crawl_documents_stops_early(self, mock_get):
+        mock_get.side_effect = [make_response(page) for page in make_pages()]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        for document in app.iter_crawl_documents('abc'):
+            if document.markdown == 'page 1':
+                break
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_check_crawl_status_collects_every_page(self, mock_get):
+        mock_get.side_effect = [make_response(page) for page in make_pages()]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        status = app.check_crawl_status('abc')
+
+        self.assertEqual(len(status.data), 6)
+        self.assertIsNone(status.next)
+
+
+class TestPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def serve(self, url, headers=None, timeout=None):
+        query = parse_qs(urlparse(url).query)
+        skip = int(query.get('skip', ['0'])[0])
+        limit = int(query['limit'][0])
+        with self.lock:
+            self.requested.append((skip, limit))
+        next_url = f'{API_URL}/v1/crawl/abc?skip={skip + limit}&limit={limit}' if skip + limit < 6 else None
+        return make_response(make_page(skip, min(limit, 6 - skip), next_url))
+
+    @patch('firecrawl.firecrawl.PREFETCH_PAGE_SIZE', 2)
+    @patch('requests.Session.get')
+    def test_iter_crawl_documents_prefetches_in_order(self, mock_get):
+        mock_get.side_effect = self.serve
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        documents = list(app.iter_crawl_documents('abc', prefetch=4))
+
+        self.assertEqual([doc.markdown for doc in documents], [f'page {i}' for i in range(6)])
+        self.assertEqual(sorted(self.requested), [(0, 2), (2, 2), (4, 2)])
+
+    @patch('firecrawl.firecrawl.PREFETCH_PAGE_SIZE', 2)
+    @patch('requests.Session.get')
+    def test_check_crawl_status_prefetch(self, mock_get):
+        mock_get.side_effect = self.serve
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        status = app.check_crawl_status('abc', prefetch=2)
+
+        self.assertEqual([doc.markdown for doc in status.data], [f'page {i}' for i in range(6)])
+        self.assertIsNone(status.next)
+
+    @patch('firecrawl.firecrawl.PREFETCH_PAGE_SIZE', 2)
+    @patch('requests.Session.get')
+    def test_prefetch_window_respects_byte_cap(self, mock_get):
+        in_flight = []
+        max_in_flight = []
+
+        def serve(url, headers=None, timeout=None):
+            with self.lock:
+                in_flight.append(url)
+                max_in_flight.append(len(in_flight))
+            try:
+                return self.serve(url)
+            finally:
+                with self.lock:
+                    in_flight.remove(url)
+
+        mock_get.side_effect = serve
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        documents = list(app.iter_crawl_documents('abc', prefetch=4, max_prefetch_bytes=1))
+
+        self.assertEqual(len(documents), 6)
+        self.assertEqual(max(max_in_flight), 1)
+
+
+class TestProgressiveDownload(unittest.TestCase):
+    def make_running_pages(self):
+        return [
+            make_page(0, 2, f'{API_URL}/v1/crawl/abc?skip=2', status='scraping'),
+            make_page(2, 0, f'{API_URL}/v1/crawl/abc?skip=2', status='scraping'),
+            make_page(2, 2, status='completed'),
+        ]
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_iter_crawl_documents_waits_for_new_documents(self, mock_get, mock_sleep):
+        mock_get.side_effect = [make_response(page) for page in self.make_running_pages()]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        documents = list(app.iter_crawl_documents('abc', wait=True))
+
+        self.assertEqual([doc.markdown for doc in documents], [f'page {i}' for i in range(4)])
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertEqual(mock_get.call_args_list[1][0][0], f'{API_URL}/v1/crawl/abc?skip=2')
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_crawl_url_delivers_documents_while_running(self, mock_post, mock_get, mock_sleep):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.side_effect = [make_response(page) for page in self.make_running_pages()]
+        received = []
+        mock_sleep.side_effect = lambda _: received.append('poll')
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        result = app.crawl_url('https://example.com', on_document=lambda doc: received.append(doc.markdown))
+
+        self.assertEqual(received, ['page 0', 'page 1', 'poll', 'page 2', 'page 3'])
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(len(result.data), 4)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_failed_job_raises_after_remaining_documents(self, mock_get, mock_sleep):
+        mock_get.side_effect = [make_response(make_page(0, 1, status='failed'))]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        documents = []
+        with self.assertRaises(Exception):
+            for document in app.iter_crawl_documents('abc', wait=True):
+                documents.append(document)
+        self.assertEqual(len(documents), 1)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_batch_scrape_errors_name_the_batch_job(self, mock_get, mock_sleep):
+        mock_get.side_effect = [
+            make_response(make_page(0, 0, status='failed')),
+            make_response({'success': False, 'error': 'gone'}, 404),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with self.assertRaisesRegex(Exception, 'Batch scrape job failed'):
+            list(app.iter_batch_scrape_documents('abc', wait=True))
+        with self.assertRaisesRegex(Exception, 'check batch scrape status'):
+            list(app.iter_batch_scrape_documents('abc', wait=True))
+
+
+class TestAsyncPagination(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+
+        async def status(request):
+            skip = int(request.query.get('skip', 0))
+            limit = int(request.query.get('limit', 2))
+            self.requests.append(skip)
+            if 'limit' not in request.query:
+                next_url = f'{self.api_url}/v1/batch/scrape/abc?skip={skip + limit}' if skip + limit < 6 else None
+            else:
+                next_url = f'{self.api_url}/v1/batch/scrape/abc?skip={skip + limit}&limit={limit}' if skip + limit < 6 else None
+            return web.json_response(make_page(skip, min(limit, 6 - skip), next_url))
+
+        self.runner, self.api_url = await start_api_server([web.get('/v1/batch/scrape/{id}', status)])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_iter_batch_scrape_documents(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            documents = [doc async for doc in app.iter_batch_scrape_documents('abc')]
+        self.assertEqual([doc.markdown for doc in documents], [f'page {i}' for i in range(6)])
+
+    async def test_iter_batch_scrape_documents_stops_early(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            async for document in app.iter_batch_scrape_documents('abc'):
+                break
+        self.assertEqual(self.requests, [0])
+
+    async def test_iter_batch_scrape_documents_wait(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            documents = [doc async for doc in app.iter_batch_scrape_documents('abc', wait=True)]
+        self.assertEqual(len(documents), 6)
+
+    @patch('firecrawl.firecrawl.PREFETCH_PAGE_SIZE', 1)
+    async def test_iter_batch_scrape_documents_prefetch(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            documents = [doc async for doc in app.iter_batch_scrape_documents('abc', prefetch=3)]
+        self.assertEqual([doc.markdown for doc in documents], [f'page {i}' for i in range(6)])
+        self.assertEqual(sorted(self.requests), [0, 1, 2, 3, 4, 5])
@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, PollingState, FixedPolling, ExponentialPolling, ProgressPolling
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+
+class TestPollingStrategies(unittest.TestCase):
+    def test_fixed(self):
+        state = PollingState()
+        state.record({'status': 'scraping'})
+        self.assertEqual(FixedPolling(0.25).next_interval(state), 0.25)
+
+    def test_exponential_is_capped(self):
+        strategy = ExponentialPolling(initial_interval=0.5, multiplier=2, max_interval=3)
+        state = PollingState()
+        intervals = []
+        for _ in range(5):
+            state.record({'status': 'scraping'})
+            intervals.append(strategy.next_interval(state))
+        self.assertEqual(intervals, [0.5, 1, 2, 3, 3])
+
+    @patch('time.monotonic')
+    def test_progress_uses_eta(self, mock_monotonic):
+        strategy = ProgressPolling(min_interval=0.5, max_interval=60, eta_fraction=0.5)
+        mock_monotonic.return_value = 0
+        state = PollingState()
+        state.record({'completed': 0, 'total': 100})
+        # No rate yet, so the fallback is used
+        self.assertEqual(strategy.next_interval(state), 0.5)
+
+        mock_monotonic.return_value = 10
+        state.record({'completed': 20, 'total': 100})
+        # 2 items/s with 80 remaining is a 40s ETA
+        self.assertEqual(strategy.next_interval(state), 20)
+
+        mock_monotonic.return_value = 20
+        state.record({'completed': 99, 'total': 100})
+        self.assertEqual(strategy.next_interval(state), 0.5)
+
+    @patch('time.monotonic')
+    def test_progress_falls_back_without_progress(self, mock_monotonic):
+        strategy = ProgressPolling(fallback=FixedPolling(7))
+        mock_monotonic.return_value = 0
+        state = PollingState()
+        state.record({'completed': 5, 'total': 10})
+        mock_monotonic.return_value = 10
+        state.record({'completed': 5, 'total': 10})
+        self.assertEqual(strategy.next_interval(state), 7)
+
+
+class TestWaiters(unittest.TestCase):
+    def make_status_pages(self):
+        return [
+            {'success': True, 'status': 'scraping', 'completed': 0, 'total': 1, 'data': []},
+            {'success': True, 'status': 'completed', 'completed': 1, 'total': 1, 'creditsUsed': 1,
+             'expiresAt': '2030-01-01T00:00:00Z', 'data': [{'markdown': 'done'}]},
+        ]
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_crawl_url_poll_interval_is_not_clamped(self, mock_post, mock_get, mock_sleep):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.side_effect = [make_response(page) for page in self.make_status_pages()]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        result = app.crawl_url('https://example.com', poll_interval=0.1)
+
+        self.assertEqual(result.status, 'completed')
+        mock_sleep.assert_called_once_with(0.1)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_client_strategy_is_used_by_default(self, mock_post, mock_get, mock_sleep):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.side_effect = [make_response(page) for page in self.make_status_pages()]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, polling_strategy=FixedPolling(0.3))
+
+        app.crawl_url('https://example.com')
+
+        mock_sleep.assert_called_once_with(0.3)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_extract_uses_polling_strategy(self, mock_post, mock_get, mock_sleep):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.side_effect = [
+            make_response({'success': True, 'status': 'processing'}),
+            make_response({'success': True, 'status': 'processing'}),
+            make_response({'success': True, 'status': 'completed', 'data': {'title': 'x'}}),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        result = app.extract(['https://example.com'], prompt='title', poll_interval=ExponentialPolling(1, 3, 10))
+
+        self.assertEqual(result.data, {'title': 'x'})
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [1, 3])
@@ -0,0 +1,229 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, AsyncMock
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, ResultSink, JSONLResultSink, SQLiteResultSink
+
+from helpers import make_response
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+API_URL = 'http://localhost:3002'
+
+
+def make_document(i):
+    return {'markdown': f'# Page {i}', 'metadata': {'sourceURL': f'https://example.com/{i}', 'statusCode': 200}}
+
+
+class SinkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def check_sink(self, open_sink):
+        with open_sink() as sink:
+            sink.add([make_document(0), make_document(1)])
+            sink.add([])
+            sink.add([make_document(2)])
+            self.assertEqual(len(sink), 3)
+            self.assertEqual([document.markdown for document in sink], ['# Page 0', '# Page 1', '# Page 2'])
+            self.assertEqual(sink.get('https://example.com/1').markdown, '# Page 1')
+            self.assertIsNone(sink.get('https://example.com/9'))
+        # Reopening appends to the stored documents
+        with open_sink() as sink:
+            self.assertEqual(len(sink), 3)
+            sink.add([make_document(3)])
+            self.assertEqual(len(sink), 4)
+            self.assertEqual(sink.get('https://example.com/3').markdown, '# Page 3')
+
+
+class TestResultSinks(SinkTestCase):
+    def test_jsonl(self):
+        self.check_sink(lambda: JSONLResultSink(self.path('results.jsonl')))
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    def test_jsonl_zstd(self):
+        self.check_sink(lambda: JSONLResultSink(self.path('results.jsonl.zst'), compression='zstd'))
+        with open(self.path('results.jsonl.zst'), 'rb') as f:
+            self.assertEqual(f.read(4), b'\x28\xb5\x2f\xfd')
+
+    def test_sqlite(self):
+        self.check_sink(lambda: SQLiteResultSink(self.path('results.db')))
+
+    def test_interrupted_write_is_skipped(self):
+        path = self.path('results.jsonl')
+        with JSONLResultSink(path) as sink:
+            sink.add([make_document(0)])
+        with open(path, 'ab') as f:
+            f.write(b'{"markdown": "# Pa')
+        with JSONLResultSink(path) as sink:
+            self.assertEqual(len(sink), 1)
+            self.assertEqual(len(list(sink)), 1)
+
+    def test_partial_line_is_removed_before_appending(self):
+        path = self.path('results.jsonl')
+        with JSONLResultSink(path) as sink:
+            sink.add([make_document(0)])
+        with open(path, 'ab') as f:
+            f.write(b'{"markdown": "# Pa')
+        with JSONLResultSink(path) as sink:
+            sink.add([make_document(1)])
+        with JSONLResultSink(path) as sink:
+            self.assertEqual(len(sink), 2)
+            self.assertEqual([document.markdown for document in sink], ['# Page 0', '# Page 1'])
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    def test_partial_frame_is_removed_before_appending(self):
+        path = self.path('results.jsonl.zst')
+        with JSONLResultSink(path, compression='zstd') as sink:
+            sink.add([make_document(0)])
+        with open(path, 'ab') as f:
+            f.write(zstandard.ZstdCompressor().compress(b'{"markdown": "# Page 9"}\n')[:-4])
+        with JSONLResultSink(path, compression='zstd') as sink:
+            self.assertEqual(len(sink), 1)
+            sink.add([make_document(1)])
+        with JSONLResultSink(path, compression='zstd') as sink:
+            self.assertEqual(len(sink), 2)
+            self.assertEqual([document.markdown for document in sink], ['# Page 0', '# Page 1'])
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            JSONLResultSink(self.path('results.jsonl'), compression='gzip')
+
+    def test_subclasses_must_implement_storage(self):
+        class NoStorage(ResultSink):
+            def add(self, documents, cursor=None):
+                pass
+
+        with self.assertRaises(TypeError):
+            NoStorage()
+
+
+class TestClientResultSinks(SinkTestCase):
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_crawl_streams_pages_to_the_sink(self, mock_post, mock_get):
+        mock_post.return_value = make_response({'success': True, 'id': 'abc'})
+        mock_get.side_effect = [
+            make_response({'success': True, 'status': 'scraping', 'completed': 2, 'total': 3, 'data': [make_document(0), make_document(1)], 'next': f'{API_URL}/v1/crawl/abc?skip=2'}),
+            make_response({'success': True, 'status': 'completed', 'completed': 3, 'total': 3, 'data': [make_document(2)]}),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        documents = []
+
+        with app.crawl_url('https://example.com', result_sink=self.path('crawl.db'), on_document=documents.append) as sink:
+            self.assertIsInstance(sink, SQLiteResultSink)
+            self.assertEqual(len(sink), 3)
+            self.assertEqual(sink.status['status'], 'completed')
+            self.assertNotIn('data', sink.status)
+        self.assertEqual(len(documents), 3)
+        self.assertEqual(mock_get.call_args_list[1].args[0], f'{API_URL}/v1/crawl/abc?skip=2')
+
+    @patch('requests.Session.get')
+    def test_status_pages_are_written_to_the_sink(self, mock_get):
+        mock_get.side_effect = [
+            make_response({'success': True, 'status': 'completed', 'data': [make_document(0)], 'next': f'{API_URL}/v1/batch/scrape/abc?skip=1'}),
+            make_response({'success': True, 'status': 'completed', 'data': [make_document(1)]}),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        sink = JSONLResultSink(self.path('batch.jsonl'))
+
+        self.assertIs(app.check_batch_scrape_status('abc', result_sink=sink), sink)
+        self.assertEqual(sink.get('https://example.com/1').markdown, '# Page 1')
+        sink.close()
+
+    def test_async_crawl_streams_pages_to_the_sink(self):
+        app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        pages = [
+            {'success': True, 'status': 'scraping', 'data': [make_document(0)], 'next': f'{API_URL}/v1/crawl/abc?skip=1'},
+            {'success': True, 'status': 'completed', 'data': [make_document(1)]},
+        ]
+        with patch.object(app, '_async_post_request', AsyncMock(return_value={'success': True, 'id': 'abc'})), \
+                patch.object(app, '_async_get_request', AsyncMock(side_effect=pages)):
+            sink = asyncio.run(app.crawl_url('https://example.com', result_sink=self.path('crawl.jsonl')))
+        self.assertIsInstance(sink, ResultSink)
+        self.assertEqual([document.markdown for document in sink], ['# Page 0', '# Page 1'])
+        sink.close()
+
+
+class TestResumablePagination(SinkTestCase):
+    def page(self, i, next_skip=None, status='completed', expires_at='2999-01-01T00:00:00Z'):
+        page = {'success': True, 'status': status, 'expiresAt': expires_at, 'data': [make_document(i)]}
+        if next_skip is not None:
+            page['next'] = f'{API_URL}/v1/crawl/abc?skip={next_skip}'
+        return make_response(page)
+
+    def check_resume(self, path):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        with patch('requests.Session.get') as mock_get:
+            mock_get.side_effect = [self.page(0, next_skip=1), RuntimeError('worker died')]
+            with self.assertRaises(RuntimeError):
+                app.check_crawl_status('abc', result_sink=path)
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.side_effect = [self.page(1, next_skip=2), self.page(2)]
+            with app.check_crawl_status('abc', result_sink=path) as sink:
+                self.assertEqual(mock_get.call_args_list[0].args[0], f'{API_URL}/v1/crawl/abc?skip=1')
+                self.assertEqual([document.markdown for document in sink], ['# Page 0', '# Page 1', '# Page 2'])
+                self.assertEqual(sink.cursor['written'], 3)
+
+        # Every page has been written
+        with patch('requests.Session.get') as mock_get:
+            with app.check_crawl_status('abc', result_sink=path) as sink:
+                self.assertEqual(len(sink), 3)
+            mock_get.assert_not_called()
+
+    def test_jsonl_resumes_after_the_last_page(self):
+        self.check_resume(self.path('crawl.jsonl'))
+
+    def test_sqlite_resumes_after_the_last_page(self):
+        self.check_resume(self.path('crawl.db'))
+
+    def test_uncommitted_documents_are_dropped(self):
+        path = self.path('crawl.jsonl')
+        with JSONLResultSink(path) as sink:
+            sink.add([make_document(0)], {'id': 'abc', 'status': 'completed', 'next': f'{API_URL}/v1/crawl/abc?skip=1', 'written': 1})
+        # A page written without its cursor, as by a worker killed in between
+        with open(path, 'ab') as f:
+            f.write(b'{"markdown": "# Page 1"}\n')
+        with JSONLResultSink(path) as sink:
+            self.assertEqual(len(sink), 1)
+            self.assertEqual([document.markdown for document in sink], ['# Page 0'])
+
+    @patch('requests.Session.get')
+    def test_running_job_resumes_at_its_skip_offset(self, mock_get):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        path = self.path('crawl.db')
+        mock_get.side_effect = [self.page(0, status='scraping'), self.page(1)]
+
+        app.check_crawl_status('abc', result_sink=path).close()
+        with app.check_crawl_status('abc', result_sink=path) as sink:
+            self.assertEqual(len(sink), 2)
+        self.assertEqual(mock_get.call_args_list[1].args[0], f'{API_URL}/v1/crawl/abc?skip=1')
+
+    @patch('requests.Session.get')
+    def test_expired_results_are_not_resumed(self, mock_get):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        path = self.path('crawl.db')
+        mock_get.side_effect = [self.page(0, next_skip=1, expires_at='2000-01-01T00:00:00Z'), RuntimeError('worker died')]
+        with self.assertRaises(RuntimeError):
+            app.check_crawl_status('abc', result_sink=path)
+
+        with self.assertRaises(Exception) as error:
+            app.check_crawl_status('abc', result_sink=path)
+        self.assertIn('expired', str(error.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
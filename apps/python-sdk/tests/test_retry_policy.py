@@ -0,0 +1,142 @@
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+from aiohttp import web
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, RetryPolicy, RetryBudget
+
+from helpers import make_response, start_api_server
+
+API_URL = 'http://localhost:3002'
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_status_classes(self):
+        policy = RetryPolicy()
+        self.assertIsNotNone(policy.next_delay(policy.start(), False, 429))
+        self.assertIsNotNone(policy.next_delay(policy.start(), True, 504))
+        # The API may have acted on a POST that timed out at the gateway
+        self.assertIsNone(policy.next_delay(policy.start(), False, 504))
+        self.assertIsNone(policy.next_delay(policy.start(), True, 400))
+
+    def test_exceptions_only_retried_when_idempotent(self):
+        policy = RetryPolicy()
+        error = requests.exceptions.ConnectionError('reset')
+        self.assertIsNotNone(policy.next_delay(policy.start(), True, exception=error))
+        self.assertIsNone(policy.next_delay(policy.start(), False, exception=error))
+        self.assertIsNone(policy.next_delay(policy.start(), True, exception=ValueError('bad')))
+
+    def test_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+        state = policy.start()
+        delays = [policy.next_delay(state, True, 503) for _ in range(3)]
+        self.assertEqual([delay is not None for delay in delays], [True, True, False])
+
+    def test_decorrelated_jitter_bounds(self):
+        policy = RetryPolicy(max_attempts=100, base_delay=0.1, max_delay=2)
+        state = policy.start()
+        previous = 0.1
+        for _ in range(50):
+            delay = policy.next_delay(state, True, 503)
+            self.assertGreaterEqual(delay, 0.1)
+            self.assertLessEqual(delay, min(2, previous * 3))
+            previous = delay
+
+    def test_retry_after_and_total_timeout(self):
+        policy = RetryPolicy(total_timeout=5)
+        self.assertEqual(policy.next_delay(policy.start(), False, 429, retry_after=2), 2)
+        self.assertIsNone(policy.next_delay(policy.start(), False, 429, retry_after=10))
+
+    def test_long_retry_after_is_not_waited_for(self):
+        policy = RetryPolicy(max_delay=5)
+        self.assertEqual(policy.next_delay(policy.start(), False, 429, retry_after=30), 30)
+        self.assertIsNone(policy.next_delay(policy.start(), False, status_code=429, retry_after=86400))
+        policy = RetryPolicy(max_retry_after=86400)
+        self.assertEqual(policy.next_delay(policy.start(), False, status_code=429, retry_after=86400), 86400)
+
+    def test_budget_caps_retries(self):
+        budget = RetryBudget(0.5, min_per_second=0, max_tokens=2)
+        policy = RetryPolicy(max_attempts=10, budget=budget)
+        allowed = 0
+        for _ in range(10):
+            if policy.next_delay(policy.start(), True, 503) is not None:
+                allowed += 1
+        # 2 saved-up tokens, then one retry per two requests
+        self.assertEqual(allowed, 2 + 4)
+
+
+class TestClientRetries(unittest.TestCase):
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_get_retries_connection_errors(self, mock_get, mock_sleep):
+        mock_get.side_effect = [
+            requests.exceptions.ConnectionError('reset'),
+            make_response({'success': True}, 503, {'Retry-After': '1'}),
+            make_response({'success': True}),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        response = app._get_request(f'{API_URL}/v1/crawl/abc', {})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_args_list[-1].args, (1.0,))
+
+    @patch('time.sleep')
+    @patch('requests.Session.post')
+    def test_post_is_not_retried_on_connection_errors(self, mock_post, mock_sleep):
+        mock_post.side_effect = requests.exceptions.ConnectionError('reset')
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            app._post_request(f'{API_URL}/v1/crawl', {}, {})
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('time.sleep')
+    @patch('requests.Session.post')
+    def test_scrape_retries_rate_limits(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            make_response({'success': False, 'error': 'Rate limit exceeded'}, 429, {'Retry-After': '2'}),
+            make_response({'success': True, 'data': {'markdown': 'ok'}}),
+        ]
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        self.assertEqual(app.scrape_url('https://example.com').markdown, 'ok')
+        mock_sleep.assert_called_once_with(2.0)
+
+
+class TestAsyncClientRetries(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hits = 0
+
+        async def status(request):
+            self.hits += 1
+            if self.hits == 1:
+                return web.json_response({'error': 'busy'}, status=503, headers={'Retry-After': '0'})
+            return web.json_response({'success': True, 'status': 'completed'})
+
+        self.runner, self.api_url = await start_api_server([web.get('/v1/crawl/{id}', status)])
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_retries_with_retry_after(self):
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url) as app:
+            start = time.monotonic()
+            status = await app._async_get_request(f'{self.api_url}/v1/crawl/abc', {})
+        self.assertEqual(status['status'], 'completed')
+        self.assertEqual(self.hits, 2)
+        self.assertLess(time.monotonic() - start, 1)
+
+    async def test_gives_up_with_the_error(self):
+        policy = RetryPolicy(max_attempts=1)
+        async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=self.api_url, retry_policy=policy) as app:
+            with self.assertRaises(Exception):
+                await app._async_get_request(f'{self.api_url}/v1/crawl/abc', {})
+        self.assertEqual(self.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+from firecrawl.firecrawl import ScrapeResponse, _DomainRoundRobin
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+
+class TestScrapeMany(unittest.TestCase):
+    def setUp(self):
+        self.urls = [f'https://example.com/{i}' for i in range(6)]
+        self.delays = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self.timeouts = {}
+
+    def serve(self, url, headers=None, json=None, timeout=None):
+        with self.lock:
+            self.timeouts[json['url']] = timeout
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(json['url'], 0.01))
+            if json['url'].endswith('/3'):
+                return make_response({'success': False, 'error': 'blocked'})
+            return make_response({'success': True, 'data': {'markdown': json['url']}})
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def scrape_many(self, **kwargs):
+        with patch('requests.Session.post') as mock_post:
+            mock_post.side_effect = self.serve
+            app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+            return list(app.scrape_many(self.urls, **kwargs))
+
+    def test_ordered_results_with_captured_errors(self):
+        self.delays[self.urls[0]] = 0.1
+        results = self.scrape_many(ordered=True, max_workers=3)
+
+        self.assertEqual([result.index for result in results], list(range(6)))
+        self.assertEqual([result.success for result in results], [True, True, True, False, True, True])
+        self.assertIn('blocked', results[3].error)
+        self.assertEqual(results[0].data.markdown, self.urls[0])
+        self.assertLessEqual(self.max_active, 3)
+
+    def test_unordered_yields_as_completed(self):
+        self.delays[self.urls[0]] = 0.2
+        results = self.scrape_many(max_workers=6)
+
+        self.assertEqual(results[-1].index, 0)
+        self.assertEqual(sorted(result.index for result in results), list(range(6)))
+
+    def test_deadline_fails_remaining_urls(self):
+        self.delays[self.urls[4]] = 1
+        self.delays[self.urls[5]] = 1
+        start = time.monotonic()
+        results = self.scrape_many(max_workers=6, deadline=0.3)
+
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(len(results), 6)
+        expired = sorted(result.index for result in results if result.error and 'Deadline' in result.error)
+        self.assertEqual(expired, [4, 5])
+
+    def test_ordered_deadline(self):
+        self.delays[self.urls[1]] = 1
+        results = self.scrape_many(ordered=True, max_workers=2, deadline=0.3)
+
+        self.assertEqual([result.index for result in results], list(range(6)))
+        self.assertFalse(results[1].success)
+        self.assertTrue(results[0].success)
+
+    def test_deadline_bounds_scrapes_in_flight(self):
+        self.delays[self.urls[0]] = 1
+        self.scrape_many(max_workers=6, deadline=0.3)
+
+        connect_timeout, read_timeout = self.timeouts[self.urls[0]]
+        self.assertLessEqual(connect_timeout, 0.3)
+        self.assertLessEqual(read_timeout, 0.3)
+
+
+class TestDomainRoundRobin(unittest.TestCase):
+    def test_takes_turns_and_respects_cap(self):
+        queue = _DomainRoundRobin(['a.com/1', 'a.com/2', 'a.com/3', 'https://b.com/1', 'http://B.com/2', 'c.com'], max_per_domain=1)
+        taken = [queue.next() for _ in range(4)]
+
+        self.assertEqual(taken[:3], [(0, 'a.com/1'), (3, 'https://b.com/1'), (5, 'c.com')])
+        # a.com and b.com are at their cap
+        self.assertIsNone(taken[3])
+        queue.release('a.com/1')
+        self.assertEqual(queue.next(), (1, 'a.com/2'))
+        self.assertEqual(queue.drain(), [(2, 'a.com/3'), (4, 'http://B.com/2')])
+        self.assertIsNone(queue.next())
+
+
+class TestAsyncScrapeMany(unittest.TestCase):
+    def setUp(self):
+        self.active = Counter()
+        self.max_active = Counter()
+        self.max_total = 0
+        self.finished = []
+        self.delays = {}
+
+    async def scrape_url(self, url, **kwargs):
+        domain = url.split('/')[2]
+        self.active[domain] += 1
+        self.max_active[domain] = max(self.max_active[domain], self.active[domain])
+        self.max_total = max(self.max_total, sum(self.active.values()))
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.01))
+            if url.endswith('/broken'):
+                raise Exception('blocked')
+            return ScrapeResponse(markdown=url)
+        finally:
+            self.active[domain] -= 1
+            self.finished.append(url)
+
+    def scrape_many(self, urls, **kwargs):
+        async def run():
+            app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+            with patch.object(app, 'scrape_url', side_effect=self.scrape_url):
+                return [result async for result in app.scrape_many(urls, **kwargs)]
+        return asyncio.run(run())
+
+    def test_hot_domain_does_not_starve_others(self):
+        hot = [f'https://hot.com/{i}' for i in range(20)]
+        cold = ['https://a.com/1', 'https://b.com/1', 'https://c.com/broken']
+        results = self.scrape_many(hot + cold, max_concurrency=4, max_per_domain=2)
+
+        self.assertEqual(len(results), 23)
+        self.assertLessEqual(self.max_total, 4)
+        self.assertEqual(self.max_active['hot.com'], 2)
+        # Every other domain gets its turn long before the hot domain is done
+        self.assertLess(max(self.finished.index(url) for url in cold), 8)
+        broken = next(result for result in results if result.url.endswith('/broken'))
+        self.assertFalse(broken.success)
+        self.assertIn('blocked', broken.error)
+
+    def test_deadline_cancels_remaining(self):
+        urls = ['https://a.com/fast', 'https://b.com/slow', 'https://b.com/queued']
+        self.delays['https://b.com/slow'] = 5
+        start = time.monotonic()
+        results = self.scrape_many(urls, max_per_domain=1, deadline=0.2)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual([result.success for result in sorted(results, key=lambda result: result.index)], [True, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
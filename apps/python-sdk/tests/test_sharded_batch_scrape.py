@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch, AsyncMock
+
+import requests
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, FixedPolling, IdempotencyConflictError, RetryPolicy
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+
+class FakeBatchApi:
+    """
+    Serves batch scrape jobs that finish after one running poll and return
+    their documents in reverse order, like pages finishing out of order.
+    """
+    def __init__(self, fail_first_attempt_of=()):
+        self.jobs = {}
+        self.submissions = []
+        self.fail_first_attempt_of = set(fail_first_attempt_of)
+        self.lock = threading.Lock()
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        with self.lock:
+            id = f'job{len(self.submissions)}'
+            self.submissions.append(json['urls'])
+            failed = json['urls'][0] in self.fail_first_attempt_of
+            self.fail_first_attempt_of.discard(json['urls'][0])
+            self.jobs[id] = {'urls': json['urls'], 'polls': 0, 'failed': failed}
+        return {'success': True, 'id': id, 'url': f'{API_URL}/v1/batch/scrape/{id}'}
+
+    def get(self, url, headers=None, timeout=None):
+        id = url.split('/v1/batch/scrape/')[1].split('?')[0]
+        with self.lock:
+            job = self.jobs[id]
+            job['polls'] += 1
+            polls = job['polls']
+        total = len(job['urls'])
+        status = {
+            'success': True,
+            'total': total,
+            'creditsUsed': total,
+            'expiresAt': '2030-01-01T00:00:00Z',
+            'data': [],
+        }
+        if polls == 1:
+            return {**status, 'status': 'scraping', 'completed': 0}
+        if job['failed']:
+            return {**status, 'status': 'failed', 'completed': 0}
+        documents = [{'markdown': url, 'metadata': {'sourceURL': url}} for url in reversed(job['urls'])]
+        return {**status, 'status': 'completed', 'completed': total, 'data': documents}
+
+
+class TestShardedBatchScrape(unittest.TestCase):
+    def setUp(self):
+        self.urls = [f'https://example.com/{i}' for i in range(10)]
+
+    def run_sharded(self, api, **kwargs):
+        with patch('requests.Session.post') as mock_post, patch('requests.Session.get') as mock_get:
+            mock_post.side_effect = lambda url, **kw: make_response(api.post(url, **kw))
+            mock_get.side_effect = lambda url, **kw: make_response(api.get(url, **kw))
+            app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+            return list(app.batch_scrape_urls_sharded(self.urls, poll_interval=FixedPolling(0.01), **kwargs))
+
+    def test_ordered_across_and_within_chunks(self):
+        api = FakeBatchApi()
+        progress = []
+        documents = self.run_sharded(api, chunk_size=3, max_in_flight_chunks=2, on_progress=progress.append)
+
+        self.assertEqual([doc.markdown for doc in documents], self.urls)
+        self.assertEqual([len(urls) for urls in api.submissions], [3, 3, 3, 1])
+        final = progress[-1]
+        self.assertEqual(final.totalChunks, 4)
+        self.assertEqual(final.completedChunks, 4)
+        self.assertEqual(final.completed, 10)
+        self.assertEqual(final.creditsUsed, 10)
+
+    def test_unordered_yields_every_document(self):
+        documents = self.run_sharded(FakeBatchApi(), chunk_size=4, ordered=False)
+        self.assertEqual(sorted(doc.markdown for doc in documents), sorted(self.urls))
+
+    def test_failed_chunk_is_resubmitted(self):
+        api = FakeBatchApi(fail_first_attempt_of=[self.urls[3]])
+        progress = []
+        documents = self.run_sharded(api, chunk_size=3, on_progress=progress.append)
+
+        self.assertEqual([doc.markdown for doc in documents], self.urls)
+        self.assertEqual(len(api.submissions), 5)
+        self.assertEqual(progress[-1].retriedChunks, 1)
+        # Credits of the failed attempt are kept in the total
+        self.assertEqual(progress[-1].creditsUsed, 13)
+
+    def test_gives_up_after_chunk_retries(self):
+        api = FakeBatchApi(fail_first_attempt_of=[self.urls[0]])
+        with self.assertRaises(Exception) as error:
+            self.run_sharded(api, chunk_size=5, chunk_retries=0)
+        self.assertIn('failed', str(error.exception))
+
+    def test_lost_submission_is_not_started_again(self):
+        api = FakeBatchApi()
+        keys = []
+
+        def post(url, headers=None, **kwargs):
+            key = headers['x-idempotency-key']
+            if key in keys:
+                return make_response({'success': False, 'error': 'Idempotency key already used'}, 409)
+            keys.append(key)
+            api.post(url, headers=headers, **kwargs)
+            # The job is created, but its response never arrives
+            raise requests.exceptions.ConnectionError('reset')
+
+        with patch('requests.Session.post', side_effect=post):
+            app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, retry_policy=RetryPolicy(max_attempts=1))
+            with self.assertRaises(IdempotencyConflictError):
+                list(app.batch_scrape_urls_sharded(self.urls, chunk_size=5, poll_interval=FixedPolling(0.01)))
+        self.assertEqual(len(api.submissions), 1)
+        self.assertEqual(len(keys), 1)
+
+    def test_rejects_shared_idempotency_key(self):
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        with self.assertRaises(ValueError):
+            list(app.batch_scrape_urls_sharded(self.urls, idempotency_key='key'))
+
+
+class TestAsyncShardedBatchScrape(unittest.TestCase):
+    def test_ordered_with_retry(self):
+        urls = [f'https://example.com/{i}' for i in range(7)]
+        api = FakeBatchApi(fail_first_attempt_of=[urls[0]])
+
+        async def run():
+            app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+            with patch.object(app, '_async_post_request', AsyncMock(side_effect=lambda url, data, headers: api.post(url, json=data))), \
+                    patch.object(app, '_async_get_request', AsyncMock(side_effect=lambda url, headers: api.get(url))):
+                return [doc async for doc in app.batch_scrape_urls_sharded(
+                    urls, chunk_size=3, poll_interval=FixedPolling(0.01))]
+
+        documents = asyncio.run(run())
+        self.assertEqual([doc.markdown for doc in documents], urls)
+        self.assertEqual(len(api.submissions), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import json
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, Transport, HTTPXTransport
+from firecrawl.firecrawl import _deadline_scope
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+API_URL = 'http://localhost:3002'
+
+
+class RecordingTransport(Transport):
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, *, headers, json=None, timeout=None):
+        self.calls.append((method, url, timeout))
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.json.return_value = {'success': True, 'data': {'markdown': 'ok'}}
+        return response
+
+    @contextlib.asynccontextmanager
+    async def async_request(self, method, url, *, headers, json=None, timeout=None):
+        self.calls.append((method, url, timeout))
+        response = MagicMock()
+        response.status = 200
+        response.headers = {}
+
+        async def read_json(**kwargs):
+            return {'success': True, 'data': {'markdown': 'ok'}}
+        response.json = read_json
+        yield response
+
+
+class TestCustomTransport(unittest.TestCase):
+    def test_transport_must_send_requests(self):
+        class SyncOnlyTransport(Transport):
+            def request(self, method, url, *, headers, json=None, timeout=None):
+                pass
+
+        with self.assertRaises(TypeError):
+            SyncOnlyTransport()
+
+    def test_sync_requests_use_the_transport(self):
+        transport = RecordingTransport()
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, transport=transport)
+
+        self.assertEqual(app.scrape_url('https://example.com', timeout=20000).markdown, 'ok')
+
+        self.assertEqual(transport.calls, [('POST', f'{API_URL}/v1/scrape', (10, 25.0))])
+        self.assertIsNone(app._session)
+
+    def test_async_requests_use_the_transport(self):
+        transport = RecordingTransport()
+
+        async def run():
+            async with AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL, transport=transport) as app:
+                response = await app.scrape_url('https://example.com')
+                self.assertIsNone(app._async_session)
+                return response
+
+        self.assertEqual(asyncio.run(run()).markdown, 'ok')
+        self.assertEqual(transport.calls[0][:2], ('POST', f'{API_URL}/v1/scrape'))
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestHTTPXTransport(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+        self.failures = 0
+
+    def handle(self, request):
+        self.requests.append(request)
+        if self.failures:
+            self.failures -= 1
+            raise httpx.ConnectError('connection refused', request=request)
+        if request.method == 'POST':
+            return httpx.Response(200, json={'success': True, 'data': {'markdown': json.loads(request.content)['url']}})
+        return httpx.Response(503, json={'error': 'busy'}, headers={'Retry-After': '0'})
+
+    def transport(self):
+        return HTTPXTransport(transport=httpx.MockTransport(self.handle))
+
+    def test_sync_scrape(self):
+        with self.transport() as transport:
+            app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, transport=transport)
+            self.assertEqual(app.scrape_url('https://example.com').markdown, 'https://example.com')
+        self.assertEqual(self.requests[0].headers['Authorization'], 'Bearer dummy-api-key')
+
+    def test_errors_map_to_requests_exceptions(self):
+        self.failures = 1
+        with self.transport() as transport:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                transport.request('GET', f'{API_URL}/v1/crawl/abc', headers={})
+
+    def test_stalled_response_is_cut_at_the_deadline(self):
+        cancelled = []
+
+        async def stall(request):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+
+        with HTTPXTransport(transport=httpx.MockTransport(stall)) as transport:
+            start = time.monotonic()
+            with self.assertRaises(requests.exceptions.Timeout):
+                with _deadline_scope(0.2):
+                    transport.request('GET', f'{API_URL}/v1/crawl/abc', headers={}, timeout=(10, None))
+            self.assertLess(time.monotonic() - start, 2)
+            time.sleep(0.1)
+        self.assertEqual(len(cancelled), 1)
+
+    def test_async_scrape_and_retries(self):
+        self.failures = 1
+
+        async def run():
+            async with self.transport() as transport:
+                app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL, transport=transport)
+                # A GET is retried after the connection error and the 503
+                with self.assertRaises(Exception):
+                    await app._async_get_request(f'{API_URL}/v1/crawl/abc', {})
+                return await app.scrape_url('https://example.com')
+
+        self.assertEqual(asyncio.run(run()).markdown, 'https://example.com')
+        self.assertEqual([request.method for request in self.requests], ['GET', 'GET', 'GET', 'POST'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import patch
+
+import pydantic
+
+from firecrawl import FirecrawlApp
+from firecrawl.firecrawl import ActionsResult, ChangeTrackingData, FirecrawlDocument
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+DOCUMENT = {
+    'markdown': '# Example',
+    'links': ['https://example.com/a'],
+    'metadata': {'sourceURL': 'https://example.com', 'statusCode': 200},
+    'actions': {'screenshots': ['https://example.com/shot.png'], 'pdfs': []},
+    'changeTracking': {'changeStatus': 'same', 'visibility': 'visible'},
+    'unknownField': 'ignored',
+}
+
+
+def status_page(documents):
+    return {
+        'success': True, 'status': 'completed', 'completed': len(documents), 'total': len(documents),
+        'creditsUsed': len(documents), 'expiresAt': '2025-01-01T00:00:00Z', 'data': documents}
+
+
+class TestTrustedResponses(unittest.TestCase):
+    @patch('requests.Session.get')
+    def test_documents_are_built_without_validation(self, mock_get):
+        mock_get.return_value = make_response(status_page([dict(DOCUMENT)]))
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, validate_responses=False)
+
+        response = app.check_crawl_status('abc')
+
+        document = response.data[0]
+        self.assertIsInstance(document, FirecrawlDocument)
+        self.assertEqual(document.markdown, '# Example')
+        self.assertEqual(response.expiresAt.year, 2025)
+        self.assertFalse(hasattr(document, 'unknownField'))
+        # Nested models are validated when first read
+        self.assertIsInstance(document.__dict__['actions'], dict)
+        self.assertIsInstance(document.actions, ActionsResult)
+        self.assertIsInstance(document.__dict__['actions'], ActionsResult)
+        self.assertIsInstance(document.changeTracking, ChangeTrackingData)
+
+    @patch('requests.Session.get')
+    def test_documents_match_validated_documents(self, mock_get):
+        mock_get.side_effect = lambda *args, **kwargs: make_response(status_page([dict(DOCUMENT)]))
+        validated = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL).check_crawl_status('abc').data[0]
+        trusted = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, validate_responses=False).check_crawl_status('abc').data[0]
+
+        self.assertEqual(trusted.model_dump(), validated.model_dump())
+        self.assertEqual(trusted.model_dump_json(), validated.model_dump_json())
+        self.assertEqual(trusted.model_fields_set, validated.model_fields_set)
+        self.assertTrue(trusted == validated)
+        self.assertTrue(validated == trusted)
+        self.assertFalse(trusted != validated)
+        validated.markdown = '# Changed'
+        self.assertNotEqual(trusted, validated)
+        self.assertNotEqual(validated, trusted)
+
+    @patch('requests.Session.get')
+    def test_invalid_nested_model_raises_on_access(self, mock_get):
+        mock_get.return_value = make_response({'success': True, 'status': 'scraping', 'data': [{'actions': {'screenshots': 'none'}}]})
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL, validate_responses=False)
+
+        document = next(app.iter_crawl_documents('abc'))
+
+        with self.assertRaises(pydantic.ValidationError):
+            document.actions
+
+    @patch('requests.Session.get')
+    def test_responses_are_validated_by_default(self, mock_get):
+        mock_get.return_value = make_response(status_page([dict(DOCUMENT)]))
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        document = app.check_crawl_status('abc').data[0]
+
+        self.assertIs(type(document), FirecrawlDocument)
+        self.assertIsInstance(document.__dict__['actions'], ActionsResult)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import patch, AsyncMock
+
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, WebhookReceiver
+
+from helpers import make_response
+
+API_URL = 'http://localhost:3002'
+
+
+def post_event(url, payload, headers=None):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={'Content-Type': 'application/json', **(headers or {})},
+        method='POST',
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.status
+
+
+def page_event(id, markdown, kind='crawl'):
+    return {'success': True, 'type': f'{kind}.page', 'id': id, 'data': [{'markdown': markdown}]}
+
+
+def completed_status(*markdowns):
+    return {
+        'success': True, 'status': 'completed', 'completed': len(markdowns), 'total': len(markdowns), 'creditsUsed': len(markdowns),
+        'expiresAt': '2030-01-01T00:00:00Z',
+        'data': [{'markdown': markdown, 'metadata': {'sourceURL': f'https://example.com/{markdown}'}} for markdown in markdowns],
+    }
+
+
+class TestWebhookReceiver(unittest.TestCase):
+    def setUp(self):
+        self.receiver = WebhookReceiver(secret='s3cret')
+        self.receiver.start()
+        self.headers = {'X-Firecrawl-Webhook-Secret': 's3cret'}
+
+    def tearDown(self):
+        self.receiver.close()
+
+    def test_streams_documents_and_resolves_completion(self):
+        post_event(self.receiver.url, {'success': True, 'type': 'crawl.started', 'id': 'abc', 'data': []}, self.headers)
+        post_event(self.receiver.url, page_event('abc', 'one'), self.headers)
+        post_event(self.receiver.url, page_event('abc', 'two'), self.headers)
+        post_event(self.receiver.url, {'success': True, 'type': 'crawl.completed', 'id': 'abc', 'data': []}, self.headers)
+
+        documents = list(self.receiver.iter_documents('abc', timeout=5))
+
+        self.assertEqual([doc.markdown for doc in documents], ['one', 'two'])
+        self.assertEqual(self.receiver.completion('abc').result(timeout=5)['type'], 'crawl.completed')
+
+    def test_failed_event_raises(self):
+        post_event(self.receiver.url, {'success': False, 'type': 'crawl.failed', 'id': 'abc', 'error': 'boom'}, self.headers)
+
+        with self.assertRaises(Exception) as error:
+            self.receiver.completion('abc').result(timeout=5)
+        self.assertIn('boom', str(error.exception))
+
+    def test_rejects_missing_secret(self):
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            post_event(self.receiver.url, page_event('abc', 'one'))
+        self.assertEqual(error.exception.code, 401)
+        self.assertTrue(self.receiver.documents('abc').empty())
+
+    def test_rejects_malformed_event(self):
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            post_event(self.receiver.url, {'type': 'unknown'}, self.headers)
+        self.assertEqual(error.exception.code, 400)
+
+    def test_webhook_config(self):
+        config = self.receiver.webhook_config(events=['page', 'completed'])
+        self.assertEqual(config.url, f'http://127.0.0.1:{self.receiver.port}/webhook')
+        self.assertEqual(config.headers, self.headers)
+        self.assertEqual(config.events, ['page', 'completed'])
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_crawl_url_completes_from_webhook(self, mock_post, mock_get):
+        def start_crawl(url, headers=None, json=None, timeout=None):
+            self.assertEqual(json['webhook']['url'], self.receiver.url)
+
+            def send_events():
+                post_event(self.receiver.url, page_event('abc', 'one'), self.headers)
+                post_event(self.receiver.url, {'success': True, 'type': 'crawl.completed', 'id': 'abc', 'data': []}, self.headers)
+
+            threading.Thread(target=send_events).start()
+            return make_response({'success': True, 'id': 'abc'})
+
+        mock_post.side_effect = start_crawl
+        mock_get.return_value = make_response({
+            'success': True, 'status': 'completed', 'completed': 1, 'total': 1, 'creditsUsed': 1,
+            'expiresAt': '2030-01-01T00:00:00Z', 'data': [{'markdown': 'one'}],
+        })
+        received = []
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        result = app.crawl_url('https://example.com', webhook_receiver=self.receiver, on_document=lambda doc: received.append(doc.markdown))
+
+        self.assertEqual(received, ['one'])
+        self.assertEqual(result.status, 'completed')
+        # Only the final results are fetched, the job is never polled
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_crawl_url_polls_when_no_event_arrives(self, mock_post, mock_get):
+        def start_crawl(url, headers=None, json=None, timeout=None):
+            event = completed_status('one')
+            event.update(type='crawl.page', id='abc')
+            post_event(self.receiver.url, event, self.headers)
+            return make_response({'success': True, 'id': 'abc'})
+
+        self.receiver.event_timeout = 0.2
+        mock_post.side_effect = start_crawl
+        mock_get.return_value = make_response(completed_status('one', 'two'))
+        received = []
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with self.assertLogs('firecrawl', 'WARNING'):
+            result = app.crawl_url('https://example.com', webhook_receiver=self.receiver, on_document=lambda doc: received.append(doc.markdown))
+
+        self.assertEqual(received, ['one', 'two'])
+        self.assertEqual([doc.markdown for doc in result.data], ['one', 'two'])
+
+    def test_async_crawl_url_polls_when_no_event_arrives(self):
+        self.receiver.event_timeout = 0.2
+        app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        with patch.object(app, '_async_post_request', AsyncMock(return_value={'success': True, 'id': 'abc'})), \
+                patch.object(app, '_async_get_request', AsyncMock(return_value=completed_status('one'))):
+            result = asyncio.run(app.crawl_url('https://example.com', webhook_receiver=self.receiver))
+        self.assertEqual(result.data[0].markdown, 'one')
+
+    def test_async_crawl_url_completes_from_webhook(self):
+        async def start_crawl(*args, **kwargs):
+            threading.Thread(target=post_event, args=(self.receiver.url, {'success': True, 'type': 'crawl.completed', 'id': 'abc'}, self.headers)).start()
+            return {'success': True, 'id': 'abc'}
+
+        app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        with patch.object(app, '_async_post_request', AsyncMock(side_effect=start_crawl)), \
+                patch.object(app, '_async_get_request', AsyncMock(return_value=completed_status('one'))) as mock_get:
+            result = asyncio.run(app.crawl_url('https://example.com', webhook_receiver=self.receiver))
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_cancelled_async_wait_does_not_block_a_thread(self):
+        self.receiver.event_timeout = None
+        app = AsyncFirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+        start = time.monotonic()
+        with patch.object(app, '_async_post_request', AsyncMock(return_value={'success': True, 'id': 'abc'})):
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(asyncio.wait_for(app.crawl_url('https://example.com', webhook_receiver=self.receiver, deadline=30), 0.2))
+        self.assertLess(time.monotonic() - start, 5)
+
+    @patch('requests.Session.post')
+    def test_waiting_without_event_timeout_requires_a_deadline(self, mock_post):
+        self.receiver.event_timeout = None
+        app = FirecrawlApp(api_key='dummy-api-key', api_url=API_URL)
+
+        with self.assertRaises(ValueError):
+            app.crawl_url('https://example.com', webhook_receiver=self.receiver)
+        mock_post.assert_not_called()
+
+    def test_events_of_forgotten_jobs_are_ignored(self):
+        self.receiver.documents('abc')
+        self.receiver.forget('abc')
+
+        self.assertEqual(post_event(self.receiver.url, page_event('abc', 'late'), self.headers), 200)
+
+        self.assertNotIn('abc', self.receiver._jobs)